@@ -1,18 +1,25 @@
+import hmac
 import logging
 
 import aiohttp_cors
 from aiohttp import web
-from ariadne import graphql
-from ariadne.constants import PLAYGROUND_HTML
+from ariadne.explorer import ExplorerPlayground
 
 from . import settings
 from .bot import bot
 from .database import store
+from .graphql.middleware import middleware
+from .graphql.persisted import execute_graphql, is_persisted_query_not_found
 from .graphql.schema import schema
+from .utils import metrics
 from .utils.extensions import walk_extensions
+from .utils.loop_monitor import loop_monitor
+from .utils.supervisor import supervisor
 
 logger = logging.getLogger(__name__)
 
+PLAYGROUND_HTML = ExplorerPlayground().html(None)
+
 # Assign app to bot so that extensions can add routes
 bot.app = app = web.Application()  # type: ignore
 
@@ -39,15 +46,32 @@ def graphql_playground(_):
 async def graphql_server(request):
     data = await request.json()
 
-    success, result = await graphql(
-        schema, data, context_value=request, debug=settings.DEBUG
+    success, result = await execute_graphql(
+        schema,
+        data,
+        context_value=request,
+        debug=settings.DEBUG,
+        middleware=middleware,
     )
 
-    status = 200 if success else 400
+    status = 200 if success or is_persisted_query_not_found(result) else 400
     return web.json_response(result, status=status)
 
 
-app.add_routes([web.get("/ping", ping)])
+async def metrics_handler(request: web.Request):
+    # Metrics are only served to scrapers that send the configured token
+    if not settings.METRICS_TOKEN:
+        return web.Response(body="", status=404)
+    authorization = request.headers.get("Authorization", "")
+    expected = f"Bearer {settings.METRICS_TOKEN}"
+    if not hmac.compare_digest(authorization.encode(), expected.encode()):
+        return web.Response(body="", status=401, headers={"WWW-Authenticate": "Bearer"})
+    return web.Response(
+        body=metrics.render().encode(), headers={"Content-Type": metrics.CONTENT_TYPE}
+    )
+
+
+app.add_routes([web.get("/ping", ping), web.get("/metrics", metrics_handler)])
 resource = bot.app.router.add_resource("/graphql")  # type: ignore
 cors.add(resource.add_route("POST", graphql_server))
 
@@ -63,11 +87,15 @@ async def on_startup(app: web.Application):
     for ext in walk_extensions():
         bot.load_extension(ext)
     await store.connect()
+    loop_monitor.start()
     app["bot_task"] = bot.loop.create_task(start_bot())
     app["bot"] = bot
 
 
 async def on_shutdown(app):
+    # Drain before closing the bot so that in-flight tasks can still use it
+    await supervisor.drain()
+    loop_monitor.stop()
     app["bot_task"].cancel()
     await app["bot_task"]
     await store.disconnect()
@@ -1,12 +1,18 @@
+from __future__ import annotations
+
 import asyncio
 import itertools
 import logging
+import time
 
 import disnake
-from disnake import ApplicationCommandInteraction
+from disnake import ApplicationCommandInteraction, OptionType
 from disnake.ext import commands
 
 from . import settings
+from .utils.message_cache import message_cache
+from .utils.metrics import command_duration
+from .utils.reactions import reaction_dispatcher
 
 logger = logging.getLogger(__name__)
 
@@ -70,8 +76,97 @@ async def cycle_presence():
 #         bot.loop.create_task(cycle_presence())
 
 
+# Start times of commands that are in progress, keyed by message or interaction ID
+_command_start_times: dict[int, float] = {}
+# Guard against leaking start times for commands whose error events are suppressed
+MAX_COMMANDS_IN_PROGRESS = 1000
+
+
+def _start_command_timer(id: int):
+    if len(_command_start_times) >= MAX_COMMANDS_IN_PROGRESS:
+        _command_start_times.pop(next(iter(_command_start_times)))
+    _command_start_times[id] = time.perf_counter()
+
+
+def _observe_command_duration(id: int, *, type: str, command: str, status: str):
+    start = _command_start_times.pop(id, None)
+    if start is not None:
+        command_duration.labels(type, command, status).observe(
+            time.perf_counter() - start
+        )
+
+
+def get_slash_command_name(inter: ApplicationCommandInteraction) -> str:
+    """Return the full name of the invoked slash command, including subcommands."""
+    names = [inter.data.name]
+    options = inter.data.options
+    while options and options[0].type in (
+        OptionType.sub_command,
+        OptionType.sub_command_group,
+    ):
+        names.append(options[0].name)
+        options = options[0].options
+    return " ".join(names)
+
+
+@bot.listen()
+async def on_command(ctx):
+    _start_command_timer(ctx.message.id)
+
+
+@bot.listen()
+async def on_command_completion(ctx):
+    _observe_command_duration(
+        ctx.message.id, type="prefix", command=ctx.command.qualified_name, status="ok"
+    )
+
+
+@bot.listen()
+async def on_slash_command(inter: ApplicationCommandInteraction):
+    _start_command_timer(inter.id)
+
+
+@bot.listen()
+async def on_slash_command_completion(inter: ApplicationCommandInteraction):
+    _observe_command_duration(
+        inter.id, type="slash", command=get_slash_command_name(inter), status="ok"
+    )
+
+
+# Keep the shared message cache in sync
+
+
+@bot.listen()
+async def on_raw_message_edit(payload: disnake.RawMessageUpdateEvent):
+    message_cache.invalidate(payload.message_id)
+
+
+@bot.listen()
+async def on_raw_message_delete(payload: disnake.RawMessageDeleteEvent):
+    message_cache.invalidate(payload.message_id)
+
+
+@bot.listen()
+async def on_raw_bulk_message_delete(payload: disnake.RawBulkMessageDeleteEvent):
+    for message_id in payload.message_ids:
+        message_cache.invalidate(message_id)
+
+
+@bot.listen("on_raw_reaction_add")
+@bot.listen("on_raw_reaction_remove")
+async def dispatch_reaction(payload: disnake.RawReactionActionEvent):
+    await reaction_dispatcher.dispatch(bot, payload)
+
+
 @bot.event
 async def on_command_error(ctx, error):
+    if ctx.command is not None:
+        _observe_command_duration(
+            ctx.message.id,
+            type="prefix",
+            command=ctx.command.qualified_name,
+            status="error",
+        )
     if isinstance(
         error,
         (commands.errors.CheckFailure, commands.errors.BadArgument),
@@ -83,6 +178,9 @@ async def on_command_error(ctx, error):
 
 @bot.event
 async def on_slash_command_error(inter: ApplicationCommandInteraction, error: Exception):
+    _observe_command_duration(
+        inter.id, type="slash", command=get_slash_command_name(inter), status="error"
+    )
     if isinstance(
         error,
         (commands.errors.CheckFailure, commands.errors.BadArgument),
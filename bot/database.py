@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import datetime as dt
+import functools
+import inspect
 import logging
+import time
 import uuid
-from typing import Iterator, Mapping, Sequence
+from contextvars import ContextVar
+from typing import AsyncIterator, Iterator, Mapping, NamedTuple, Sequence
 
+import asyncpg
 import databases
 import nanoid
 import pytz
@@ -12,12 +19,24 @@ import sqlalchemy as sa
 from disnake import Member
 from pytz.tzinfo import StaticTzInfo
 from sqlalchemy import sql
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.dialects.postgresql import ARRAY, BIGINT
 from sqlalchemy.dialects.postgresql import TIMESTAMP as _TIMESTAMP
 from sqlalchemy.dialects.postgresql import UUID, insert
 from sqlalchemy.sql.schema import ForeignKey
 
 from . import settings
+from .utils.metrics import (
+    db_pool_acquire_duration,
+    db_pool_acquire_timeouts,
+    db_pool_in_use,
+    db_pool_size,
+    db_pool_waiting,
+    db_query_duration,
+    db_query_rows,
+    db_slow_queries,
+)
+from .utils.query_stats import MethodStats, get_method_stats
 
 metadata = sa.MetaData()
 NULL = sql.null()
@@ -267,8 +286,15 @@ user_stars = sa.Table(
     sa.Column("star_count", sa.Integer, doc="Number of stars for the user"),
     created_at_column(),
     updated_at_column(),
+    # Leaderboard order
+    sa.Index("ix_user_stars_star_count", sa.desc("star_count"), "user_id"),
 )
 
+# Number of future months to create star_logs partitions for
+STAR_LOG_PARTITIONS_AHEAD = 3
+
+# Partitioned by month on created_at (see Store.ensure_star_log_partitions).
+#   Postgres requires the partition key to be part of the primary key.
 star_logs = sa.Table(
     "star_logs",
     metadata,
@@ -278,8 +304,75 @@ star_logs = sa.Table(
     sa.Column("message_id", BIGINT, doc="Discord message ID"),  # TODO: Remove?
     sa.Column("jump_url", sa.Text, doc="Discord jump URL for the message"),
     sa.Column("action", sa.Text, nullable=False, doc="The type of action"),
-    created_at_column(),
+    created_at_column(primary_key=True),
+    sa.Index("ix_star_logs_to_user_id_created_at", "to_user_id", "created_at"),
+    postgresql_partition_by="RANGE (created_at)",
 )
+# Catches rows that don't fall within a monthly partition
+sa.event.listen(
+    star_logs,
+    "after_create",
+    sa.DDL("CREATE TABLE star_logs_default PARTITION OF star_logs DEFAULT"),
+)
+
+
+def get_month_start(when: dt.datetime, months: int = 0) -> dt.datetime:
+    """Return the start of the UTC month `months` months after the one containing `when`."""
+    when = when.astimezone(dt.timezone.utc)
+    year, month = divmod(when.month - 1 + months, 12)
+    return dt.datetime(when.year + year, month + 1, 1, tzinfo=dt.timezone.utc)
+
+
+def get_star_log_partition_name(month: dt.datetime) -> str:
+    return f"star_logs_y{month.year:04}m{month.month:02}"
+
+
+def parse_star_log_partition_name(name: str) -> dt.datetime | None:
+    """Return the month covered by a star_logs partition, or None for the default partition."""
+    try:
+        month = dt.datetime.strptime(name, "star_logs_y%Ym%m")
+    except ValueError:
+        return None
+    return month.replace(tzinfo=dt.timezone.utc)
+
+
+def get_create_star_log_partition_statements(
+    month: dt.datetime,
+) -> list[str | sa.sql.ClauseElement]:
+    """Return statements that add the star_logs partition for `month`.
+
+    Rows for the month that were written to the default partition are moved
+    into the new partition, since Postgres refuses to attach a partition whose
+    range overlaps rows in the default partition.
+    """
+    name = _quote_identifier(get_star_log_partition_name(month))
+    start, end = month, get_month_start(month, 1)
+    # Postgres can't take bind parameters in DDL, so partition bounds are
+    #   rendered as literals
+    bounds = f"FROM ({_quote_timestamp(start)}) TO ({_quote_timestamp(end)})"
+    return [
+        f"CREATE TABLE {name} (LIKE star_logs INCLUDING DEFAULTS INCLUDING CONSTRAINTS)",
+        sa.text(
+            f"""WITH moved AS (
+                DELETE FROM star_logs_default
+                WHERE created_at >= :start AND created_at < :end
+                RETURNING *
+            )
+            INSERT INTO {name} SELECT * FROM moved"""
+        ).bindparams(start=start, end=end),
+        f"ALTER TABLE star_logs ATTACH PARTITION {name} FOR VALUES {bounds}",
+    ]
+
+
+def _quote_identifier(name: str) -> str:
+    return _dialect.identifier_preparer.quote(name)
+
+
+def _quote_timestamp(when: dt.datetime) -> str:
+    literal = sa.literal(when.isoformat(), type_=sa.Text).compile(
+        dialect=_dialect, compile_kwargs={"literal_binds": True}
+    )
+    return f"{literal}::timestamptz"
 
 
 star_rewards = sa.Table(
@@ -299,6 +392,316 @@ star_rewards = sa.Table(
 # -----------------------------------------------------------------------------
 
 
+class TopicChanges(NamedTuple):
+    added: list[str]
+    removed: list[str]
+    total: int
+
+
+# Set within Store.primary_reads() and transactions, where reads go to the primary
+_primary_reads: ContextVar[bool] = ContextVar("primary_reads", default=False)
+# Stats for the Store method that is currently executing, so that statements
+#   can be attributed to it
+_current_method: ContextVar[MethodStats | None] = ContextVar(
+    "current_method", default=None
+)
+_dialect = postgresql.dialect()
+# Renders bind parameters as :name, which databases accepts for SQL strings
+_named_dialect = postgresql.dialect(paramstyle="named")
+
+
+def _instrument(cls):
+    """Record call counts and durations for each public coroutine method of a class."""
+    for name, method in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.iscoroutinefunction(method):
+            continue
+        setattr(cls, name, _timed(method, name))
+    return cls
+
+
+def _timed(method, name: str):
+    stats = get_method_stats(name)
+    histogram = db_query_duration.labels(name)
+
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        token = _current_method.set(stats)
+        start = time.perf_counter()
+        error = False
+        try:
+            return await method(*args, **kwargs)
+        except Exception:
+            error = True
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            _current_method.reset(token)
+            histogram.observe(duration)
+            stats.record(duration, error=error)
+
+    return wrapper
+
+
+def compile_statement(statement: sa.sql.ClauseElement) -> str:
+    """Compile a statement once, for statements on hot paths.
+
+    Build the statement with sa.bindparam() placeholders for the values that change
+    between calls, then execute the returned SQL with those values. databases then
+    only parses the SQL text instead of compiling the Core expression on every call,
+    and since the SQL doesn't change, asyncpg reuses its prepared statement
+    (see DATABASE_STATEMENT_CACHE_SIZE).
+
+    Values are passed to asyncpg without SQLAlchemy's type processing, so the
+    statement's columns must have types that asyncpg handles natively.
+    """
+    return str(statement.compile(dialect=_named_dialect))
+
+
+class PoolStats(NamedTuple):
+    size: int
+    max_size: int
+    # Tasks holding a connection
+    in_use: int
+    # Tasks waiting for a connection
+    waiting: int
+
+
+class StarRank(NamedTuple):
+    rank: int
+    star_count: int
+    # (user_id, star_count) pairs in leaderboard order
+    above: list[tuple[int, int]]
+    below: list[tuple[int, int]]
+
+
+# Used when max_size isn't passed to the pool
+ASYNCPG_DEFAULT_MAX_SIZE = 10
+
+
+def get_pool_options() -> dict:
+    """Return asyncpg pool options from settings."""
+    return dict(
+        min_size=settings.DATABASE_POOL_MIN_SIZE,
+        max_size=settings.DATABASE_POOL_MAX_SIZE,
+        max_queries=settings.DATABASE_POOL_MAX_QUERIES,
+        max_inactive_connection_lifetime=settings.DATABASE_POOL_MAX_IDLE_TIME,
+        timeout=settings.DATABASE_CONNECT_TIMEOUT,
+        command_timeout=settings.DATABASE_STATEMENT_TIMEOUT,
+        statement_cache_size=settings.DATABASE_STATEMENT_CACHE_SIZE,
+        server_settings={
+            "statement_timeout": str(int(settings.DATABASE_STATEMENT_TIMEOUT * 1000))
+        },
+    )
+
+
+def compile_sql(query) -> str:
+    if isinstance(query, str):
+        return query
+    return str(query.compile(dialect=_dialect))
+
+
+class InstrumentedDatabase(databases.Database):
+    """Database that counts rows returned, logs slow statements and reports
+    connection pool stats.
+
+    Queries and transactions check out a connection with checkout(), which gives up
+    with asyncio.TimeoutError after acquire_timeout seconds when the pool is
+    exhausted. Pool stats are only tracked for Postgres.
+    """
+
+    def __init__(
+        self,
+        url: str | databases.DatabaseURL,
+        *,
+        name: str = "primary",
+        acquire_timeout: float | None = None,
+        **options,
+    ):
+        self.name = name
+        self.acquire_timeout = acquire_timeout
+        self.size = 0
+        self.in_use = 0
+        self.waiting = 0
+        self.max_size = options.get("max_size", ASYNCPG_DEFAULT_MAX_SIZE)
+        # Created on connect, so that it belongs to the running event loop
+        self._limiter: asyncio.Semaphore | None = None
+        # Whether the current task already holds a checkout. Tasks inherit this
+        #   along with the connection that databases shares with them.
+        self._holds_checkout: ContextVar[bool] = ContextVar(
+            f"holds_checkout_{name}", default=False
+        )
+        self.is_postgres = databases.DatabaseURL(str(url)).dialect.startswith("postgres")
+        if self.is_postgres:
+            options["init"] = self._on_connect
+            db_pool_size.labels(name).set_function(lambda: self.size)
+            db_pool_in_use.labels(name).set_function(lambda: self.in_use)
+            db_pool_waiting.labels(name).set_function(lambda: self.waiting)
+        super().__init__(url, **options)
+
+    async def connect(self) -> None:
+        self._limiter = asyncio.Semaphore(self.max_size)
+        await super().connect()
+
+    async def _on_connect(self, connection: asyncpg.Connection):
+        self.size += 1
+        connection.add_termination_listener(self._on_disconnect)
+
+    def _on_disconnect(self, connection: asyncpg.Connection):
+        self.size -= 1
+
+    @contextlib.asynccontextmanager
+    async def checkout(self) -> AsyncIterator[None]:
+        """Reserve a pool connection for the current task.
+
+        databases acquires a task's connection on its first statement, and
+        cancelling that acquire leaves its connection in a broken state, so the wait
+        for a free connection is bounded here instead, by a semaphore with one slot
+        per pool connection. Nested checkouts in the same task share its slot.
+        """
+        if self._limiter is None or self._holds_checkout.get():
+            yield
+            return
+        self.waiting += 1
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._limiter.acquire(), self.acquire_timeout)
+        except asyncio.TimeoutError:
+            db_pool_acquire_timeouts.labels(self.name).inc()
+            raise
+        finally:
+            self.waiting -= 1
+            db_pool_acquire_duration.labels(self.name).observe(
+                time.perf_counter() - start
+            )
+        self.in_use += 1
+        token = self._holds_checkout.set(True)
+        try:
+            yield
+        finally:
+            self._holds_checkout.reset(token)
+            self.in_use -= 1
+            self._limiter.release()
+
+    def _record(self, query, start: float, rows: int):
+        duration = time.perf_counter() - start
+        stats = _current_method.get()
+        method = stats.name if stats else "unknown"
+        if stats:
+            stats.rows += rows
+        db_query_rows.labels(method).inc(rows)
+        if duration >= settings.SLOW_QUERY_THRESHOLD:
+            db_slow_queries.labels(method).inc()
+            logger.warning(
+                f"slow query in {method} ({duration:.3f}s): {compile_sql(query)}"
+            )
+
+    async def fetch_all(self, query, values=None):
+        async with self.checkout():
+            start = time.perf_counter()
+            result = await super().fetch_all(query, values)
+        self._record(query, start, rows=len(result))
+        return result
+
+    async def fetch_one(self, query, values=None):
+        async with self.checkout():
+            start = time.perf_counter()
+            result = await super().fetch_one(query, values)
+        self._record(query, start, rows=int(result is not None))
+        return result
+
+    async def fetch_val(self, query, values=None, column=0):
+        async with self.checkout():
+            start = time.perf_counter()
+            result = await super().fetch_val(query, values, column=column)
+        self._record(query, start, rows=int(result is not None))
+        return result
+
+    async def execute(self, query, values=None):
+        async with self.checkout():
+            start = time.perf_counter()
+            result = await super().execute(query, values)
+        self._record(query, start, rows=0)
+        return result
+
+    async def execute_many(self, query, values):
+        async with self.checkout():
+            start = time.perf_counter()
+            result = await super().execute_many(query, values)
+        self._record(query, start, rows=0)
+        return result
+
+    def get_pool_stats(self) -> PoolStats | None:
+        if not self.is_postgres:
+            return None
+        return PoolStats(
+            size=self.size,
+            max_size=self.max_size,
+            in_use=self.in_use,
+            waiting=self.waiting,
+        )
+
+
+# Statements on hot paths (Zoom participant webhooks and star reactions)
+_upsert_zoom_participant = insert(zoom_participants).values(
+    meeting_id=sa.bindparam("meeting_id"),
+    name=sa.bindparam("name"),
+    zoom_id=sa.bindparam("zoom_id"),
+    email=sa.bindparam("email"),
+    joined_at=sa.bindparam("joined_at"),
+    # NOTE: need to pass created_at because `default` doesn't execute
+    #  when using postgres's insert
+    created_at=sa.bindparam("created_at"),
+)
+UPSERT_ZOOM_PARTICIPANT = compile_statement(
+    _upsert_zoom_participant.on_conflict_do_update(
+        index_elements=(zoom_participants.c.meeting_id, zoom_participants.c.name),
+        set_=dict(
+            zoom_id=_upsert_zoom_participant.excluded.zoom_id,
+            email=_upsert_zoom_participant.excluded.email,
+            joined_at=_upsert_zoom_participant.excluded.joined_at,
+        ),
+    )
+)
+DELETE_ZOOM_PARTICIPANT = compile_statement(
+    zoom_participants.delete().where(
+        (zoom_participants.c.meeting_id == sa.bindparam("meeting_id"))
+        & (zoom_participants.c.name == sa.bindparam("name"))
+    )
+)
+INSERT_STAR_LOG = compile_statement(
+    insert(star_logs).values(
+        id=sa.bindparam("id"),
+        from_user_id=sa.bindparam("from_user_id"),
+        to_user_id=sa.bindparam("to_user_id"),
+        message_id=sa.bindparam("message_id"),
+        jump_url=sa.bindparam("jump_url"),
+        created_at=sa.bindparam("created_at"),
+        action=sa.bindparam("action"),
+    )
+)
+UPDATE_USER_STARS = compile_statement(
+    insert(user_stars)
+    .values(
+        user_id=sa.bindparam("user_id"),
+        star_count=sa.bindparam("initial_star_count"),
+        created_at=sa.bindparam("created_at"),
+        updated_at=sa.bindparam("created_at"),
+    )
+    .on_conflict_do_update(
+        index_elements=(user_stars.c.user_id,),
+        set_=dict(
+            # TODO: don't allow negative count
+            star_count=user_stars.c.star_count + sa.bindparam("n_stars"),
+            updated_at=sa.bindparam("created_at"),
+        ),
+    )
+)
+GET_USER_STARS = compile_statement(
+    user_stars.select().where(user_stars.c.user_id == sa.bindparam("user_id"))
+)
+
+
+@_instrument
 class Store:
     metadata = metadata
 
@@ -306,18 +709,60 @@ class Store:
         self,
         database_url: str | databases.DatabaseURL,
         *,
+        replica_url: str | databases.DatabaseURL | None = None,
         force_rollback: bool = False,
     ):
-        self.db = databases.Database(database_url, force_rollback=force_rollback)
+        self.db = InstrumentedDatabase(
+            database_url,
+            force_rollback=force_rollback,
+            acquire_timeout=settings.DATABASE_POOL_ACQUIRE_TIMEOUT,
+            **get_pool_options(),
+        )
+        self.replica_db = (
+            InstrumentedDatabase(
+                replica_url,
+                name="replica",
+                acquire_timeout=settings.DATABASE_POOL_ACQUIRE_TIMEOUT,
+                **get_pool_options(),
+            )
+            if replica_url
+            else None
+        )
+        self.databases = [db for db in (self.db, self.replica_db) if db is not None]
 
     def connect(self):
-        return self.db.connect()
+        return asyncio.gather(*(db.connect() for db in self.databases))
 
     def disconnect(self):
-        return self.db.disconnect()
-
-    def transaction(self):
-        return self.db.transaction()
+        return asyncio.gather(*(db.disconnect() for db in self.databases))
+
+    @property
+    def read_db(self) -> InstrumentedDatabase:
+        """Database for read-only queries that can tolerate replication lag.
+
+        Returns the replica if one is configured, except within primary_reads()
+        or a transaction.
+        """
+        if self.replica_db is None or _primary_reads.get():
+            return self.db
+        return self.replica_db
+
+    @contextlib.contextmanager
+    def primary_reads(self) -> Iterator[None]:
+        """Send reads within the block to the primary, e.g. to read rows that were
+        just written.
+        """
+        token = _primary_reads.set(True)
+        try:
+            yield
+        finally:
+            _primary_reads.reset(token)
+
+    @contextlib.asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        with self.primary_reads():
+            async with self.db.checkout(), self.db.transaction():
+                yield
 
     async def set_user_timezone(self, user_id: int, timezone: dt.tzinfo | None):
         logger.debug(f"setting timezone for user_id {user_id}")
@@ -336,7 +781,7 @@ class Store:
     async def get_guild_settings(self, guild_id: int) -> Mapping | None:
         logger.debug(f"retrieving guild settings for guild_id {guild_id}")
         query = guild_settings.select().where(guild_settings.c.guild_id == guild_id)
-        return await self.db.fetch_one(query=query)
+        return await self.read_db.fetch_one(query=query)
 
     async def get_guild_announcements(self, guild_id: int) -> list[Mapping]:
         query = (
@@ -347,17 +792,17 @@ class Store:
             )
             .order_by(guild_announcements.c.created_at.desc())
         )
-        return await self.db.fetch_all(query=query)
+        return await self.read_db.fetch_all(query=query)
 
     async def get_guild_schedule_sheet_key(self, guild_id: int) -> str | None:
         query = guild_settings.select().where(guild_settings.c.guild_id == guild_id)
-        return await self.db.fetch_val(
+        return await self.read_db.fetch_val(
             query=query, column=guild_settings.c.schedule_sheet_key
         )
 
     async def get_guild_daily_message_channel_id(self, guild_id: int) -> int | None:
         query = guild_settings.select().where(guild_settings.c.guild_id == guild_id)
-        return await self.db.fetch_val(
+        return await self.read_db.fetch_val(
             query=query, column=guild_settings.c.daily_message_channel_id
         )
 
@@ -372,13 +817,13 @@ class Store:
                 .label("result"),
             )
         )
-        record = await self.db.fetch_one(select)
+        record = await self.read_db.fetch_one(select)
         if not record:
             return False
         return record["result"]
 
     async def get_guild_ids_with_practice_schedules(self) -> Iterator[int]:
-        all_settings = await self.db.fetch_all(
+        all_settings = await self.read_db.fetch_all(
             guild_settings.select().where(
                 guild_settings.c.daily_message_channel_id != NULL
             )
@@ -386,7 +831,7 @@ class Store:
         return (record["guild_id"] for record in all_settings)
 
     async def get_daily_message_channel_ids(self) -> Iterator[int]:
-        all_settings = await self.db.fetch_all(
+        all_settings = await self.read_db.fetch_all(
             guild_settings.select().where(
                 guild_settings.c.daily_message_channel_id != NULL
             )
@@ -508,25 +953,17 @@ class Store:
         email: str | None,
         joined_at: dt.datetime,
     ):
-        stmt = insert(zoom_participants).values(
-            meeting_id=meeting_id,
-            name=name,
-            zoom_id=zoom_id,
-            email=email,
-            joined_at=joined_at,
-            # NOTE: need to pass created_at because `default` doesn't execute
-            #  when using postgres's insert
-            created_at=now(),
-        )
-        stmt = stmt.on_conflict_do_update(
-            index_elements=(zoom_participants.c.meeting_id, zoom_participants.c.name),
-            set_=dict(
-                zoom_id=stmt.excluded.zoom_id,
-                email=stmt.excluded.email,
-                joined_at=stmt.excluded.joined_at,
+        await self.db.execute(
+            UPSERT_ZOOM_PARTICIPANT,
+            dict(
+                meeting_id=meeting_id,
+                name=name,
+                zoom_id=zoom_id,
+                email=email,
+                joined_at=joined_at,
+                created_at=now(),
             ),
         )
-        await self.db.execute(stmt)
 
     async def get_zoom_participant(self, *, meeting_id: int, name: str) -> Mapping | None:
         query = zoom_participants.select().where(
@@ -536,18 +973,65 @@ class Store:
         return await self.db.fetch_one(query=query)
 
     async def get_zoom_participants(self, meeting_id: int) -> list[Mapping]:
-        return await self.db.fetch_all(
+        return await self.read_db.fetch_all(
             zoom_participants.select()
             .where(zoom_participants.c.meeting_id == meeting_id)
             .order_by(zoom_participants.c.created_at)
         )
 
+    async def get_zoom_meeting_with_participants(
+        self, meeting_id: int
+    ) -> tuple[Mapping, str | None, list[Mapping]] | None:
+        """Fetch a meeting, its zzzzoom ID (if any), and its participants in
+        a single round trip.
+        """
+        zzzzoom_id = (
+            sa.select([zzzzoom_meetings.c.id])
+            .where(zzzzoom_meetings.c.meeting_id == zoom_meetings.c.meeting_id)
+            .order_by(zzzzoom_meetings.c.created_at)
+            .limit(1)
+            .as_scalar()
+            .label("zzzzoom_id")
+        )
+        participant_columns = [
+            column.label(f"participant_{column.name}")
+            for column in zoom_participants.c
+            if column.name != "meeting_id"
+        ]
+        query = (
+            sa.select([zoom_meetings, zzzzoom_id, *participant_columns])
+            .select_from(
+                zoom_meetings.outerjoin(
+                    zoom_participants,
+                    zoom_participants.c.meeting_id == zoom_meetings.c.meeting_id,
+                )
+            )
+            .where(zoom_meetings.c.meeting_id == meeting_id)
+            .order_by(zoom_participants.c.created_at)
+        )
+        records = await self.read_db.fetch_all(query=query)
+        if not records:
+            return None
+        first = records[0]
+        meeting = {column.name: first[column.name] for column in zoom_meetings.c}
+        participants = [
+            {
+                "meeting_id": meeting_id,
+                **{
+                    column.name: record[f"participant_{column.name}"]
+                    for column in zoom_participants.c
+                    if column.name != "meeting_id"
+                },
+            }
+            for record in records
+            # Outer join yields a single row of NULLs when there are no participants
+            if record["participant_name"] is not None
+        ]
+        return meeting, first["zzzzoom_id"], participants
+
     async def remove_zoom_participant(self, *, meeting_id: int, name: str):
         await self.db.execute(
-            zoom_participants.delete().where(
-                (zoom_participants.c.meeting_id == meeting_id)
-                & (zoom_participants.c.name == name)
-            )
+            DELETE_ZOOM_PARTICIPANT, dict(meeting_id=meeting_id, name=name)
         )
 
     # zzzzoom
@@ -566,6 +1050,24 @@ class Store:
         query = zzzzoom_meetings.select().where(zzzzoom_meetings.c.id == id)
         return await self.db.fetch_one(query=query)
 
+    async def get_zzzzoom_join_urls(self, ids: Sequence[str]) -> dict[str, str]:
+        """Return a mapping of zzzzoom meeting ID => Zoom join URL.
+
+        IDs without a (zoom) meeting are omitted.
+        """
+        query = (
+            sa.select([zzzzoom_meetings.c.id, zoom_meetings.c.join_url])
+            .select_from(
+                zzzzoom_meetings.join(
+                    zoom_meetings,
+                    zzzzoom_meetings.c.meeting_id == zoom_meetings.c.meeting_id,
+                )
+            )
+            .where(zzzzoom_meetings.c.id.in_(ids))
+        )
+        records = await self.db.fetch_all(query=query)
+        return {record["id"]: record["join_url"] for record in records}
+
     async def get_zzzzoom_meeting_for_zoom_meeting(self, meeting_id: int):
         query = zzzzoom_meetings.select().where(
             zzzzoom_meetings.c.meeting_id == meeting_id
@@ -587,20 +1089,31 @@ class Store:
 
     # Topics
 
-    async def save_topics(self, all_topics: Sequence[str]) -> None:
-        last_synced_at = now()
-        await self.db.execute(topics.delete())
-        stmt = insert(topics).values(
-            [{"content": topic, "last_synced_at": last_synced_at} for topic in all_topics]
-        )
-        stmt = stmt.on_conflict_do_update(
-            index_elements=(topics.c.content,),
-            set_=dict(last_synced_at=stmt.excluded.last_synced_at),
-        )
-        await self.db.execute(stmt)
+    async def save_topics(self, all_topics: Sequence[str]) -> TopicChanges:
+        """Make the topics table match `all_topics`, only touching rows that changed.
+
+        Should be called within a transaction.
+        """
+        existing = await self.get_all_topics()
+        existing_set = set(existing)
+        # Deduplicate, preserving order
+        new = dict.fromkeys(all_topics)
+        added = [topic for topic in new if topic not in existing_set]
+        removed = [topic for topic in existing if topic not in new]
+        if removed:
+            await self.db.execute(topics.delete().where(topics.c.content.in_(removed)))
+        if added:
+            last_synced_at = now()
+            stmt = insert(topics).values(
+                [{"content": topic, "last_synced_at": last_synced_at} for topic in added]
+            )
+            await self.db.execute(stmt.on_conflict_do_nothing())
+        return TopicChanges(added=added, removed=removed, total=len(new))
 
     async def get_all_topics(self) -> Sequence[str]:
-        all_topics = await self.db.fetch_all(topics.select())
+        all_topics = await self.read_db.fetch_all(
+            topics.select().order_by(topics.c.content)
+        )
         return [record["content"] for record in all_topics]
 
     # SIGN_CAFE
@@ -675,7 +1188,7 @@ class Store:
     async def get_sign_cafe_members_without_intro(
         self, since: dt.timedelta
     ) -> list[Mapping]:
-        return await self.db.fetch_all(
+        return await self.read_db.fetch_all(
             sign_cafe_members.select()
             .where(
                 (sign_cafe_members.c.is_active == sql.false())
@@ -696,7 +1209,7 @@ class Store:
     async def get_sign_cafe_members_with_no_roles(
         self, leeway: dt.timedelta
     ) -> list[Mapping]:
-        return await self.db.fetch_all(
+        return await self.read_db.fetch_all(
             sign_cafe_members.select()
             .where(
                 (sign_cafe_members.c.is_active == sql.false())
@@ -764,31 +1277,29 @@ class Store:
     ):
         created_at = now()
         # Insert a star log
-        stmt = insert(star_logs).values(
-            id=uuid.uuid4(),
-            from_user_id=from_user_id,
-            to_user_id=to_user_id,
-            message_id=message_id,
-            jump_url=jump_url,
-            created_at=created_at,
-            action="ADD",
+        await self.db.execute(
+            INSERT_STAR_LOG,
+            dict(
+                id=uuid.uuid4(),
+                from_user_id=from_user_id,
+                to_user_id=to_user_id,
+                message_id=message_id,
+                jump_url=jump_url,
+                created_at=created_at,
+                action="ADD",
+            ),
         )
-        await self.db.execute(stmt)
 
         # Update the user's star count
-        stmt = insert(user_stars).values(
-            user_id=to_user_id,
-            star_count=1,
-            created_at=created_at,
-            updated_at=created_at,
-        )
-        stmt = stmt.on_conflict_do_update(
-            index_elements=(user_stars.c.user_id,),
-            set_=dict(
-                star_count=user_stars.c.star_count + n_stars, updated_at=created_at
+        await self.db.execute(
+            UPDATE_USER_STARS,
+            dict(
+                user_id=to_user_id,
+                initial_star_count=1,
+                n_stars=n_stars,
+                created_at=created_at,
             ),
         )
-        await self.db.execute(stmt)
 
     async def remove_stars(
         self,
@@ -801,39 +1312,39 @@ class Store:
     ):
         created_at = now()
         # Insert a star log
-        stmt = insert(star_logs).values(
-            id=uuid.uuid4(),
-            from_user_id=from_user_id,
-            to_user_id=to_user_id,
-            message_id=message_id,
-            jump_url=jump_url,
-            created_at=created_at,
-            action="REMOVE",
+        await self.db.execute(
+            INSERT_STAR_LOG,
+            dict(
+                id=uuid.uuid4(),
+                from_user_id=from_user_id,
+                to_user_id=to_user_id,
+                message_id=message_id,
+                jump_url=jump_url,
+                created_at=created_at,
+                action="REMOVE",
+            ),
         )
-        await self.db.execute(stmt)
 
         # Update the user's star count
-        stmt = insert(user_stars).values(
-            user_id=to_user_id,
-            star_count=0,
-            created_at=created_at,
-            updated_at=created_at,
-        )
-        stmt = stmt.on_conflict_do_update(
-            index_elements=(user_stars.c.user_id,),
-            set_=dict(
-                # TODO: don't allow negative count
-                star_count=user_stars.c.star_count - n_stars,
-                updated_at=created_at,
+        await self.db.execute(
+            UPDATE_USER_STARS,
+            dict(
+                user_id=to_user_id,
+                initial_star_count=0,
+                n_stars=-n_stars,
+                created_at=created_at,
             ),
         )
-        await self.db.execute(stmt)
         star_count = await self.get_user_stars(user_id=to_user_id)
         await self._clean_rewards(user_id=to_user_id, star_count=star_count)
 
     async def get_user_stars(self, user_id: int) -> int:
-        query = user_stars.select().where(user_stars.c.user_id == user_id)
-        return await self.db.fetch_val(query=query, column=user_stars.c.star_count) or 0
+        return (
+            await self.db.fetch_val(
+                GET_USER_STARS, dict(user_id=user_id), column="star_count"
+            )
+            or 0
+        )
 
     async def set_user_stars(
         self, *, from_user_id: int, to_user_id: int, star_count: int
@@ -871,14 +1382,68 @@ class Store:
         )
         await self.db.execute(stmt)
 
-    async def list_user_stars(self, limit: int) -> list[Mapping]:
-        return await self.db.fetch_all(
+    async def list_user_stars(self, limit: int | None = None) -> list[Mapping]:
+        return await self.read_db.fetch_all(
             user_stars.select()
             .where(user_stars.c.star_count > 0)
-            .order_by(user_stars.c.star_count.desc())
+            .order_by(user_stars.c.star_count.desc(), user_stars.c.user_id)
             .limit(limit)
         )
 
+    async def get_user_star_rank(
+        self, user_id: int, *, neighbors: int = 2
+    ) -> StarRank | None:
+        """Return a user's leaderboard rank and the users ranked directly above and below them.
+
+        Returns None if the user has no stars.
+
+        Ranks every user with stars in a single query, so this scans the whole
+        leaderboard; bot.utils.leaderboard.Leaderboard serves ranks in O(log n) when
+        STARS_LEADERBOARD_IN_MEMORY is enabled.
+        """
+        order = (user_stars.c.star_count.desc(), user_stars.c.user_id)
+        ranked = (
+            sa.select(
+                [
+                    user_stars.c.user_id,
+                    user_stars.c.star_count,
+                    sa.func.rank()
+                    .over(order_by=user_stars.c.star_count.desc())
+                    .label("rank"),
+                    sa.func.row_number().over(order_by=order).label("position"),
+                ]
+            )
+            .where(user_stars.c.star_count > 0)
+            .cte("ranked")
+        )
+        target = (
+            sa.select([ranked.c.position])
+            .where(ranked.c.user_id == user_id)
+            .cte("target")
+        )
+        rows = await self.read_db.fetch_all(
+            sa.select([ranked.c.user_id, ranked.c.star_count, ranked.c.rank])
+            .select_from(
+                ranked.join(
+                    target,
+                    ranked.c.position.between(
+                        target.c.position - neighbors, target.c.position + neighbors
+                    ),
+                )
+            )
+            .order_by(ranked.c.position)
+        )
+        pairs = [(row["user_id"], row["star_count"]) for row in rows]
+        index = next((i for i, row in enumerate(rows) if row["user_id"] == user_id), None)
+        if index is None:
+            return None
+        return StarRank(
+            rank=rows[index]["rank"],
+            star_count=rows[index]["star_count"],
+            above=pairs[:index],
+            below=pairs[index + 1 :],
+        )
+
     async def list_user_star_highlight_logs(
         self, user_id: int, *, limit: int, after: dt.datetime | None
     ) -> list[Mapping]:
@@ -889,7 +1454,7 @@ class Store:
         )
         if after:
             query = query.where(star_logs.c.created_at > after)
-        return await self.db.fetch_all(
+        return await self.read_db.fetch_all(
             query.order_by(star_logs.c.created_at.desc()).limit(limit)
         )
 
@@ -918,10 +1483,60 @@ class Store:
             .values(reward_milestones=reward_milestones)
         )
 
+    async def get_star_log_partitions(self) -> list[str]:
+        """Return the names of the partitions attached to star_logs."""
+        rows = await self.db.fetch_all(
+            """SELECT child.relname AS name FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = 'star_logs'::regclass
+            ORDER BY name"""
+        )
+        return [row["name"] for row in rows]
+
+    async def create_star_log_partition(self, month: dt.datetime):
+        async with self.transaction():
+            for stmt in get_create_star_log_partition_statements(month):
+                await self.db.execute(stmt)
+
+    async def ensure_star_log_partitions(
+        self, *, months_ahead: int = STAR_LOG_PARTITIONS_AHEAD
+    ) -> list[str]:
+        """Create star_logs partitions for the current month and `months_ahead` months
+        after it. Returns the names of the created partitions.
+        """
+        existing = set(await self.get_star_log_partitions())
+        created = []
+        for months in range(months_ahead + 1):
+            month = get_month_start(now(), months)
+            name = get_star_log_partition_name(month)
+            if name not in existing:
+                await self.create_star_log_partition(month)
+                created.append(name)
+        return created
+
+    async def detach_star_log_partitions(self, *, before: dt.datetime) -> list[str]:
+        """Detach star_logs partitions for months that end on or before `before`.
+        Returns the names of the detached partitions.
+
+        Detached partitions are kept as standalone tables so that they can be
+        archived (e.g. with pg_dump) before they're dropped.
+        """
+        detached = []
+        for name in await self.get_star_log_partitions():
+            month = parse_star_log_partition_name(name)
+            if month is None or get_month_start(month, 1) > before:
+                continue
+            await self.db.execute(
+                f"ALTER TABLE star_logs DETACH PARTITION {_quote_identifier(name)}"
+            )
+            detached.append(name)
+        return detached
+
 
 store = Store(
     database_url=(
         settings.TEST_DATABASE_URL if settings.TESTING else settings.DATABASE_URL
     ),
+    replica_url=None if settings.TESTING else settings.DATABASE_REPLICA_URL,
     force_rollback=settings.TESTING,
 )
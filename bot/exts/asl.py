@@ -1,3 +1,4 @@
+import functools
 import logging
 import re
 from urllib.parse import quote_plus
@@ -8,7 +9,9 @@ from disnake import ApplicationCommandInteraction
 from disnake.ext.commands import Bot, Cog, Context, command, errors, slash_command
 
 from bot import settings
-from bot.utils import did_you_mean, get_close_matches, get_spoiler_text
+from bot.utils import get_spoiler_text
+from bot.utils.caches import register_cache
+from bot.utils.fuzzy import FuzzyIndex
 
 logger = logging.getLogger(__name__)
 
@@ -52,12 +55,22 @@ Examples:
     COMMAND_PREFIX=COMMAND_PREFIX
 )
 
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
 
 def word_display(word: str, *, template: str = SIGN_TEMPLATE, max_length: int = 100):
     if len(word) > max_length:
         raise errors.BadArgument("⚠️ Input too long. Try a shorter query.")
+    # Links are case-insensitive, so normalize before hitting the cache
+    return _render_word_display(word.strip().casefold(), template)
+
+
+# Lookups are dominated by a small set of popular words, so cache rendered links
+@register_cache("sign links")
+@functools.lru_cache(maxsize=1024)
+def _render_word_display(word: str, template: str) -> str:
     quoted_word = quote_plus(word).lower()
-    dasherized_word = re.sub(r"\s+", "-", word)
+    dasherized_word = WHITESPACE_PATTERN.sub("-", word)
     quoted_dasherized_word = quote_plus(dasherized_word).lower()
     return template.format(
         word_uppercased=word.upper(),
@@ -108,6 +121,8 @@ Enter `{COMMAND_PREFIX}handshapes` to show a list of handshapes.
     COMMAND_PREFIX=COMMAND_PREFIX
 )
 
+HANDSHAPE_INDEX = FuzzyIndex(handshapes.HANDSHAPE_NAMES)
+
 
 def handshape_impl(name: str):
     logger.info(f"handshape: '{name}'")
@@ -118,7 +133,7 @@ def handshape_impl(name: str):
             handshape = handshapes.get_handshape(name)
     except handshapes.HandshapeNotFoundError:
         logger.info(f"handshape '{name}' not found")
-        suggestion = did_you_mean(name, handshapes.HANDSHAPE_NAMES)
+        suggestion = HANDSHAPE_INDEX.did_you_mean(name)
         if suggestion:
             return {
                 "content": f'"{name}" not found. Did you mean "{suggestion}"? Enter `{COMMAND_PREFIX}handshapes` to see a list of handshapes.'
@@ -191,10 +206,7 @@ class ASL(Cog):
     async def handshape_autocomplete(
         self, inter: ApplicationCommandInteraction, name: str
     ):
-        name = name.strip()
-        if not name:
-            return handshapes.HANDSHAPE_NAMES[:25]
-        return get_close_matches(name, handshapes.HANDSHAPE_NAMES)
+        return HANDSHAPE_INDEX.autocomplete(name)
 
     @handshape_command.sub_command(name="list")
     async def handshape_list(self, inter: ApplicationCommandInteraction):
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import logging
 import random
 from contextlib import suppress
@@ -12,8 +13,8 @@ from disnake import ApplicationCommandInteraction
 from disnake.ext.commands import Bot, Cog, Context, Param, command, slash_command
 
 from bot import settings
-from bot.utils import did_you_mean
-from bot.utils.reactions import get_reaction_message, should_handle_reaction
+from bot.utils.fuzzy import FuzzyIndex
+from bot.utils.reactions import REACTION_ADD, REACTION_REMOVE, reaction_dispatcher
 
 logger = logging.getLogger(__name__)
 
@@ -21,34 +22,39 @@ COMMAND_PREFIX = settings.COMMAND_PREFIX
 
 NUM_CATCHPHRASE_WORDS = 8
 
-CATEGORIES_FORMATTED = ", ".join(catchphrase.CATEGORIES)
-
 JOIN_EMOJI = "✅"
 SHUFFLE_EMOJI = "🔀"
 
 
+@functools.lru_cache(maxsize=None)
+def get_category_index() -> FuzzyIndex:
+    return FuzzyIndex(catchphrase.get_categories())
+
+
 def catchphrase_impl(category: str | None = None):
     category = category.lower() if category else None
+    categories = catchphrase.get_categories()
+    categories_formatted = ", ".join(categories)
     if category == "categories":
         return {
-            "content": f"{CATEGORIES_FORMATTED}\nEnter `{COMMAND_PREFIX}cp` or `{COMMAND_PREFIX}cp [category]` to generate a list of words/phrases."
+            "content": f"{categories_formatted}\nEnter `{COMMAND_PREFIX}cp` or `{COMMAND_PREFIX}cp [category]` to generate a list of words/phrases."
         }
 
-    if category and category not in catchphrase.CATEGORIES:
+    if category and category not in categories:
         logger.info(f"invalid category: {category}")
-        suggestion = did_you_mean(category, catchphrase.CATEGORIES)
+        suggestion = get_category_index().did_you_mean(category)
         if suggestion:
             return {
-                "content": f'"{category}" is not a valid category. Did you mean "{suggestion}"?\nCategories: {CATEGORIES_FORMATTED}'
+                "content": f'"{category}" is not a valid category. Did you mean "{suggestion}"?\nCategories: {categories_formatted}'
             }
         else:
             return {
-                "content": f'"{category}" is not a valid category.\nCategories: {CATEGORIES_FORMATTED}'
+                "content": f'"{category}" is not a valid category.\nCategories: {categories_formatted}'
             }
     words = "\n".join(
         f"||{catchphrase.catchphrase(category)}||" for _ in range(NUM_CATCHPHRASE_WORDS)
     )
-    message = f"{words}\nCategories: {CATEGORIES_FORMATTED}"
+    message = f"{words}\nCategories: {categories_formatted}"
     logger.info("sending catchphrase words/phrases")
     return {"content": message}
 
@@ -72,12 +78,20 @@ def format_team(players: Sequence[disnake.User | disnake.Member]):
 class Games(Cog):
     def __init__(self, bot: Bot):
         self.bot = bot
+        reaction_dispatcher.register(
+            (JOIN_EMOJI, SHUFFLE_EMOJI),
+            self.handle_reaction,
+            events=(REACTION_ADD, REACTION_REMOVE),
+            own_messages_only=True,
+            current_reactions=True,
+            owner=self,
+        )
 
     @slash_command(name="catchphrase")
     async def catchphrase_command(
         self,
         inter: ApplicationCommandInteraction,
-        category: str = Param(choices=catchphrase.CATEGORIES, default=None),
+        category: str = Param(default=None),
     ):
         """Generate a list of random words and phrases
 
@@ -87,6 +101,12 @@ class Games(Cog):
         """
         await inter.send(**catchphrase_impl(category))
 
+    @catchphrase_command.autocomplete("category")
+    async def catchphrase_autocomplete(
+        self, inter: ApplicationCommandInteraction, category: str
+    ):
+        return get_category_index().autocomplete(category)
+
     @slash_command(name="codenames")
     async def codenames_command(
         self, inter: ApplicationCommandInteraction, name: str = ""
@@ -127,27 +147,14 @@ class Games(Cog):
 
     # End deprecated prefix commands
 
-    @Cog.listener()
-    async def on_raw_reaction_remove(
-        self, payload: disnake.RawReactionActionEvent
-    ) -> None:
-        await self.handle_reaction(payload)
-
-    @Cog.listener()
-    async def on_raw_reaction_add(self, payload: disnake.RawReactionActionEvent) -> None:
-        await self.handle_reaction(payload)
+    def cog_unload(self):
+        reaction_dispatcher.unregister(self)
 
-    async def handle_reaction(self, payload: disnake.RawReactionActionEvent) -> None:
-        if not should_handle_reaction(self.bot, payload, {JOIN_EMOJI, SHUFFLE_EMOJI}):
-            return
-        message = await get_reaction_message(self.bot, payload)
-        if not message:
-            return
+    async def handle_reaction(
+        self, payload: disnake.RawReactionActionEvent, message: disnake.Message
+    ) -> None:
         if "🕵️ **Codenames** 🕵" not in message.content:
             return
-        # Was the message sent by the bot?
-        if message.author.id != self.bot.user.id:
-            return
 
         reaction = next(
             (r for r in message.reactions if str(r.emoji) == JOIN_EMOJI), None
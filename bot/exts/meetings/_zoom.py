@@ -1,9 +1,24 @@
 from __future__ import annotations
 
 import asyncio
+import datetime as dt
+import functools
 import logging
 import random
-from typing import Any, Awaitable, Callable, Mapping, Sequence, Type, cast
+import weakref
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    Mapping,
+    NamedTuple,
+    Sequence,
+    Type,
+    TypeVar,
+    cast,
+)
 
 import disnake
 import holiday_emojis
@@ -15,12 +30,17 @@ from nameparser import HumanName
 
 from bot import settings
 from bot.database import store
+from bot.utils.caches import register_cache
 from bot.utils.datetimes import PACIFIC, utcnow
+from bot.utils.metrics import track_outbound
 from bot.utils.reactions import maybe_add_reaction
+from bot.utils.supervisor import supervisor
 from bot.utils.ui import LinkView
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 COMMAND_PREFIX = settings.COMMAND_PREFIX
 
 REPOST_EMOJI = "⏬"
@@ -90,46 +110,77 @@ zoom_client = ZoomClient(
 )
 
 
+@register_cache("zoom participant names")
+@functools.lru_cache(maxsize=2048)
+def get_participant_first_name(name: str) -> str:
+    """Return the first name for a Zoom display name, falling back to the full name.
+
+    HumanName is slow and the same names get re-rendered on every join/leave event,
+    so parsed names are memoized.
+    """
+    return HumanName(name).first or name
+
+
+def display_participant_name(participant: Mapping) -> str:
+    if participant["email"] in settings.ZOOM_EMAILS:
+        # Display authorized zoom users as mentions
+        disnake_id = settings.ZOOM_EMAILS[participant["email"]]
+        return f"<@{disnake_id}>"
+    # Only display first name to save real estate, fall back to full name
+    return get_participant_first_name(participant["name"])
+
+
 def display_participant_names(
     participants: Sequence[Mapping], meeting: Mapping, max_to_display: int = 15
 ) -> str:
-    names: list[str] = []
+    hosts: list[Mapping] = []
+    others: list[Mapping] = []
     for participant in participants:
-        if participant["email"] in settings.ZOOM_EMAILS:
-            # Display authorized zoom users as mentions
-            disnake_id = settings.ZOOM_EMAILS[participant["email"]]
-            display_name = f"<@{disnake_id}>"
-        else:
-            # Only display first name to save real estate, fall back to full name
-            display_name = HumanName(participant["name"]).first or participant["name"]
         if participant["zoom_id"] and participant["zoom_id"] == meeting["host_id"]:
-            # Display host first and in bold
-            names.insert(0, f"**{display_name}**")
+            hosts.append(participant)
         else:
-            names.append(display_name)
-    ret = "\n".join(
-        f"{get_participant_emoji()} {name}" for name in names[:max_to_display]
-    )
-    remaining = max(len(names) - max_to_display, 0)
+            others.append(participant)
+    # Display host first and in bold
+    ordered = [(participant, True) for participant in reversed(hosts)] + [
+        (participant, False) for participant in others
+    ]
+    # Only format the names that will actually be displayed
+    emojis = get_participant_emojis()
+    lines: list[str] = []
+    for participant, is_host in ordered[:max_to_display]:
+        display_name = display_participant_name(participant)
+        if is_host:
+            display_name = f"**{display_name}**"
+        lines.append(f"{random.choice(emojis)} {display_name}")
+    ret = "\n".join(lines)
+    remaining = max(len(ordered) - max_to_display, 0)
     if remaining:
         ret += f"\n+{remaining} more"
     return ret
 
 
-def get_participant_emoji() -> str:
-    if settings.PARTICIPANT_EMOJI:
-        return random.choice(settings.PARTICIPANT_EMOJI)
-    today_pacific = utcnow().astimezone(PACIFIC).date()
+@functools.lru_cache(maxsize=1)
+def _get_participant_emojis_for_date(today_pacific: dt.date) -> Sequence[str]:
     holiday_name = holiday_emojis.get_holiday_name(today_pacific)
     if holiday_name == "Halloween":
-        return "👻"
+        return ("👻",)
     elif holiday_name == "Thanksgiving":
-        return "🦃"
+        return ("🦃",)
     elif holiday_name in {"Christmas Eve", "Christmas Day"}:
-        return "🎄"
+        return ("🎄",)
     elif today_pacific.month == 12:
-        return "⛄️"
-    return random.choice(FACES)
+        return ("⛄️",)
+    return FACES
+
+
+def get_participant_emojis() -> Sequence[str]:
+    """Return the emojis to choose from when displaying participants.
+
+    The holiday lookup only happens once per (Pacific) day.
+    """
+    if settings.PARTICIPANT_EMOJI:
+        return settings.PARTICIPANT_EMOJI
+    return _get_participant_emojis_for_date(utcnow().astimezone(PACIFIC).date())
 
 
 class ZoomVerifiedView(disnake.ui.View):
@@ -182,29 +233,47 @@ class ZoomVerifiedView(disnake.ui.View):
         )
 
 
-async def make_zoom_send_kwargs(
-    meeting_id: int,
-    *,
-    guild_id: int | None,
-    include_instructions: bool = True,
-) -> dict[str, Any]:
-    meeting = await store.get_zoom_meeting(meeting_id)
-    if not meeting:
+class ZoomMeetingSnapshot(NamedTuple):
+    """Everything needed to render a Zoom meeting message, loaded once and
+    shared across all of the meeting's (crossposted) messages.
+    """
+
+    meeting: Mapping
+    zzzzoom_id: str | None
+    participants: tuple[Mapping, ...]
+
+    @property
+    def has_zzzzoom(self) -> bool:
+        return self.zzzzoom_id is not None
+
+    @property
+    def join_url(self) -> str:
+        if self.zzzzoom_id is not None:
+            return f"{settings.ZZZZOOM_URL}/{self.zzzzoom_id}"
+        return self.meeting["join_url"]
+
+
+async def get_zoom_meeting_snapshot(meeting_id: int) -> ZoomMeetingSnapshot:
+    result = await store.get_zoom_meeting_with_participants(meeting_id)
+    if not result:
         raise RuntimeError(f"zoom meeting {meeting_id} not found")
-    zzzzoom_meeting = await store.get_zzzzoom_meeting_for_zoom_meeting(
-        meeting_id=meeting_id
-    )
-    has_zzzzoom = bool(zzzzoom_meeting)
-    join_url = (
-        f"{settings.ZZZZOOM_URL}/{zzzzoom_meeting['id']}"
-        if has_zzzzoom
-        else meeting["join_url"]
+    meeting, zzzzoom_id, participants = result
+    return ZoomMeetingSnapshot(
+        meeting=meeting, zzzzoom_id=zzzzoom_id, participants=tuple(participants)
     )
+
+
+def make_zoom_embed(
+    snapshot: ZoomMeetingSnapshot, *, include_instructions: bool = True
+) -> disnake.Embed:
+    meeting = snapshot.meeting
+    has_zzzzoom = snapshot.has_zzzzoom
+    join_url = snapshot.join_url
     title = f"<{join_url}>"
     if has_zzzzoom:
-        description = f"**Meeting ID (for FS captcha page):**: `{zzzzoom_meeting['id']}`"
+        description = f"**Meeting ID (for FS captcha page):**: `{snapshot.zzzzoom_id}`"
     else:
-        description = f"**Meeting ID:**: `{meeting_id}`"
+        description = f"**Meeting ID:**: `{meeting['meeting_id']}`"
         description += f"\n**Passcode**: `{meeting['passcode']}`"
     if meeting["topic"]:
         description = f"{description}\n**Topic**: {meeting['topic']}"
@@ -226,25 +295,55 @@ async def make_zoom_send_kwargs(
             text=f"This message will be cleared when the meeting ends. | {REPOST_EMOJI} Move to bottom of channel"
         )
 
-    participants = tuple(await store.get_zoom_participants(meeting_id))
-    if participants:
+    if snapshot.participants:
         participant_names = display_participant_names(
-            participants=participants, meeting=meeting
+            participants=snapshot.participants, meeting=meeting
         )
         embed.add_field(name="👥 Participants", value=participant_names, inline=True)
+    return embed
+
+
+async def make_zoom_view(
+    snapshot: ZoomMeetingSnapshot, *, guild_id: int | None
+) -> ZoomVerifiedView | None:
+    """Return the guild-dependent part of a Zoom message, if any."""
+    if not guild_id or not snapshot.has_zzzzoom:
+        return None
+    guild_settings = await store.get_guild_settings(guild_id)
+    if not guild_settings:
+        return None
+    verified_role_ids = guild_settings["verified_role_ids"]
+    if not verified_role_ids:
+        return None
+    return ZoomVerifiedView.from_join_url(
+        snapshot.meeting["join_url"],
+        verified_role_ids=verified_role_ids,
+        zzzzoom_url=snapshot.join_url,
+    )
 
-    ret: dict[str, Any] = {"embed": embed}
-    if guild_id and has_zzzzoom:
-        guild_settings = await store.get_guild_settings(guild_id)
-        if guild_settings:
-            verified_role_ids = guild_settings["verified_role_ids"]
-            if verified_role_ids:
-                ret["view"] = ZoomVerifiedView.from_join_url(
-                    meeting["join_url"],
-                    verified_role_ids=verified_role_ids,
-                    zzzzoom_url=join_url,
-                )
 
+async def make_zoom_send_kwargs(
+    meeting_id: int,
+    *,
+    guild_id: int | None,
+    include_instructions: bool = True,
+    snapshot: ZoomMeetingSnapshot | None = None,
+    embed: disnake.Embed | None = None,
+) -> dict[str, Any]:
+    """Return the send/edit kwargs for a Zoom meeting message.
+
+    Pass a pre-loaded `snapshot` (and optionally a pre-rendered `embed`) when
+    rendering several messages for the same meeting so that only the
+    guild-dependent view is computed per message.
+    """
+    snapshot = snapshot or await get_zoom_meeting_snapshot(meeting_id)
+    ret: dict[str, Any] = {
+        "embed": embed
+        or make_zoom_embed(snapshot, include_instructions=include_instructions)
+    }
+    view = await make_zoom_view(snapshot, guild_id=guild_id)
+    if view:
+        ret["view"] = view
     return ret
 
 
@@ -262,7 +361,8 @@ async def maybe_create_zoom_meeting(
     meeting_exists = await store.zoom_meeting_exists(meeting_id=meeting_id)
     if not meeting_exists:
         try:
-            meeting = await zoom_client.get_zoom(meeting_id=meeting_id)
+            with track_outbound("zoom", "get_zoom"):
+                meeting = await zoom_client.get_zoom(meeting_id=meeting_id)
         except client.ClientResponseError as error:
             logger.exception(f"error when fetching zoom meeting {meeting_id}")
             raise errors.CheckFailure(
@@ -294,7 +394,82 @@ async def add_repost_after_delay_impl(message: disnake.Message, delay: int):
 def add_repost_after_delay(
     bot: Bot, message: disnake.Message, delay: int = settings.ZOOM_REPOST_COOLDOWN
 ):
-    bot.loop.create_task(add_repost_after_delay_impl(message, delay))
+    supervisor.spawn(
+        add_repost_after_delay_impl(message, delay),
+        name=f"add repost emoji to message {message.id}",
+        category="zoom_repost",
+    )
+
+
+# Message edits share a per-channel rate limit bucket, so only a few edits
+#   are allowed in flight per channel. Edits in different channels run concurrently.
+MAX_CONCURRENT_EDITS_PER_CHANNEL = 2
+# Limiters are dropped once no edits in the channel are using them
+_channel_edit_limiters: weakref.WeakValueDictionary[int, asyncio.Semaphore] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _get_channel_edit_limiter(channel_id: int) -> asyncio.Semaphore:
+    limiter = _channel_edit_limiters.get(channel_id)
+    if limiter is None:
+        limiter = _channel_edit_limiters[channel_id] = asyncio.Semaphore(
+            MAX_CONCURRENT_EDITS_PER_CHANNEL
+        )
+    return limiter
+
+
+def get_zoom_partial_message(
+    bot: Bot, *, channel_id: int, message_id: int
+) -> disnake.PartialMessage:
+    """Return a message that can be edited by ID without fetching it first.
+
+    Guild channels are always cached, so the message's guild is known for them.
+    Other channels (e.g. DMs) are used through a partial messageable.
+    """
+    channel = bot.get_channel(channel_id) or bot.get_partial_messageable(channel_id)
+    return cast(disnake.TextChannel, channel).get_partial_message(message_id)
+
+
+@dataclass
+class ZoomMessageEdits(Generic[T]):
+    # Results of the successful edits, in the same order as the stored messages
+    edited: list[T] = field(default_factory=list)
+    # Stored messages that could not be edited
+    failed: list[Mapping] = field(default_factory=list)
+
+
+async def edit_zoom_messages(
+    bot: Bot,
+    zoom_messages: Sequence[Mapping],
+    edit: Callable[[disnake.PartialMessage], Awaitable[T]],
+) -> ZoomMessageEdits[T]:
+    """Run `edit` on every stored message for a meeting, concurrently across channels.
+
+    Failed edits are logged and returned separately from the results.
+    """
+
+    async def edit_one(message_info: Mapping) -> T:
+        channel_id = message_info["channel_id"]
+        message = get_zoom_partial_message(
+            bot, channel_id=channel_id, message_id=message_info["message_id"]
+        )
+        async with _get_channel_edit_limiter(channel_id):
+            return await edit(message)
+
+    results = await asyncio.gather(
+        *(edit_one(info) for info in zoom_messages), return_exceptions=True
+    )
+    edits: ZoomMessageEdits[T] = ZoomMessageEdits()
+    for info, result in zip(zoom_messages, results):
+        if isinstance(result, BaseException):
+            logger.error(
+                f"could not edit zoom message {info['message_id']}", exc_info=result
+            )
+            edits.failed.append(info)
+        else:
+            edits.edited.append(result)
+    return edits
 
 
 async def get_zoom_meeting_id(meeting_id: int | str) -> int:
@@ -340,16 +515,17 @@ async def zoom_impl(
         return zoom_meeting_id, message
     else:
         try:
-            meeting = await zoom_client.create_zoom(
-                user_id=zoom_user,
-                topic="",
-                settings={
-                    "host_video": False,
-                    "participant_video": False,
-                    "mute_upon_entry": True,
-                    "waiting_room": not with_zzzzoom,
-                },
-            )
+            with track_outbound("zoom", "create_zoom"):
+                meeting = await zoom_client.create_zoom(
+                    user_id=zoom_user,
+                    topic="",
+                    settings={
+                        "host_video": False,
+                        "participant_video": False,
+                        "mute_upon_entry": True,
+                        "waiting_room": not with_zzzzoom,
+                    },
+                )
         except Exception as error:
             raise ZoomCreateError(
                 "🚨 _Could not create Zoom meeting. That's embarrassing._"
@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from enum import Enum, auto
-from typing import List, Optional, Union, cast
+from typing import Optional, Union, cast
 
 import disnake
 import meetings
@@ -22,13 +22,14 @@ from disnake.ext.commands import (
 from bot import settings
 from bot.database import store
 from bot.utils.deprecation import send_deprecation_notice
+from bot.utils.metrics import track_outbound
 from bot.utils.reactions import (
     STOP_SIGN,
+    CloseMessages,
     add_stop_sign,
-    get_reaction_message,
     handle_close_reaction,
     maybe_clear_reaction,
-    should_handle_reaction,
+    reaction_dispatcher,
 )
 from bot.utils.ui import ButtonGroupOption, ButtonGroupView
 
@@ -37,8 +38,12 @@ from ._zoom import (
     ZOOM_CLOSED_MESSAGE,
     ZoomCreateError,
     add_repost_after_delay,
+    edit_zoom_messages,
     get_zoom_meeting_id,
+    get_zoom_meeting_snapshot,
+    get_zoom_partial_message,
     is_allowed_zoom_access,
+    make_zoom_embed,
     make_zoom_send_kwargs,
     zoom_client,
     zoom_impl,
@@ -98,6 +103,22 @@ def make_zoom_standby_embed():
     )
 
 
+async def close_zoom_message(message: disnake.Message) -> str:
+    await store.remove_zoom_message(message_id=message.id)
+    await maybe_clear_reaction(message, REPOST_EMOJI)
+    return ZOOM_CLOSED_MESSAGE
+
+
+CLOSE_MESSAGES = CloseMessages(
+    {
+        r"zoom\.us|Stand By|Could not create Zoom|localhost": close_zoom_message,
+        r"meet\.jit\.si": MEET_CLOSED_MESSAGE,
+        r"Speakeasy": SPEAKEASY_CLOSED_MESSAGE,
+        r"w2g\.tv|Could not create watch2gether": WATCH2GETHER_CLOSED_MESSAGE,
+    }
+)
+
+
 class ProtectionMode(Enum):
     WAITING_ROOM = auto()
     FS_CAPTCHA = auto()
@@ -106,6 +127,12 @@ class ProtectionMode(Enum):
 class Meetings(Cog):
     def __init__(self, bot: Bot):
         self.bot = bot
+        reaction_dispatcher.register(
+            (REPOST_EMOJI,), self.handle_repost_reaction, owner=self
+        )
+        reaction_dispatcher.register(
+            (STOP_SIGN,), self.handle_stop_reaction, own_messages_only=True, owner=self
+        )
 
     @slash_command(name="zoom")
     @check(is_allowed_zoom_access)
@@ -210,9 +237,11 @@ class Meetings(Cog):
         zoom_messages = tuple(await store.get_zoom_messages(meeting_id=meeting_id))
         # DM zoom link and instructions once
         if len(zoom_messages) <= 1:
-            send_kwargs = await make_zoom_send_kwargs(
-                meeting_id, guild_id=None, include_instructions=False
-            )
+            # The meeting was just created
+            with store.primary_reads():
+                send_kwargs = await make_zoom_send_kwargs(
+                    meeting_id, guild_id=None, include_instructions=False
+                )
             await inter.user.send(content="🔨 Set up your meeting below", **send_kwargs)
             await inter.user.send(
                 "To post in another channel, send the following command in that channel:\n"
@@ -244,23 +273,27 @@ class Meetings(Cog):
         zoom_messages = tuple(await store.get_zoom_messages(meeting_id=meeting_id))
         if not zoom_messages:
             raise errors.CheckFailure(f"⚠️ No meeting messages for meeting {meeting_id}.")
-        messages: List[disnake.Message] = []
-        for message_info in zoom_messages:
-            channel_id = message_info["channel_id"]
-            message_id = message_info["message_id"]
-            channel = cast(disnake.TextChannel, self.bot.get_channel(channel_id))
-            assert channel is not None
-            message: disnake.Message = await channel.fetch_message(message_id)
-            messages.append(message)
+        with store.primary_reads():
+            snapshot = await get_zoom_meeting_snapshot(meeting_id)
+        embed = make_zoom_embed(snapshot)
+
+        async def reveal_message(message: disnake.PartialMessage) -> disnake.Message:
             logger.info(
-                f"revealing meeting details for meeting {meeting_id} in channel {channel_id}, message {message_id}"
+                f"revealing meeting details for meeting {meeting_id} in channel {message.channel.id}, message {message.id}"
             )
             send_kwargs = await make_zoom_send_kwargs(
                 meeting_id=meeting_id,
                 guild_id=message.guild.id if message.guild else None,
+                snapshot=snapshot,
+                embed=embed,
             )
-            await message.edit(**send_kwargs)
-            add_repost_after_delay(self.bot, message)
+            edited = await message.edit(**send_kwargs)
+            add_repost_after_delay(self.bot, edited)
+            return edited
+
+        messages = (
+            await edit_zoom_messages(self.bot, zoom_messages, reveal_message)
+        ).edited
         if inter.guild_id is None:
             assert inter.user is not None
             links = "\n".join(
@@ -315,18 +348,36 @@ class Meetings(Cog):
         zoom_messages = tuple(await store.get_zoom_messages(meeting_id=meeting_id))
         if not zoom_messages:
             raise errors.CheckFailure(f"⚠️ No meeting messages for meeting {meeting_id}.")
-        messages = []
-        for message_info in zoom_messages:
-            channel_id = message_info["channel_id"]
-            message_id = message_info["message_id"]
-            channel = cast(disnake.TextChannel, self.bot.get_channel(channel_id))
-            message: disnake.Message = await channel.fetch_message(message_id)
-            messages.append(message)
+
+        async def scrub_message(message: disnake.PartialMessage) -> None:
             logger.info(
-                f"scrubbing meeting details for meeting {meeting_id} in channel {channel_id}, message {message_id}"
+                f"scrubbing meeting details for meeting {meeting_id} in channel {message.channel.id}, message {message.id}"
             )
-            await message.edit(content=ZOOM_CLOSED_MESSAGE, embed=None, view=None)
+            try:
+                await message.edit(content=ZOOM_CLOSED_MESSAGE, embed=None, view=None)
+            except disnake.NotFound:
+                # Deleted messages don't need to be scrubbed
+                return
             await maybe_clear_reaction(message, REPOST_EMOJI)
+
+        failed = (await edit_zoom_messages(self.bot, zoom_messages, scrub_message)).failed
+        if failed:
+            # Keep the meeting and the messages that still show its details
+            #   so that they can be scrubbed by running the command again
+            failed_ids = {info["message_id"] for info in failed}
+            for info in zoom_messages:
+                if info["message_id"] not in failed_ids:
+                    await store.remove_zoom_message(message_id=info["message_id"])
+            links = "\n".join(
+                get_zoom_partial_message(
+                    self.bot, channel_id=info["channel_id"], message_id=info["message_id"]
+                ).jump_url
+                for info in failed
+            )
+            await inter.send(
+                f"⚠️ Could not remove meeting details from these messages. Run `/zoom stop {meeting_id_str}` again to retry.\n{links}"
+            )
+            return
         await store.end_zoom_meeting(meeting_id=meeting_id)
         await inter.send("🛑 Meeting details removed.")
 
@@ -337,7 +388,8 @@ class Meetings(Cog):
     async def zoom_users(self, inter: ApplicationCommandInteraction):
         """(Bot owner only) List users who have access to the zoom commands"""
         try:
-            users = await zoom_client.list_zoom_users()
+            with track_outbound("zoom", "list_zoom_users"):
+                users = await zoom_client.list_zoom_users()
         except asyncio.exceptions.TimeoutError:
             logger.exception("zoom request timed out")
             await inter.send(
@@ -376,9 +428,10 @@ class Meetings(Cog):
         """
         logger.info("creating watch2gether meeting")
         try:
-            url = await meetings.create_watch2gether(
-                settings.WATCH2GETHER_API_KEY, video_url
-            )
+            with track_outbound("watch2gether", "create_room"):
+                url = await meetings.create_watch2gether(
+                    settings.WATCH2GETHER_API_KEY, video_url
+                )
         except Exception:
             logger.exception("could not create watch2gether room")
             await inter.send(
@@ -496,9 +549,10 @@ class Meetings(Cog):
     ):
         logger.info("creating watch2gether meeting")
         try:
-            url = await meetings.create_watch2gether(
-                settings.WATCH2GETHER_API_KEY, video_url
-            )
+            with track_outbound("watch2gether", "create_room"):
+                url = await meetings.create_watch2gether(
+                    settings.WATCH2GETHER_API_KEY, video_url
+                )
         except Exception:
             logger.exception("could not create watch2gether room")
             message = await ctx.send(
@@ -538,79 +592,66 @@ class Meetings(Cog):
         )
         await maybe_clear_reaction(message, REPOST_EMOJI)
 
-    @Cog.listener()
-    async def on_raw_reaction_add(self, payload: disnake.RawReactionActionEvent) -> None:
-        if should_handle_reaction(self.bot, payload, {REPOST_EMOJI}):
-            message = await get_reaction_message(self.bot, payload)
-            if not message:
-                return
-            zoom_message = await store.get_zoom_message(message.id)
-            if not zoom_message:
-                return
-            zoom_meeting = await store.get_zoom_meeting(zoom_message["meeting_id"])
-            if not zoom_meeting:
-                return
-            # Meeting isn't set up, don't reveal it yet
-            if not zoom_meeting["setup_at"]:
-                return
-            original_message = None
-            if message.reference:
-                if message.reference.cached_message:
-                    original_message = message.reference.cached_message
-                else:
-                    channel = cast(
-                        disnake.TextChannel, self.bot.get_channel(message.channel.id)
-                    )
-                    assert message.reference.message_id is not None
-                    original_message = await channel.fetch_message(
-                        message.reference.message_id
-                    )
-            # Try to remove the old message and reply with a new message
-            if original_message:
-                try:
-                    await message.delete()
-                except Exception:
-                    await self.edit_meeting_moved(message)
+    def cog_unload(self):
+        reaction_dispatcher.unregister(self)
+
+    async def handle_repost_reaction(
+        self, payload: disnake.RawReactionActionEvent, message: disnake.Message
+    ) -> None:
+        zoom_message = await store.get_zoom_message(message.id)
+        if not zoom_message:
+            return
+        zoom_meeting = await store.get_zoom_meeting(zoom_message["meeting_id"])
+        if not zoom_meeting:
+            return
+        # Meeting isn't set up, don't reveal it yet
+        if not zoom_meeting["setup_at"]:
+            return
+        original_message = None
+        if message.reference:
+            if message.reference.cached_message:
+                original_message = message.reference.cached_message
             else:
+                channel = cast(
+                    disnake.TextChannel, self.bot.get_channel(message.channel.id)
+                )
+                assert message.reference.message_id is not None
+                original_message = await channel.fetch_message(
+                    message.reference.message_id
+                )
+        # Try to remove the old message and reply with a new message
+        if original_message:
+            try:
+                await message.delete()
+            except Exception:
                 await self.edit_meeting_moved(message)
+        else:
+            await self.edit_meeting_moved(message)
 
-            send_method = original_message.reply if original_message else message.reply
-            send_kwargs = await make_zoom_send_kwargs(
-                zoom_message["meeting_id"],
-                guild_id=message.guild.id if message.guild else None,
-            )
-            new_message = await send_method(
-                content="👐 **This meeting is still going**. Come on in!",
-                mention_author=False,
-                **send_kwargs,
-            )
-            add_repost_after_delay(self.bot, new_message)
-
-            async with store.transaction():
-                await store.create_zoom_message(
-                    message_id=new_message.id,
-                    channel_id=new_message.channel.id,
-                    meeting_id=zoom_message["meeting_id"],
-                )
-                await store.remove_zoom_message(message_id=zoom_message["message_id"])
+        send_method = original_message.reply if original_message else message.reply
+        send_kwargs = await make_zoom_send_kwargs(
+            zoom_message["meeting_id"],
+            guild_id=message.guild.id if message.guild else None,
+        )
+        new_message = await send_method(
+            content="👐 **This meeting is still going**. Come on in!",
+            mention_author=False,
+            **send_kwargs,
+        )
+        add_repost_after_delay(self.bot, new_message)
 
-            return
+        async with store.transaction():
+            await store.create_zoom_message(
+                message_id=new_message.id,
+                channel_id=new_message.channel.id,
+                meeting_id=zoom_message["meeting_id"],
+            )
+            await store.remove_zoom_message(message_id=zoom_message["message_id"])
 
-        async def close_zoom_message(msg: disnake.Message):
-            await store.remove_zoom_message(message_id=msg.id)
-            await maybe_clear_reaction(msg, REPOST_EMOJI)
-            return ZOOM_CLOSED_MESSAGE
-
-        await handle_close_reaction(
-            self.bot,
-            payload,
-            close_messages={
-                r"zoom\.us|Stand By|Could not create Zoom|localhost": close_zoom_message,
-                r"meet\.jit\.si": MEET_CLOSED_MESSAGE,
-                r"Speakeasy": SPEAKEASY_CLOSED_MESSAGE,
-                r"w2g\.tv|Could not create watch2gether": WATCH2GETHER_CLOSED_MESSAGE,
-            },
-        )
+    async def handle_stop_reaction(
+        self, payload: disnake.RawReactionActionEvent, message: disnake.Message
+    ) -> None:
+        await handle_close_reaction(message, close_messages=CLOSE_MESSAGES)
 
     async def _prompt_for_protection_type(
         self, inter: ApplicationCommandInteraction
@@ -13,9 +13,17 @@ from disnake.ext.commands import Bot
 
 from bot import settings
 from bot.database import store
+from bot.utils.metrics import webhook_queue_depth
 from bot.utils.reactions import maybe_clear_reaction
+from bot.utils.supervisor import supervisor
 
-from ._zoom import REPOST_EMOJI, make_zoom_send_kwargs
+from ._zoom import (
+    REPOST_EMOJI,
+    edit_zoom_messages,
+    get_zoom_meeting_snapshot,
+    make_zoom_embed,
+    make_zoom_send_kwargs,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +33,11 @@ SUPPORTED_EVENTS = {
     "meeting.ended",
 }
 
+zoom_queue_depth = webhook_queue_depth.labels("zoom")
+
+MAX_CONCURRENT_ZOOM_EVENTS = 10
+supervisor.set_limit("zoom_webhook", MAX_CONCURRENT_ZOOM_EVENTS)
+
 
 async def handle_zoom_event(bot: Bot, data: dict):
     event = data["event"]
@@ -102,34 +115,39 @@ async def handle_zoom_event(bot: Bot, data: dict):
         logger.info(f"removing participant for meeting id {meeting_id}")
         await store.remove_zoom_participant(meeting_id=meeting_id, name=participant_name)
 
-    disnake_messages = []
-    if zoom_meeting["setup_at"]:
-        for message in messages:
-            channel_id = message["channel_id"]
-            message_id = message["message_id"]
-            channel = cast(disnake.TextChannel, bot.get_channel(channel_id))
-            logger.info(f"editing zoom message {message_id} for event {event}")
-            disnake_message: disnake.Message = await channel.fetch_message(message_id)
-            disnake_messages.append(disnake_message)
-            if event == "meeting.ended":
-                await maybe_clear_reaction(disnake_message, REPOST_EMOJI)
-                embed = disnake.Embed(
-                    title="✨ _Zoom meeting ended by host_", color=disnake.Color.blue()
-                )
-                embed.set_footer(
-                    text="🌱🌱 2 trees will be planted to offset the emissions from this meeting."
-                )
-                edit_kwargs = {
-                    "content": None,
-                    "embed": embed,
-                    "view": None,
-                }
-            else:
+    disnake_messages: list[disnake.Message] = []
+    if zoom_meeting["setup_at"] and messages:
+        if event == "meeting.ended":
+            ended_embed = disnake.Embed(
+                title="✨ _Zoom meeting ended by host_", color=disnake.Color.blue()
+            )
+            ended_embed.set_footer(
+                text="🌱🌱 2 trees will be planted to offset the emissions from this meeting."
+            )
+
+            async def edit_message(message: disnake.PartialMessage) -> disnake.Message:
+                logger.info(f"editing zoom message {message.id} for event {event}")
+                await maybe_clear_reaction(message, REPOST_EMOJI)
+                return await message.edit(content=None, embed=ended_embed, view=None)
+
+        else:
+            # Load the meeting once and reuse the rendered embed for every crossposted message.
+            #   Read from the primary to include the participant change saved above.
+            with store.primary_reads():
+                snapshot = await get_zoom_meeting_snapshot(meeting_id)
+            embed = make_zoom_embed(snapshot)
+
+            async def edit_message(message: disnake.PartialMessage) -> disnake.Message:
+                logger.info(f"editing zoom message {message.id} for event {event}")
                 edit_kwargs = await make_zoom_send_kwargs(
                     meeting_id=meeting_id,
-                    guild_id=disnake_message.guild.id if disnake_message.guild else None,
+                    guild_id=message.guild.id if message.guild else None,
+                    snapshot=snapshot,
+                    embed=embed,
                 )
-            await disnake_message.edit(**edit_kwargs)
+                return await message.edit(**edit_kwargs)
+
+        disnake_messages = (await edit_zoom_messages(bot, messages, edit_message)).edited
     # If a banned user joins, notify @Mod in SIGN_CAFE
     if banned_user_joined:
         if disnake_messages:
@@ -172,7 +190,13 @@ def setup(bot: Bot) -> None:
 
         # Zoom expects responses within 3 seconds, so run the handler logic asynchronously
         #   https://marketplace.zoom.us/docs/api-reference/webhook-reference#notification-delivery
-        asyncio.create_task(handle_zoom_event(bot, data))
+        zoom_queue_depth.inc()
+        task = supervisor.spawn(
+            handle_zoom_event(bot, data),
+            name=f"handle zoom event {event}",
+            category="zoom_webhook",
+        )
+        task.add_done_callback(lambda _: zoom_queue_depth.dec())
         return web.Response(body="", status=200)
 
     bot.app.add_routes([web.post("/zoom", zoom)])  # type: ignore
@@ -7,7 +7,11 @@ from disnake.ext import commands
 from disnake.ext.commands import Bot, Cog, Context, command, is_owner, slash_command
 
 from bot import __version__, settings
+from bot.database import store
 from bot.utils import truncate
+from bot.utils.caches import CacheInfo, get_cache_stats
+from bot.utils.loop_monitor import SlowCallback, loop_monitor
+from bot.utils.query_stats import MethodStats, get_all_method_stats
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +29,21 @@ async def post_feedback(bot: commands.Bot, text: str, guild: Optional[str]):
     await owner.send(embed=embed)
 
 
+def format_cache_info(name: str, info: CacheInfo) -> str:
+    lookups = info.hits + info.misses
+    hit_rate = f"{info.hits / lookups:.0%}" if lookups else "n/a"
+    return f"{name}: `{info.currsize}/{info.maxsize}` entries, `{hit_rate}` hit rate ({lookups} lookups)"
+
+
+def format_slow_callback(offender: SlowCallback) -> str:
+    return f"`{offender.max:.3f}s` max, `{offender.count}`× — {offender.location}"
+
+
+def format_method_stats(stats: MethodStats) -> str:
+    p50, p95, p99 = (stats.percentile(q) * 1000 for q in (50, 95, 99))
+    return f"{stats.name[:32]:<32} {stats.count:>6} {p50:>6.1f} {p95:>6.1f} {p99:>6.1f} {stats.rows:>7}"
+
+
 class Meta(Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
@@ -67,6 +86,79 @@ class Meta(Cog):
             name=f"Servers ({n_guilds}, avg {avg_members} users/server)",
             value=servers_display,
         )
+        cache_stats = get_cache_stats()
+        if cache_stats:
+            embed.add_field(
+                name="Caches",
+                value="\n".join(
+                    format_cache_info(name, info) for name, info in cache_stats.items()
+                ),
+                inline=False,
+            )
+        await ctx.send(embed=embed)
+
+    @command(
+        name="loopstats",
+        hidden=True,
+        help="BOT OWNER ONLY: Show the code that blocked the event loop the longest",
+    )
+    @is_owner()
+    async def loopstats_command(self, ctx: Context):
+        offenders = loop_monitor.get_worst_offenders()
+        if not offenders:
+            await ctx.send(
+                f"✨ The event loop hasn't been blocked for more than {loop_monitor.threshold}s since startup."
+            )
+            return
+        embed = disnake.Embed(
+            title="Slowest event loop callbacks",
+            description="\n".join(
+                format_slow_callback(offender) for offender in offenders
+            ),
+            color=disnake.Color.blue(),
+        )
+        if offenders[0].stack:
+            embed.add_field(
+                name="Stack sample from the longest stall",
+                # Keep the innermost frames
+                value=f"```\n{offenders[0].stack[-1000:]}\n```",
+                inline=False,
+            )
+        await ctx.send(embed=embed)
+
+    @command(
+        name="dbstats",
+        hidden=True,
+        help="BOT OWNER ONLY: Show database query stats per Store method",
+    )
+    @is_owner()
+    async def dbstats_command(self, ctx: Context):
+        all_stats = get_all_method_stats()
+        if not all_stats:
+            await ctx.send("No queries have run since startup.")
+            return
+        max_to_display = 20
+        header = (
+            f"{'method':<32} {'calls':>6} {'p50':>6} {'p95':>6} {'p99':>6} {'rows':>7}"
+        )
+        rows = "\n".join(
+            format_method_stats(stats) for stats in all_stats[:max_to_display]
+        )
+        embed = disnake.Embed(
+            title="Database queries",
+            description=f"Latencies in ms, most total time first\n```\n{header}\n{rows}\n```",
+            color=disnake.Color.blue(),
+        )
+        for db in store.databases:
+            pool_stats = db.get_pool_stats()
+            if pool_stats:
+                embed.add_field(
+                    name=f"Connection pool ({db.name})",
+                    value=f"`{pool_stats.size}/{pool_stats.max_size}` connections open, `{pool_stats.in_use}` in use, `{pool_stats.waiting}` waiting",
+                )
+        errors = sum(stats.errors for stats in all_stats)
+        if errors:
+            embed.set_footer(text=f"{errors} failed calls")
         await ctx.send(embed=embed)
 
     @command(name="edit", hidden=True, help="BOT OWNER ONLY: Edit a bot message")
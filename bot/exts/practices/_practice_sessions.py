@@ -18,6 +18,7 @@ from bot.utils.datetimes import (
 from bot.utils.discord import THEME_COLOR
 from bot.utils.gcal import create_gcal_url
 from bot.utils.gsheets import get_gsheet_client
+from bot.utils.metrics import track_outbound
 
 logger = logging.getLogger(__name__)
 
@@ -36,8 +37,9 @@ async def get_practice_worksheet_for_guild(guild_id: int):
     client = get_gsheet_client()
     sheet_key = await store.get_guild_schedule_sheet_key(guild_id)
     assert sheet_key is not None
-    sheet = client.open_by_key(sheet_key)
-    return sheet.get_worksheet(0)
+    with track_outbound("sheets", "open_practice_worksheet"):
+        sheet = client.open_by_key(sheet_key)
+        return sheet.get_worksheet(0)
 
 
 async def get_practice_sessions(
@@ -48,7 +50,8 @@ async def get_practice_sessions(
     parse_settings: Optional[dict] = None,
 ) -> List[PracticeSession]:
     worksheet = worksheet or await get_practice_worksheet_for_guild(guild_id)
-    all_values = worksheet.get_all_values()
+    with track_outbound("sheets", "get_practice_sessions"):
+        all_values = worksheet.get_all_values()
     return sorted(
         (
             PracticeSession(
@@ -1,4 +1,3 @@
-import asyncio
 import datetime as dt
 import logging
 import random
@@ -14,6 +13,7 @@ from disnake.ext.commands import Bot, Cog, Context, command, is_owner
 from bot import settings
 from bot.database import store
 from bot.exts.asl import word_display
+from bot.exts.topics import topic_cache
 from bot.utils.datetimes import (
     EASTERN,
     PACIFIC,
@@ -22,6 +22,7 @@ from bot.utils.datetimes import (
     utcnow,
 )
 from bot.utils.discord import THEME_COLOR, get_event_url
+from bot.utils.supervisor import supervisor
 from bot.utils.tasks import daily_task
 
 from ._practice_sessions import (
@@ -46,15 +47,17 @@ RANDOMIZED_HANDSHAPE_NAMES = list(handshapes.HANDSHAPE_NAMES)
 random.Random("handshapes").shuffle(RANDOMIZED_HANDSHAPE_NAMES)
 
 
-def get_daily_handshape(dtime: Optional[dt.datetime] = None) -> handshapes.Handshape:
+def get_daily_handshape(
+    dtime: Optional[dt.datetime] = None, *, size: handshapes.Size = "full"
+) -> handshapes.Handshape:
     dtime = dtime or utcnow()
     day_of_year = dtime.timetuple().tm_yday
     name = RANDOMIZED_HANDSHAPE_NAMES[day_of_year % len(RANDOMIZED_HANDSHAPE_NAMES)]
-    return handshapes.get_handshape(name)
+    return handshapes.get_handshape(name, size=size)
 
 
 async def get_daily_topics(dtime: Optional[dt.datetime] = None) -> Tuple[str, str]:
-    topics = await store.get_all_topics()
+    topics = await topic_cache.get_all()
     rand = get_today_random(dtime)
     return (rand.choice(topics), rand.choice(topics))
 
@@ -73,7 +76,7 @@ class DailyMessage(Cog, name="Daily Message"):  # type: ignore
 
     @Cog.listener()
     async def on_ready(self):
-        self.bot.loop.create_task(self.daily_message())
+        supervisor.spawn_once(self.daily_message(), name="daily message send")
 
     @command(
         name="send_daily_message",
@@ -181,7 +184,7 @@ class DailyMessage(Cog, name="Daily Message"):  # type: ignore
             )
         elif include_handshape_of_the_day:
             # Handshape of the Day
-            handshape = get_daily_handshape(dtime)
+            handshape = get_daily_handshape(dtime, size="thumbnail")
             filename = f"{handshape.name}.png"
             send_kwargs["file"] = disnake.File(handshape.path, filename=filename)
             embed.set_thumbnail(url=f"attachment://{filename}")
@@ -235,12 +238,14 @@ class DailyMessage(Cog, name="Daily Message"):  # type: ignore
         async with daily_task(
             settings.DAILY_PRACTICE_SEND_TIME, name="daily message send"
         ):
+            holiday_emojis.refresh(dt.datetime.now(PACIFIC).date())
             channel_ids = list(await store.get_daily_message_channel_ids())
             for channel_id in channel_ids:
-                try:
-                    asyncio.create_task(self.send_daily_message(channel_id))
-                except Exception:
-                    logger.exception(f"could not send to channel {channel_id}")
+                supervisor.spawn(
+                    self.send_daily_message(channel_id),
+                    name=f"send daily message to channel {channel_id}",
+                    category="daily_message",
+                )
 
 
 def setup(bot: Bot) -> None:
@@ -16,10 +16,12 @@ from disnake.types.embed import Embed as EmbedData
 
 from bot import settings
 from bot.database import store
-from bot.utils import did_you_mean, get_close_matches
 from bot.utils.datetimes import utcnow
 from bot.utils.discord import THEME_COLOR, display_name
+from bot.utils.fuzzy import FuzzyIndex
 from bot.utils.gsheets import get_gsheet_client
+from bot.utils.metrics import track_outbound
+from bot.utils.supervisor import supervisor
 from bot.utils.tasks import daily_task
 from bot.utils.ui import LinkView
 
@@ -47,10 +49,11 @@ def get_gsheet():
 
 
 def get_sheet_content(worksheet_name: str) -> list[str]:
-    sheet = get_gsheet()
-    worksheet = sheet.worksheet(worksheet_name)
-    # Get all content from first column
-    return worksheet.col_values(1)
+    with track_outbound("sheets", "get_sheet_content"):
+        sheet = get_gsheet()
+        worksheet = sheet.worksheet(worksheet_name)
+        # Get all content from first column
+        return worksheet.col_values(1)
 
 
 def get_skill_roles() -> list[disnake.Object]:
@@ -113,11 +116,13 @@ async def make_inactive_members_embed(guild: Guild):
 
 def get_tags() -> dict[str, EmbedData]:
     logger.info("fetching tags")
-    sheet = get_gsheet()
-    worksheet = sheet.worksheet("tags")
+    with track_outbound("sheets", "get_tags"):
+        sheet = get_gsheet()
+        worksheet = sheet.worksheet("tags")
+        rows = worksheet.get_all_values()
     return {
         tag.lower(): {"title": title, "description": content}
-        for tags, title, content in worksheet.get_all_values()[1:]  # first row is header
+        for tags, title, content in rows[1:]  # first row is header
         for tag in tags.split()
     }
 
@@ -147,6 +152,7 @@ class SignCafe(Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.tags: dict[str, EmbedData] = {}
+        self.tag_index = FuzzyIndex(())
         self.unmute_warnings: dict[int, dt.datetime] = {}
 
     def cog_check(self, ctx: Context):
@@ -172,11 +178,7 @@ class SignCafe(Cog):
 
     @tag_show.autocomplete("name")
     async def tag_autocomplete(self, inter: GuildCommandInteraction, tag: str):
-        tag = tag.strip().lower()
-        options = tuple(self.tags.keys())
-        if not tag:
-            return sorted(options)[:25]
-        return get_close_matches(tag, options)
+        return self.tag_index.autocomplete(tag)
 
     @tag_command.sub_command(name="sync")
     @commands.has_permissions(kick_members=True)  # Staff
@@ -233,7 +235,7 @@ class SignCafe(Cog):
     def _tag_impl(self, name: str) -> dict:
         name = name.lower()
         if name not in self.tags:
-            suggestion: str | None = did_you_mean(name, tuple(self.tags.keys()))
+            suggestion = self.tag_index.did_you_mean(name)
             if not suggestion:
                 return {"content": f'⚠️ No tag matching "{name}"'}
             else:
@@ -241,9 +243,13 @@ class SignCafe(Cog):
         return {"embed": Embed.from_dict(self.tags[name])}
 
     def _tag_sync_impl(self) -> dict:
-        self.tags = get_tags()
+        self._set_tags(get_tags())
         return {"content": "✅ Updated tags."}
 
+    def _set_tags(self, tags: dict[str, EmbedData]):
+        self.tags = tags
+        self.tag_index = FuzzyIndex(sorted(tags))
+
     def _tag_list_impl(self) -> dict:
         embed = Embed(
             title="Tags",
@@ -556,9 +562,9 @@ class SignCafe(Cog):
 
     @Cog.listener()
     async def on_ready(self):
-        self.bot.loop.create_task(self.daily_message())
-        self.bot.loop.create_task(self.daily_member_kick())
-        self.tags = get_tags() if settings.SIGN_CAFE_SYNC_TAGS else {}
+        supervisor.spawn_once(self.daily_message(), name="sign cafe staff message")
+        supervisor.spawn_once(self.daily_member_kick(), name="sign cafe member kick")
+        self._set_tags(get_tags() if settings.SIGN_CAFE_SYNC_TAGS else {})
 
     async def daily_message(self):
         async with daily_task(DAILY_MESSAGE_TIME, name="sign cafe staff message"):
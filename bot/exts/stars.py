@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
 import logging
 import math
@@ -14,9 +15,13 @@ from disnake.ext import commands
 from disnake.ext.commands import Bot, Cog, Context, Param, slash_command
 
 from bot import settings
-from bot.database import store
+from bot.database import StarRank, get_month_start, store
+from bot.utils.datetimes import utcnow
 from bot.utils.discord import display_name
-from bot.utils.reactions import get_reaction_message, should_handle_reaction
+from bot.utils.leaderboard import Leaderboard
+from bot.utils.reactions import REACTION_REMOVE, reaction_dispatcher
+from bot.utils.supervisor import supervisor
+from bot.utils.tasks import daily_task
 
 logger = logging.getLogger(__name__)
 
@@ -25,9 +30,83 @@ STAR_EMOJI = "⭐"
 
 ASSETS_PATH = Path(__file__).parent / "assets"
 
+STAR_LOG_MAINTENANCE_TIME = dt.time(3, 0)  # Eastern time
+
+
+class StarLeaderboard:
+    """In-memory copy of user_stars, loaded on first use.
+
+    Call `refresh` after changing a user's stars so that the copy stays in sync.
+    When settings.STARS_LEADERBOARD_IN_MEMORY is off, lookups go to Postgres.
+    """
+
+    def __init__(self):
+        self._leaderboard: Leaderboard | None = None
+        self._load_lock: asyncio.Lock | None = None
+        # Users whose stars changed while the leaderboard was loading
+        self._pending_refreshes: set[int] | None = None
+
+    async def _get_leaderboard(self) -> Leaderboard:
+        if self._leaderboard is not None:
+            return self._leaderboard
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+        async with self._load_lock:
+            if self._leaderboard is None:
+                self._leaderboard = await self._load()
+        return self._leaderboard
+
+    async def _load(self) -> Leaderboard:
+        self._pending_refreshes = set()
+        try:
+            # Read from the primary so the copy doesn't start out behind
+            with store.primary_reads():
+                records = await store.list_user_stars()
+            leaderboard = Leaderboard(
+                {record["user_id"]: record["star_count"] for record in records}
+            )
+            # The query may have missed changes that were committed while it ran
+            while self._pending_refreshes:
+                user_id = self._pending_refreshes.pop()
+                leaderboard.set(user_id, await store.get_user_stars(user_id))
+            return leaderboard
+        finally:
+            self._pending_refreshes = None
+
+    async def get_top(self, limit: int) -> list[tuple[int, int]]:
+        """Return (user_id, star_count) pairs for the top `limit` users."""
+        if not settings.STARS_LEADERBOARD_IN_MEMORY:
+            records = await store.list_user_stars(limit=limit)
+            return [(record["user_id"], record["star_count"]) for record in records]
+        return (await self._get_leaderboard()).top(limit)
+
+    async def get_rank(self, user_id: int, *, neighbors: int = 2) -> StarRank | None:
+        if not settings.STARS_LEADERBOARD_IN_MEMORY:
+            return await store.get_user_star_rank(user_id, neighbors=neighbors)
+        leaderboard = await self._get_leaderboard()
+        rank = leaderboard.rank(user_id)
+        if rank is None:
+            return None
+        above, below = leaderboard.neighbors(user_id, neighbors)
+        return StarRank(
+            rank=rank, star_count=leaderboard.get(user_id), above=above, below=below
+        )
+
+    async def refresh(self, user_id: int):
+        if self._pending_refreshes is not None:
+            self._pending_refreshes.add(user_id)
+        elif self._leaderboard is not None:
+            self._leaderboard.set(user_id, await store.get_user_stars(user_id))
+
+
+star_leaderboard = StarLeaderboard()
+
 
 async def make_user_star_count_embed(
-    user: disnake.Member | disnake.User, *, description: str | None = None
+    user: disnake.Member | disnake.User,
+    *,
+    description: str | None = None,
+    show_rank: bool = False,
 ) -> Embed:
     embed = Embed(
         description=description or "",
@@ -35,6 +114,10 @@ async def make_user_star_count_embed(
     )
     user_stars = await store.get_user_stars(user.id)
     embed.add_field(name=f"{STAR_EMOJI} count", value=str(user_stars))
+    if show_rank:
+        rank = await star_leaderboard.get_rank(user.id, neighbors=0)
+        if rank is not None:
+            embed.add_field(name="Rank", value=f"#{rank.rank}")
     embed.set_author(
         name=display_name(user),
         icon_url=user.avatar.url if user.avatar else None,
@@ -122,21 +205,68 @@ async def maybe_reward_user(user: disnake.Member | disnake.User):
     )
     user_stars = await store.get_user_stars(user.id)
     if next_milestone and user_stars >= next_milestone:
-        send_kwargs = await make_reward_send_kwargs(
-            milestone=next_milestone,
-            user_id=user.id,
-            user_stars=user_stars,
-            last_reward_at=last_reward_at,
-            reward_milestones=reward_milestones,
-        )
+        # Highlights include the star that was just given
+        with store.primary_reads():
+            send_kwargs = await make_reward_send_kwargs(
+                milestone=next_milestone,
+                user_id=user.id,
+                user_stars=user_stars,
+                last_reward_at=last_reward_at,
+                reward_milestones=reward_milestones,
+            )
         with suppress(disnake.errors.Forbidden):  # user may not allow DMs from bot
             await user.send(**send_kwargs)
             await store.store_star_reward(user_id=user.id, star_count=user_stars)
 
 
+async def maintain_star_log_partitions():
+    """Create upcoming star_logs partitions and detach those past the retention period."""
+    created = await store.ensure_star_log_partitions()
+    if created:
+        logger.info(f"created star log partitions: {', '.join(created)}")
+    if settings.STAR_LOG_RETENTION_MONTHS is None:
+        return
+    before = get_month_start(utcnow(), -settings.STAR_LOG_RETENTION_MONTHS)
+    detached = await store.detach_star_log_partitions(before=before)
+    if detached:
+        logger.info(f"detached star log partitions: {', '.join(detached)}")
+
+
+def is_sign_cafe_star_reaction(payload: disnake.RawReactionActionEvent) -> bool:
+    return (
+        settings.SIGN_CAFE_ENABLE_STARS
+        and payload.guild_id == settings.SIGN_CAFE_GUILD_ID
+    )
+
+
 class Stars(Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        reaction_dispatcher.register(
+            (STAR_EMOJI,),
+            self.handle_star_added,
+            predicate=is_sign_cafe_star_reaction,
+            owner=self,
+        )
+        reaction_dispatcher.register(
+            (STAR_EMOJI,),
+            self.handle_star_removed,
+            events=(REACTION_REMOVE,),
+            predicate=is_sign_cafe_star_reaction,
+            owner=self,
+        )
+
+    @Cog.listener()
+    async def on_ready(self):
+        supervisor.spawn_once(
+            self.daily_star_log_maintenance(), name="star log partition maintenance"
+        )
+
+    async def daily_star_log_maintenance(self):
+        # Run once at startup so that a fresh deploy has partitions for the current month
+        await maintain_star_log_partitions()
+        async with daily_task(STAR_LOG_MAINTENANCE_TIME, name="star log maintenance"):
+            await maintain_star_log_partitions()
 
     def cog_check(self, ctx: Context):
         if not bool(ctx.guild) or ctx.guild.id != settings.SIGN_CAFE_GUILD_ID:
@@ -217,6 +347,7 @@ class Stars(Cog):
                 message_id=None,
                 jump_url=None,
             )
+        await star_leaderboard.refresh(user.id)
         noun = f"{STAR_EMOJI}s" if n > 1 else f"a {STAR_EMOJI}"
         embed = await make_user_star_count_embed(
             description=f"{user.mention} received {noun} from {inter.user.mention}",
@@ -249,6 +380,7 @@ class Stars(Cog):
                 message_id=None,
                 jump_url=None,
             )
+        await star_leaderboard.refresh(user.id)
         assert inter.user is not None
         noun = f"{STAR_EMOJI}s" if n > 1 else f"a {STAR_EMOJI}"
         embed = await make_user_star_count_embed(
@@ -279,6 +411,7 @@ class Stars(Cog):
                 to_user_id=user.id,
                 star_count=stars,
             )
+        await star_leaderboard.refresh(user.id)
         embed = await make_user_star_count_embed(
             user=user, description=f"Set star count for {user.mention}"
         )
@@ -288,16 +421,16 @@ class Stars(Cog):
     @stars_command.sub_command(name="board")
     async def stars_board(self, inter: GuildCommandInteraction):
         """Show the star leaderboard"""
-        records = await store.list_user_stars(limit=100)
+        records = await star_leaderboard.get_top(limit=100)
         description = ""
         # TODO: use a paginated embed
         # https://discord.com/developers/docs/resources/channel#embed-limits
         max_description_length = 4096
-        for i, record in enumerate(records):
-            member = await inter.guild.get_or_fetch_member(record["user_id"])
+        for i, (user_id, star_count) in enumerate(records):
+            member = await inter.guild.get_or_fetch_member(user_id)
             if not member:
                 continue
-            line = f"{i+1}. {member.display_name} | `{member.name}#{member.discriminator}` | {record['star_count']} {STAR_EMOJI}\n"
+            line = f"{i+1}. {member.display_name} | `{member.name}#{member.discriminator}` | {star_count} {STAR_EMOJI}\n"
             if len(description) + len(line) < max_description_length:
                 description += line
         embed = Embed(
@@ -311,19 +444,23 @@ class Stars(Cog):
     async def stars_me(self, inter: GuildCommandInteraction):
         """Show how many stars you have"""
         assert inter.user is not None
-        embed = await make_user_star_count_embed(user=inter.user)
+        embed = await make_user_star_count_embed(user=inter.user, show_rank=True)
         await inter.send(embed=embed)
 
     @stars_command.sub_command(name="info")
     async def stars_info(self, inter: GuildCommandInteraction, user: disnake.User):
         """Show how many stars a user has"""
-        embed = await make_user_star_count_embed(user=user)
+        embed = await make_user_star_count_embed(user=user, show_rank=True)
         await inter.send(embed=embed)
 
-    @Cog.listener()
-    async def on_raw_reaction_add(self, payload: disnake.RawReactionActionEvent) -> None:
-        message, from_user = await self._maybe_get_star_reaction_message_and_user(payload)
-        if message is None or from_user is None:
+    def cog_unload(self):
+        reaction_dispatcher.unregister(self)
+
+    async def handle_star_added(
+        self, payload: disnake.RawReactionActionEvent, message: disnake.Message
+    ) -> None:
+        from_user = await self._get_staff_reactor(payload, message)
+        if from_user is None:
             return
 
         to_user = message.author
@@ -336,6 +473,7 @@ class Stars(Cog):
                 message_id=message.id,
                 jump_url=message.jump_url,
             )
+        await star_leaderboard.refresh(to_user.id)
         channel = cast(
             disnake.TextChannel, self.bot.get_channel(settings.SIGN_CAFE_BOT_CHANNEL_ID)
         )
@@ -346,12 +484,11 @@ class Stars(Cog):
         await channel.send(embed=embed)
         await maybe_reward_user(to_user)
 
-    @Cog.listener()
-    async def on_raw_reaction_remove(
-        self, payload: disnake.RawReactionActionEvent
+    async def handle_star_removed(
+        self, payload: disnake.RawReactionActionEvent, message: disnake.Message
     ) -> None:
-        message, from_user = await self._maybe_get_star_reaction_message_and_user(payload)
-        if message is None or from_user is None:
+        from_user = await self._get_staff_reactor(payload, message)
+        if from_user is None:
             return
 
         to_user = message.author
@@ -364,6 +501,7 @@ class Stars(Cog):
                 message_id=message.id,
                 jump_url=message.jump_url,
             )
+        await star_leaderboard.refresh(to_user.id)
         channel = cast(
             disnake.TextChannel, self.bot.get_channel(settings.SIGN_CAFE_BOT_CHANNEL_ID)
         )
@@ -373,34 +511,25 @@ class Stars(Cog):
         )
         await channel.send(embed=embed)
 
-    async def _maybe_get_star_reaction_message_and_user(
-        self,
-        payload: disnake.RawReactionActionEvent,
-    ) -> tuple[disnake.Message | None, disnake.Member | None]:
-        if not settings.SIGN_CAFE_ENABLE_STARS:
-            return None, None
-        if not should_handle_reaction(self.bot, payload, {STAR_EMOJI}):
-            return None, None
-        message = await get_reaction_message(self.bot, payload)
-        if not message:
-            return None, None
+    async def _get_staff_reactor(
+        self, payload: disnake.RawReactionActionEvent, message: disnake.Message
+    ) -> disnake.Member | None:
+        """Return the member who reacted if the reaction should change the author's stars."""
         if not message.guild:
-            return None, None
-        if message.guild.id != settings.SIGN_CAFE_GUILD_ID:
-            return None, None
+            return None
         if bool(getattr(message.author, "bot", None)):  # User is a bot
-            return None, None
+            return None
         channel = cast(disnake.TextChannel, message.channel)
         if not channel.guild:
-            return None, None
+            return None
         from_user = await channel.guild.get_or_fetch_member(payload.user_id)
         if not from_user:
-            return None, None
+            return None
         permissions = channel.permissions_for(from_user)
         is_staff = getattr(permissions, "kick_members", False) is True
         if not is_staff:
-            return None, None
-        return message, from_user
+            return None
+        return from_user
 
 
 def setup(bot: Bot) -> None:
@@ -1,6 +1,11 @@
+from __future__ import annotations
+
 import datetime as dt
+import hashlib
 import logging
 import random
+from collections import OrderedDict
+from typing import Sequence
 
 import disnake
 from aiohttp import web
@@ -17,10 +22,12 @@ from disnake.ext.commands import (
 )
 
 from bot import settings
-from bot.database import store
+from bot.database import TopicChanges, store
 from bot.utils import truncate
 from bot.utils.datetimes import utcnow
 from bot.utils.gsheets import get_gsheet_client
+from bot.utils.metrics import track_outbound
+from bot.utils.supervisor import supervisor
 from bot.utils.tasks import daily_task
 
 logger = logging.getLogger(__name__)
@@ -36,7 +43,7 @@ class Topics(Cog):
 
     @Cog.listener()
     async def on_ready(self):
-        self.bot.loop.create_task(self.daily_sync())
+        supervisor.spawn_once(self.daily_sync(), name="topics daily sync")
 
     @command(
         name="synctopics",
@@ -46,14 +53,17 @@ class Topics(Cog):
     @is_owner()
     async def sync_topics_command(self, ctx: Context):
         await ctx.channel.trigger_typing()
-        topics = await sync_topics()
-        await ctx.reply(f"✅ Synced {len(topics)} topics.")
+        changes = await sync_topics()
+        await ctx.reply(
+            f"✅ Synced {changes.total} topics ({len(changes.added)} added, {len(changes.removed)} removed)."
+            + format_topic_changes(changes)
+        )
 
     @slash_command(name="top")
     @cooldown(rate=1, per=10, type=BucketType.guild)
     async def topic(self, inter: ApplicationCommandInteraction):
         """Post a conversation topic as a thread (like /topic but better)"""
-        topics = await store.get_all_topics()
+        topics = await topic_cache.get_all()
         topic = random.choice(topics)
         await inter.send(content=f"> {topic}")
         message = await inter.original_message()
@@ -64,25 +74,46 @@ class Topics(Cog):
 
     async def daily_sync(self):
         async with daily_task(DAILY_SYNC_TIME, name="topic sync"):
-            topics = await sync_topics()
-            logger.info(f"synced {len(topics)} topics")
+            changes = await sync_topics()
+            logger.info(
+                f"synced {changes.total} topics ({len(changes.added)} added, {len(changes.removed)} removed)"
+            )
 
 
 # -----------------------------------------------------------------------------
 
 
-async def sync_topics():
+async def sync_topics() -> TopicChanges:
     topics = get_gsheet_topics()
     async with store.transaction():
-        await store.save_topics(topics)
-    return topics
+        changes = await store.save_topics(topics)
+        # Use the same order as loading from the database so that minute
+        #   topics don't depend on whether the cache was synced or loaded
+        all_topics = await store.get_all_topics()
+    topic_cache.set(all_topics)
+    return changes
+
+
+def format_topic_changes(changes: TopicChanges, *, max_to_display: int = 10) -> str:
+    lines = [f"+ {topic}" for topic in changes.added] + [
+        f"- {topic}" for topic in changes.removed
+    ]
+    if not lines:
+        return ""
+    remaining = len(lines) - max_to_display
+    display = "\n".join(truncate(line, 100) for line in lines[:max_to_display])
+    if remaining > 0:
+        display += f"\n…and {remaining} more"
+    return f"\n```diff\n{display}\n```"
 
 
 def get_gsheet_topics():
-    client = get_gsheet_client()
-    sheet = client.open_by_key(settings.TOPICS_SHEET_KEY)
-    worksheet = sheet.get_worksheet(0)
-    return [each["content"] for each in worksheet.get_all_records()]
+    with track_outbound("sheets", "get_topics"):
+        client = get_gsheet_client()
+        sheet = client.open_by_key(settings.TOPICS_SHEET_KEY)
+        worksheet = sheet.get_worksheet(0)
+        records = worksheet.get_all_records()
+    return [each["content"] for each in records]
 
 
 def floor_minute(d: dt.datetime):
@@ -97,16 +128,66 @@ def get_minute_random(seed=None):
     return random.Random(s)
 
 
+class TopicCache:
+    """In-memory copy of the topics table. Loaded on first use and replaced by sync_topics."""
+
+    # Max number of memoized (minute, seed) => topic picks to keep.
+    #   Picks are made on the first request for each key.
+    MAX_MINUTE_TOPICS = 1024
+
+    def __init__(self):
+        self._topics: list[str] | None = None
+        self._minute_topics: OrderedDict[tuple[dt.datetime, str | None], str] = (
+            OrderedDict()
+        )
+
+    async def get_all(self) -> Sequence[str]:
+        if self._topics is None:
+            self.set(await store.get_all_topics())
+        assert self._topics is not None
+        return self._topics
+
+    def set(self, topics: Sequence[str]):
+        self._topics = list(topics)
+        self._minute_topics.clear()
+
+    async def get_minute_topic(self, seed: str | None = None) -> str:
+        """Get the topic for the current minute, which is the same for all
+        requests with the same seed within a minute.
+        """
+        topics = await self.get_all()
+        minute = floor_minute(utcnow())
+        key = (minute, seed or None)
+        topic = self._minute_topics.get(key)
+        if topic is None:
+            if self._minute_topics and next(iter(self._minute_topics))[0] != minute:
+                # Results from previous minutes won't be requested again
+                self._minute_topics.clear()
+            topic = self._minute_topics[key] = get_minute_random(seed).choice(topics)
+            if len(self._minute_topics) > self.MAX_MINUTE_TOPICS:
+                self._minute_topics.popitem(last=False)
+        return topic
+
+
+topic_cache = TopicCache()
+
+
 # -----------------------------------------------------------------------------
 
 
 async def totm(request):
-    topics = await store.get_all_topics()
-
     seed = request.query.get("s")
-    rand = get_minute_random(seed)
-    topic = rand.choice(topics)
-    return web.Response(body=topic, status=200)
+    topic = await topic_cache.get_minute_topic(seed)
+    # The topic changes at the top of every minute
+    seconds_left = 60 - utcnow().second
+    headers = {"Cache-Control": f"public, max-age={seconds_left}"}
+    etag = hashlib.sha1(topic.encode()).hexdigest()
+    if any(each.value == etag for each in request.if_none_match or ()):
+        response = web.Response(status=304, headers=headers)
+    else:
+        response = web.Response(text=topic, status=200, headers=headers)
+    response.etag = etag
+    return response
 
 
 # -----------------------------------------------------------------------------
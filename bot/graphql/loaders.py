@@ -0,0 +1,114 @@
+"""Request-scoped batching of GraphQL lookups."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Generic, Hashable, MutableMapping, TypeVar
+
+from bot.database import store
+from bot.utils.supervisor import supervisor
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# Zoom join URLs don't change for the lifetime of a meeting, but meetings can end,
+#   so keep cached URLs only briefly
+JOIN_URL_CACHE_TTL = 15  # seconds
+JOIN_URL_CACHE_MAX_SIZE = 1024
+
+
+class DataLoader(Generic[K, V]):
+    """Collects the keys requested within the same event loop iteration and
+    loads them with a single call to `batch_load`.
+
+    `batch_load` receives a list of unique keys and returns a dict of the values
+    that were found; missing keys resolve to None.
+    """
+
+    def __init__(self, batch_load: Callable[[list[K]], Awaitable[dict[K, V]]]):
+        self.batch_load = batch_load
+        self._pending: dict[K, asyncio.Future] = {}
+        self._results: dict[K, asyncio.Future] = {}
+
+    def load(self, key: K) -> asyncio.Future:
+        if key in self._results:
+            return self._results[key]
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._results[key] = future
+        if not self._pending:
+            loop.call_soon(self._spawn_dispatch)
+        self._pending[key] = future
+        return future
+
+    def _spawn_dispatch(self):
+        pending, self._pending = self._pending, {}
+        # Spawned through the supervisor so the task is referenced until it finishes
+        task = supervisor.spawn(
+            self._dispatch(pending), name="dataloader dispatch", category="graphql"
+        )
+        # If the dispatch is cancelled (possibly before it starts), cancel its
+        #   futures so that resolvers awaiting them don't hang
+        task.add_done_callback(lambda _: self._cancel_unresolved(pending))
+
+    async def _dispatch(self, pending: dict[K, asyncio.Future]):
+        try:
+            values = await self.batch_load(list(pending))
+        except Exception as error:
+            for key, future in pending.items():
+                self._forget(key, future)
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for key, future in pending.items():
+            if not future.done():
+                future.set_result(values.get(key))
+
+    def _cancel_unresolved(self, pending: dict[K, asyncio.Future]):
+        for key, future in pending.items():
+            if not future.done():
+                self._forget(key, future)
+                future.cancel()
+
+    def _forget(self, key: K, future: asyncio.Future):
+        # Don't cache failures
+        if self._results.get(key) is future:
+            del self._results[key]
+
+
+# zzzzoom ID => (expiry time, join URL), least recently used first
+_join_url_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+
+async def load_join_urls(ids: list[str]) -> dict[str, str]:
+    now = time.monotonic()
+    join_urls = {}
+    for id in ids:
+        cached = _join_url_cache.get(id)
+        if cached is None:
+            continue
+        if cached[0] > now:
+            _join_url_cache.move_to_end(id)
+            join_urls[id] = cached[1]
+        else:
+            del _join_url_cache[id]
+    missing = [id for id in ids if id not in join_urls]
+    if missing:
+        fetched = await store.get_zzzzoom_join_urls(missing)
+        expires_at = time.monotonic() + JOIN_URL_CACHE_TTL
+        for id, join_url in fetched.items():
+            _join_url_cache[id] = (expires_at, join_url)
+            _join_url_cache.move_to_end(id)
+        while len(_join_url_cache) > JOIN_URL_CACHE_MAX_SIZE:
+            _join_url_cache.popitem(last=False)
+        join_urls.update(fetched)
+    return join_urls
+
+
+def get_join_url_loader(context: MutableMapping) -> DataLoader[str, str]:
+    """Get the join URL loader for the current request, creating it if necessary."""
+    if "join_url_loader" not in context:
+        context["join_url_loader"] = DataLoader(load_join_urls)
+    return context["join_url_loader"]
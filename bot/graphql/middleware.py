@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from inspect import isawaitable
+from typing import Any
+
+from graphql import GraphQLResolveInfo
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ResolverTiming:
+    count: int = 0
+    total: float = 0.0  # seconds
+    max: float = 0.0  # seconds
+
+    def record(self, elapsed: float):
+        self.count += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+
+
+# "<parent type>.<field>" => timing
+resolver_timings: dict[str, ResolverTiming] = {}
+
+
+def _record(info: GraphQLResolveInfo, start: float):
+    elapsed = time.perf_counter() - start
+    name = f"{info.parent_type.name}.{info.field_name}"
+    resolver_timings.setdefault(name, ResolverTiming()).record(elapsed)
+    logger.debug(f"resolved {name} in {elapsed * 1000:.2f}ms")
+
+
+async def _await_and_record(result, info: GraphQLResolveInfo, start: float) -> Any:
+    try:
+        return await result
+    finally:
+        _record(info, start)
+
+
+def timing_middleware(resolver, obj, info: GraphQLResolveInfo, **args):
+    # Only root fields have custom resolvers; don't add overhead to every field
+    if info.parent_type is not info.schema.query_type:
+        return resolver(obj, info, **args)
+    start = time.perf_counter()
+    result = resolver(obj, info, **args)
+    if isawaitable(result):
+        return _await_and_record(result, info, start)
+    _record(info, start)
+    return result
+
+
+middleware = [timing_middleware]
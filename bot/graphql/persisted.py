@@ -0,0 +1,160 @@
+"""Cached query documents and Automatic Persisted Queries
+(https://www.apollographql.com/docs/apollo-server/performance/apq/).
+
+Parsed documents are cached by the sha256 hash of their query, along with the
+validation rules they've passed, so repeated queries skip parsing and validation.
+Clients may also send only the hash of a query that the server has seen before
+and resend the full query if the server responds with PersistedQueryNotFound.
+Requests are then executed with ariadne.graphql.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Collection, Type
+
+from ariadne import format_error, graphql
+from ariadne.graphql import handle_graphql_errors
+from ariadne.types import GraphQLResult
+from graphql import DocumentNode, GraphQLError, GraphQLSchema, TypeInfo, parse, validate
+from graphql.validation import ASTValidationRule
+
+MAX_PERSISTED_QUERIES = 128
+PERSISTED_QUERY_NOT_FOUND = "PERSISTED_QUERY_NOT_FOUND"
+
+
+@dataclass
+class CachedQuery:
+    query: str
+    document: DocumentNode
+    # (schema, rules) pairs that the document passed validation with
+    validated: set[tuple[GraphQLSchema, tuple]] = field(default_factory=set)
+
+
+# query hash => query
+_queries: OrderedDict[str, CachedQuery] = OrderedDict()
+
+
+def get_query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+def _get_persisted_query_hash(data: dict) -> str | None:
+    extensions = data.get("extensions") or {}
+    persisted_query = (
+        extensions.get("persistedQuery") if isinstance(extensions, dict) else None
+    )
+    if not persisted_query:
+        return None
+    if not isinstance(persisted_query, dict):
+        raise GraphQLError("Persisted query should be a JSON object")
+    query_hash = persisted_query.get("sha256Hash")
+    if not isinstance(query_hash, str):
+        raise GraphQLError("Persisted query hash must be a string")
+    return query_hash
+
+
+def resolve_persisted_query(data: Any) -> tuple[Any, str | None]:
+    """Return the request data with the persisted query filled in, along with the
+    hash its query is cached under, if any.
+    """
+    if not isinstance(data, dict):
+        # Let ariadne report malformed requests
+        return data, None
+    query = data.get("query")
+    query_hash = _get_persisted_query_hash(data)
+    if query_hash is None:
+        return data, get_query_hash(query) if query and isinstance(query, str) else None
+    if query is None:
+        cached = _queries.get(query_hash)
+        if cached is None:
+            raise GraphQLError(
+                "PersistedQueryNotFound",
+                extensions={"code": PERSISTED_QUERY_NOT_FOUND},
+            )
+        return {**data, "query": cached.query}, query_hash
+    if not isinstance(query, str) or query_hash != get_query_hash(query):
+        raise GraphQLError("Provided sha256Hash does not match query")
+    return data, query_hash
+
+
+def _store_query(query_hash: str, cached: CachedQuery):
+    _queries[query_hash] = cached
+    _queries.move_to_end(query_hash)
+    if len(_queries) > MAX_PERSISTED_QUERIES:
+        _queries.popitem(last=False)
+
+
+def _validate_cached(
+    cached: CachedQuery,
+    validate_query: Callable[..., list[GraphQLError]],
+    schema: GraphQLSchema,
+    document_ast: DocumentNode,
+    rules: Collection[Type[ASTValidationRule]] | None = None,
+    max_errors: int | None = None,
+    type_info: TypeInfo | None = None,
+) -> list[GraphQLError]:
+    # ariadne resolves callable validation rules and the introspection rule
+    #   before calling this, so the rules fully determine the outcome
+    key = (schema, tuple(rules or ()))
+    if key in cached.validated:
+        return []
+    errors = validate_query(
+        schema, document_ast, rules=rules, max_errors=max_errors, type_info=type_info
+    )
+    if not errors:
+        cached.validated.add(key)
+    return errors
+
+
+def is_persisted_query_not_found(result: dict) -> bool:
+    """Whether a client should resend the request with the full query.
+
+    Clients expect these errors to be sent with a 200 status.
+    """
+    return any(
+        (error.get("extensions") or {}).get("code") == PERSISTED_QUERY_NOT_FOUND
+        for error in result.get("errors") or ()
+    )
+
+
+async def execute_graphql(schema: GraphQLSchema, data: Any, **options) -> GraphQLResult:
+    """Like ariadne.graphql, but caches parsed and validated documents and also
+    accepts persisted query hashes.
+
+    Options are passed to ariadne.graphql.
+    """
+    try:
+        data, query_hash = resolve_persisted_query(data)
+    except GraphQLError as error:
+        return handle_graphql_errors(
+            [error],
+            logger=options.get("logger"),
+            error_formatter=options.get("error_formatter", format_error),
+            debug=options.get("debug", False),
+        )
+    # Documents from a custom parser can't be cached by query
+    if query_hash is None or options.get("query_parser") is not None:
+        return await graphql(schema, data, **options)
+    cached = _queries.get(query_hash)
+    if cached is None:
+        try:
+            cached = CachedQuery(query=data["query"], document=parse(data["query"]))
+        except GraphQLError:
+            # Let ariadne report syntax errors
+            return await graphql(schema, data, **options)
+    validate_query = options.pop("query_validator", None) or validate
+    success, result = await graphql(
+        schema,
+        data,
+        query_document=cached.document,
+        query_validator=functools.partial(_validate_cached, cached, validate_query),
+        **options,
+    )
+    # Only store queries that passed validation
+    if cached.validated:
+        _store_query(query_hash, cached)
+    return success, result
@@ -1,6 +1,6 @@
 from ariadne import QueryType
 
-from bot.database import store
+from .loaders import get_join_url_loader
 
 query = QueryType()
 
@@ -8,13 +8,10 @@ query = QueryType()
 @query.field("meeting")
 async def meeting_by_id(root, info, id):
     # TODO: handle DNE better
-    zzzzoom_meeting = await store.get_zzzzoom_meeting(id)
-    if not zzzzoom_meeting:
+    join_url = await get_join_url_loader(info.context).load(id)
+    if not join_url:
         return None
-    zoom_meeting = await store.get_zoom_meeting(zzzzoom_meeting["meeting_id"])
-    if not zoom_meeting:
-        return None
-    return {"url": zoom_meeting["join_url"]}
+    return {"url": join_url}
 
 
 types = [query]
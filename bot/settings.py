@@ -11,6 +11,22 @@ env.read_env()
 DEBUG = env.bool("DEBUG", False)
 DATABASE_URL = DatabaseURL(env.str("DATABASE_URL", required=True))
 TEST_DATABASE_URL = DATABASE_URL.replace(database="test_" + DATABASE_URL.database)
+# Optional read replica for read-only queries that can tolerate replication lag
+DATABASE_REPLICA_URL = env.str("DATABASE_REPLICA_URL", default=None)
+DATABASE_POOL_MIN_SIZE = env.int("DATABASE_POOL_MIN_SIZE", 2)
+DATABASE_POOL_MAX_SIZE = env.int("DATABASE_POOL_MAX_SIZE", 10)
+# Seconds to wait for a free connection before giving up
+DATABASE_POOL_ACQUIRE_TIMEOUT = env.float("DATABASE_POOL_ACQUIRE_TIMEOUT", 10)
+# Seconds to wait when opening a new connection
+DATABASE_CONNECT_TIMEOUT = env.float("DATABASE_CONNECT_TIMEOUT", 10)
+# Seconds before a statement is cancelled
+DATABASE_STATEMENT_TIMEOUT = env.float("DATABASE_STATEMENT_TIMEOUT", 30)
+# Prepared statements that asyncpg keeps per connection
+DATABASE_STATEMENT_CACHE_SIZE = env.int("DATABASE_STATEMENT_CACHE_SIZE", 100)
+# Connections are replaced after this many queries...
+DATABASE_POOL_MAX_QUERIES = env.int("DATABASE_POOL_MAX_QUERIES", 50000)
+# ...and closed after being idle for this many seconds
+DATABASE_POOL_MAX_IDLE_TIME = env.float("DATABASE_POOL_MAX_IDLE_TIME", 300)
 TESTING = env.bool("TESTING", cast=bool, default=False)
 LOG_LEVEL = env.log_level("LOG_LEVEL", logging.INFO)
 DISCORD_TOKEN = env.str("DISCORD_TOKEN", required=True)
@@ -27,6 +43,14 @@ PRESENCE_ACTIVITY = env.str(
     default=None,
 )
 PRESENCE_CONTENT = env.str("PRESENCE_CONTENT", default=None)
+# Log callbacks that block the event loop for longer than this many seconds
+SLOW_CALLBACK_THRESHOLD = env.float("SLOW_CALLBACK_THRESHOLD", 0.25)
+# Log database statements that take longer than this many seconds
+SLOW_QUERY_THRESHOLD = env.float("SLOW_QUERY_THRESHOLD", 0.1)
+# Bearer token that scrapers must send to read /metrics. /metrics is disabled if unset.
+METRICS_TOKEN = env.str("METRICS_TOKEN", default=None)
+# Detach star log partitions older than this many months. Keep all if unset.
+STAR_LOG_RETENTION_MONTHS = env.int("STAR_LOG_RETENTION_MONTHS", default=None)
 
 GOOGLE_PROJECT_ID = env.str("GOOGLE_PROJECT_ID", required=True)
 GOOGLE_PRIVATE_KEY = env.str("GOOGLE_PRIVATE_KEY", required=True)
@@ -57,6 +81,8 @@ SIGN_CAFE_HEARING_SPECTRUM_ROLE_IDS = env.list(
 SIGN_CAFE_AGE_ROLE_IDS = env.list("SIGN_CAFE_AGE_ROLE_IDS", subcast=int)
 SIGN_CAFE_ENABLE_UNMUTE_WARNING = env.bool("SIGN_CAFE_ENABLE_UNMUTE_WARNING", True)
 SIGN_CAFE_ENABLE_STARS = env.bool("SIGN_CAFE_ENABLE_STARS", True)
+# Serve the star leaderboard and ranks from memory rather than querying Postgres
+STARS_LEADERBOARD_IN_MEMORY = env.bool("STARS_LEADERBOARD_IN_MEMORY", True)
 SIGN_CAFE_INACTIVE_DAYS = env.int("SIGN_CAFE_INACTIVE_DAYS", 30)
 SIGN_CAFE_PRUNE_DAYS = env.int("SIGN_CAFE_PRUNE_DAYS", 30)
 SIGN_CAFE_ZOOM_WATCH_LIST = env.list("SIGN_CAFE_ZOOM_WATCH_LIST", default=[], subcast=str)
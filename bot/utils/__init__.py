@@ -1,6 +1,5 @@
-import difflib
 import re
-from typing import Optional, Sequence, Tuple
+from typing import Optional, Tuple
 
 _spoiler_pattern = re.compile(r"\s*\|\|\s*(.*)\s*\|\|\s*")
 _quotes_pattern = re.compile(r"[\"“](.*?)[\"”]")
@@ -28,14 +27,3 @@ def truncate(s: str, max_len: int, *, trailing: str = "…"):
     if len(s) > max_len:
         return f"{s[:max_len]}{trailing}"
     return s
-
-
-def get_close_matches(word: str, possibilities: Sequence[str]) -> Sequence[str]:
-    return difflib.get_close_matches(word, possibilities, n=1, cutoff=0.5)
-
-
-def did_you_mean(word: str, possibilities: Sequence[str]) -> Optional[str]:
-    try:
-        return get_close_matches(word, possibilities)[0]
-    except IndexError:
-        return None
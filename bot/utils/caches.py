@@ -0,0 +1,37 @@
+"""Registry of in-process caches so their stats can be reported (see ?stats)."""
+
+from __future__ import annotations
+
+from typing import Callable, NamedTuple, TypeVar
+
+F = TypeVar("F", bound=Callable)
+
+_caches: dict[str, Callable] = {}
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+def register_cache(name: str) -> Callable[[F], F]:
+    """Decorator that registers a functools.lru_cache-wrapped function under `name`.
+
+    Must be applied on top of lru_cache.
+    """
+
+    def decorator(func: F) -> F:
+        assert hasattr(func, "cache_info"), "register_cache must wrap an lru_cache"
+        _caches[name] = func
+        return func
+
+    return decorator
+
+
+def get_cache_stats() -> dict[str, CacheInfo]:
+    return {
+        name: CacheInfo(*func.cache_info())  # type: ignore[attr-defined]
+        for name, func in _caches.items()
+    }
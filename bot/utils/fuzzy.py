@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import bisect
+import difflib
+import heapq
+from collections import Counter, defaultdict
+from typing import Iterable
+
+# Length of the character n-grams used to find candidate matches
+NGRAM_SIZE = 3
+# Number of n-gram candidates that are re-scored with difflib
+MAX_CANDIDATES = 20
+
+
+def _normalize(word: str) -> str:
+    return word.strip().lower()
+
+
+def _ngrams(key: str) -> set[str]:
+    # Pad so that short words and word boundaries produce n-grams
+    padded = f"{' ' * (NGRAM_SIZE - 1)}{key} "
+    return {padded[i : i + NGRAM_SIZE] for i in range(len(padded) - NGRAM_SIZE + 1)}
+
+
+class FuzzyIndex:
+    """Case-insensitive index over a fixed set of words for suggestions and autocomplete.
+
+    Fuzzy matches are found through an n-gram index and ranked with the same
+    similarity ratio as difflib.get_close_matches. Prefix matches use binary search
+    over the sorted keys.
+    """
+
+    def __init__(self, words: Iterable[str]):
+        # normalized key => original word; the first word wins on collisions
+        self._words: dict[str, str] = {}
+        for word in words:
+            self._words.setdefault(_normalize(word), word)
+        self._sorted_keys = sorted(self._words)
+        self._key_ngrams = {key: _ngrams(key) for key in self._words}
+        self._ngram_index: dict[str, list[str]] = defaultdict(list)
+        for key, ngrams in self._key_ngrams.items():
+            for ngram in ngrams:
+                self._ngram_index[ngram].append(key)
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and _normalize(word) in self._words
+
+    def __iter__(self):
+        return iter(self._words.values())
+
+    def get(self, word: str) -> str | None:
+        """Return the indexed word matching `word` case-insensitively."""
+        return self._words.get(_normalize(word))
+
+    def prefix_matches(self, prefix: str, *, limit: int = 25) -> list[str]:
+        """Return words starting with `prefix`, shortest first."""
+        prefix = _normalize(prefix)
+        start = bisect.bisect_left(self._sorted_keys, prefix)
+        keys = []
+        for key in self._sorted_keys[start:]:
+            if not key.startswith(prefix):
+                break
+            keys.append(key)
+        keys.sort(key=len)  # stable, so ties stay alphabetical
+        return [self._words[key] for key in keys[:limit]]
+
+    def close_matches(
+        self, word: str, *, limit: int = 1, cutoff: float = 0.5
+    ) -> list[str]:
+        """Return up to `limit` words similar to `word`, best match first."""
+        key = _normalize(word)
+        if not key:
+            return []
+        ngrams = _ngrams(key)
+        shared: Counter[str] = Counter()
+        for ngram in ngrams:
+            shared.update(self._ngram_index.get(ngram, ()))
+        # Shortlist by Dice coefficient of the n-gram sets
+        candidates = heapq.nlargest(
+            MAX_CANDIDATES,
+            shared,
+            key=lambda candidate: (
+                2 * shared[candidate] / (len(ngrams) + len(self._key_ngrams[candidate]))
+            ),
+        )
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(key)
+        scored = []
+        for candidate in candidates:
+            matcher.set_seq1(candidate)
+            if (
+                matcher.real_quick_ratio() >= cutoff
+                and matcher.quick_ratio() >= cutoff
+                and matcher.ratio() >= cutoff
+            ):
+                scored.append((matcher.ratio(), candidate))
+        return [self._words[key] for _, key in heapq.nlargest(limit, scored)]
+
+    def did_you_mean(self, word: str) -> str | None:
+        matches = self.close_matches(word, limit=1)
+        return matches[0] if matches else None
+
+    def autocomplete(self, text: str, *, limit: int = 25) -> list[str]:
+        """Return suggestions for partially-typed `text`.
+
+        Prefix matches come first, followed by close matches.
+        """
+        if not _normalize(text):
+            return list(self._words.values())[:limit]
+        results = self.prefix_matches(text, limit=limit)
+        if len(results) < limit:
+            for match in self.close_matches(text, limit=limit - len(results)):
+                if match not in results:
+                    results.append(match)
+        return results
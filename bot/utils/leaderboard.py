@@ -0,0 +1,75 @@
+"""In-memory leaderboard with rank lookups."""
+
+from __future__ import annotations
+
+import bisect
+from typing import NamedTuple
+
+
+class Entry(NamedTuple):
+    key: int
+    score: int
+
+
+class Leaderboard:
+    """Entries ordered by score (highest first), then key.
+
+    Rank and neighbor lookups are O(log n) binary searches. Updates shift the
+    underlying list, which is a fast memmove for the few thousand entries
+    we keep.
+
+    Ranks are "competition" ranks: entries with the same score share a rank,
+    and the next rank is skipped (1, 2, 2, 4).
+    """
+
+    def __init__(self, entries: dict[int, int] | None = None):
+        self._scores: dict[int, int] = {}
+        # Sorted (-score, key) pairs
+        self._order: list[tuple[int, int]] = []
+        if entries:
+            self._scores = {key: score for key, score in entries.items() if score > 0}
+            self._order = sorted((-score, key) for key, score in self._scores.items())
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._scores
+
+    def get(self, key: int) -> int:
+        return self._scores.get(key, 0)
+
+    def set(self, key: int, score: int):
+        """Set the score for `key`. Entries with no score are removed."""
+        current = self._scores.get(key)
+        if current == score:
+            return
+        if current is not None:
+            del self._order[bisect.bisect_left(self._order, (-current, key))]
+            del self._scores[key]
+        if score > 0:
+            bisect.insort(self._order, (-score, key))
+            self._scores[key] = score
+
+    def top(self, limit: int) -> list[Entry]:
+        return [Entry(key, -score) for score, key in self._order[:limit]]
+
+    def rank(self, key: int) -> int | None:
+        """Return the rank of `key` (starting at 1), or None if it has no score."""
+        score = self._scores.get(key)
+        if score is None:
+            return None
+        return bisect.bisect_left(self._order, (-score,)) + 1
+
+    def neighbors(self, key: int, n: int) -> tuple[list[Entry], list[Entry]]:
+        """Return up to `n` entries ordered directly above and below `key`."""
+        score = self._scores.get(key)
+        if score is None:
+            return [], []
+        index = bisect.bisect_left(self._order, (-score, key))
+        above = self._order[max(index - n, 0) : index]
+        below = self._order[index + 1 : index + 1 + n]
+        return (
+            [Entry(key, -score) for score, key in above],
+            [Entry(key, -score) for score, key in below],
+        )
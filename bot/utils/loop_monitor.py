@@ -0,0 +1,143 @@
+"""Detect code that blocks the event loop.
+
+A heartbeat task wakes up every `interval` seconds and records how late it ran.
+Meanwhile, a watchdog thread samples the event loop thread's stack whenever the
+heartbeat is overdue, so that stalls can be traced back to the code that caused them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from pathlib import Path
+
+from bot import settings
+
+from .metrics import event_loop_lag, slow_callbacks
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_INTERVAL = 0.1  # seconds
+STACK_SAMPLE_LIMIT = 20  # frames
+MAX_OFFENDERS = 100
+
+# Frames from the project are preferred when locating the source of a stall
+PROJECT_ROOT = str(Path(__file__).parent.parent.parent)
+THIS_FILE = str(Path(__file__))
+
+
+@dataclass
+class SlowCallback:
+    location: str
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    # Stack sample from the longest stall
+    stack: str = ""
+
+
+def get_location(frames: traceback.StackSummary) -> str:
+    """Return a short description of the innermost project frame in a stack sample."""
+    project_frames = [
+        frame
+        for frame in frames
+        if frame.filename.startswith(PROJECT_ROOT)
+        and frame.filename != THIS_FILE
+        and "site-packages" not in frame.filename
+    ]
+    frame = project_frames[-1] if project_frames else frames[-1]
+    filename = frame.filename
+    if filename.startswith(PROJECT_ROOT):
+        filename = filename[len(PROJECT_ROOT) :].lstrip("/")
+    return f"{filename}:{frame.lineno} in {frame.name}"
+
+
+class LoopMonitor:
+    def __init__(
+        self,
+        *,
+        interval: float = HEARTBEAT_INTERVAL,
+        threshold: float = settings.SLOW_CALLBACK_THRESHOLD,
+    ):
+        self.interval = interval
+        self.threshold = threshold
+        self.offenders: dict[str, SlowCallback] = {}
+        self._last_beat = time.monotonic()
+        # (heartbeat time, stack) captured by the watchdog thread during a stall
+        self._sample: tuple[float, traceback.StackSummary] | None = None
+        self._task: asyncio.Task | None = None
+        self._stopped = threading.Event()
+
+    def start(self):
+        """Start monitoring the running event loop."""
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.get_running_loop().create_task(self._heartbeat())
+        threading.Thread(target=self._watch, name="loop-monitor", daemon=True).start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._task:
+            self._task.cancel()
+
+    async def _heartbeat(self):
+        while True:
+            beat = self._last_beat = time.monotonic()
+            await asyncio.sleep(self.interval)
+            lag = max(time.monotonic() - beat - self.interval, 0.0)
+            event_loop_lag.observe(lag)
+            if lag >= self.threshold:
+                sample = self._sample
+                stack = sample[1] if sample and sample[0] == beat else None
+                self._record(lag, stack)
+
+    def _watch(self):
+        # Sample at half the threshold so that any stall long enough to be
+        #   recorded is sampled while it is still happening
+        wait = self.threshold / 2
+        while not self._stopped.wait(wait / 2):
+            beat = self._last_beat
+            overdue = time.monotonic() - beat - self.interval
+            if overdue < wait or (self._sample and self._sample[0] == beat):
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is not None:
+                self._sample = (beat, traceback.extract_stack(frame))
+
+    def _record(self, lag: float, stack: traceback.StackSummary | None):
+        slow_callbacks.inc()
+        if stack:
+            location = get_location(stack)
+            formatted_stack = "".join(traceback.format_list(stack[-STACK_SAMPLE_LIMIT:]))
+        else:
+            location = "unknown (no stack sample)"
+            formatted_stack = ""
+        logger.warning(
+            f"event loop was blocked for {lag:.3f}s at {location}\n{formatted_stack}"
+        )
+        offender = self.offenders.get(location)
+        if offender is None:
+            if len(self.offenders) >= MAX_OFFENDERS:
+                least = min(self.offenders.values(), key=lambda each: each.max)
+                del self.offenders[least.location]
+            offender = self.offenders[location] = SlowCallback(location=location)
+        offender.count += 1
+        offender.total += lag
+        if lag > offender.max:
+            offender.max = lag
+            offender.stack = formatted_stack
+
+    def get_worst_offenders(self, limit: int = 10) -> list[SlowCallback]:
+        """Return the locations with the longest stalls since startup."""
+        return sorted(self.offenders.values(), key=lambda each: each.max, reverse=True)[
+            :limit
+        ]
+
+
+loop_monitor = LoopMonitor()
@@ -0,0 +1,110 @@
+"""Shared cache of Discord messages fetched by reaction handlers.
+
+Several cogs handle the same raw reaction events, and each of them needs the
+reacted-to message. Messages are cached by ID, and concurrent fetches for the
+same message share a single request, which runs in its own task.
+
+Messages in disnake's own message cache (which includes messages the bot has
+sent) are used as-is. Fetched messages are dropped when they're edited or deleted
+(see the listeners in bot.bot), but not when they're reacted to, so their reactions
+may be out of date; callers that need current reactions pass `refresh=True`. A
+fetch that is in flight when a message is invalidated isn't cached or shared with
+later callers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from collections import OrderedDict
+
+import disnake
+from disnake.ext.commands import Bot
+
+from .metrics import track_outbound
+
+MAX_MESSAGES = 512
+
+
+class MessageCache:
+    def __init__(self, maxsize: int = MAX_MESSAGES):
+        self.maxsize = maxsize
+        self._messages: OrderedDict[int, disnake.Message] = OrderedDict()
+        self._in_flight: dict[int, asyncio.Task[disnake.Message]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def get(self, message_id: int) -> disnake.Message | None:
+        message = self._messages.get(message_id)
+        if message is not None:
+            self._messages.move_to_end(message_id)
+        return message
+
+    def put(self, message: disnake.Message):
+        self._messages[message.id] = message
+        self._messages.move_to_end(message.id)
+        if len(self._messages) > self.maxsize:
+            self._messages.popitem(last=False)
+
+    def invalidate(self, message_id: int):
+        self._messages.pop(message_id, None)
+        # Later callers start a new fetch instead of waiting for a stale result
+        self._in_flight.pop(message_id, None)
+
+    async def fetch(
+        self,
+        bot: Bot,
+        channel: disnake.abc.Messageable,
+        message_id: int,
+        *,
+        refresh: bool = False,
+    ) -> disnake.Message:
+        """Return a message from the cache, fetching it if needed.
+
+        If `refresh` is set, a previously fetched copy isn't used. A fetch that's
+        already in flight is still shared, so a reaction made while it was running
+        may be missing from the result.
+
+        Raises the same exceptions as `channel.fetch_message`.
+        """
+        if refresh:
+            self._messages.pop(message_id, None)
+        # Messages in disnake's cache are kept up to date by the library
+        message = bot.get_message(message_id) or self.get(message_id)
+        if message is not None:
+            self.hits += 1
+            return message
+        task = self._in_flight.get(message_id)
+        if task is None:
+            self.misses += 1
+            task = self._in_flight[message_id] = asyncio.ensure_future(
+                self._fetch(channel, message_id)
+            )
+            task.add_done_callback(functools.partial(self._on_fetched, message_id))
+        else:
+            self.hits += 1
+        # Shielded so that a cancelled caller doesn't cancel the fetch for everyone else
+        return await asyncio.shield(task)
+
+    async def _fetch(
+        self, channel: disnake.abc.Messageable, message_id: int
+    ) -> disnake.Message:
+        with track_outbound("discord", "fetch_message"):
+            message = await channel.fetch_message(message_id)
+        # Don't cache the message if it changed while it was being fetched
+        if self._in_flight.get(message_id) is asyncio.current_task():
+            self.put(message)
+        return message
+
+    def _on_fetched(self, message_id: int, task: asyncio.Task):
+        if self._in_flight.get(message_id) is task:
+            del self._in_flight[message_id]
+        # Mark the exception as retrieved in case nobody is waiting anymore
+        if not task.cancelled():
+            task.exception()
+
+
+message_cache = MessageCache()
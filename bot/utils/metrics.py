@@ -0,0 +1,327 @@
+"""In-process metrics rendered in the Prometheus text exposition format.
+
+Metrics are served at /metrics (see bot.app) so that they can be scraped
+without running a separate metrics service. Scrapers authenticate with
+settings.METRICS_TOKEN.
+"""
+
+from __future__ import annotations
+
+import abc
+import bisect
+import contextlib
+import math
+import time
+from typing import Callable, Iterator
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_metrics: dict[str, Metric] = {}
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values)
+    )
+    return f"{{{pairs}}}"
+
+
+class Metric(abc.ABC):
+    type: str
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        assert name not in _metrics, f"metric {name!r} is already registered"
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._children: dict[tuple[str, ...], object] = {}
+        _metrics[name] = self
+
+    @abc.abstractmethod
+    def _new_child(self):
+        """Return a new child metric for a set of label values."""
+
+    def labels(self, *values: object):
+        """Return the child metric for the given label values."""
+        assert len(values) == len(self.labelnames), "incorrect number of label values"
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children[key] = self._new_child()
+        return child
+
+    @abc.abstractmethod
+    def _samples(self) -> Iterator[tuple[str, str, float]]:
+        """Yield (suffix, formatted labels, value) for each sample."""
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type}",
+        ]
+        for suffix, labels, value in self._samples():
+            lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+        return "\n".join(lines)
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1):
+        assert amount >= 0, "counters can only increase"
+        self.value += amount
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1):
+        self.labels().inc(amount)
+
+    def _samples(self):
+        for key, child in self._children.items():
+            yield "_total", _format_labels(self.labelnames, key), child.value
+
+
+class _GaugeChild:
+    __slots__ = ("value", "function")
+
+    def __init__(self):
+        self.value = 0.0
+        self.function: Callable[[], float] | None = None
+
+    def set(self, value: float):
+        self.value = value
+
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+    def dec(self, amount: float = 1):
+        self.value -= amount
+
+    def set_function(self, function: Callable[[], float]):
+        """Compute the gauge's value when metrics are collected."""
+        self.function = function
+
+    @contextlib.contextmanager
+    def track_inprogress(self):
+        self.inc()
+        try:
+            yield
+        finally:
+            self.dec()
+
+    def get(self) -> float:
+        return self.function() if self.function is not None else self.value
+
+
+class Gauge(Metric):
+    type = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value: float):
+        self.labels().set(value)
+
+    def inc(self, amount: float = 1):
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1):
+        self.labels().dec(amount)
+
+    def set_function(self, function: Callable[[], float]):
+        self.labels().set_function(function)
+
+    def track_inprogress(self):
+        return self.labels().track_inprogress()
+
+    def _samples(self):
+        for key, child in self._children.items():
+            yield "", _format_labels(self.labelnames, key), child.get()
+
+
+class _HistogramChild:
+    __slots__ = ("upper_bounds", "counts", "sum")
+
+    def __init__(self, upper_bounds: tuple[float, ...]):
+        self.upper_bounds = upper_bounds
+        self.counts = [0] * len(upper_bounds)
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.sum += value
+        self.counts[bisect.bisect_left(self.upper_bounds, value)] += 1
+
+    @contextlib.contextmanager
+    def time(self):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        *,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.upper_bounds = tuple(sorted(buckets)) + (math.inf,)
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return _HistogramChild(self.upper_bounds)
+
+    def observe(self, value: float):
+        self.labels().observe(value)
+
+    def time(self):
+        return self.labels().time()
+
+    def _samples(self):
+        labelnames = self.labelnames + ("le",)
+        for key, child in self._children.items():
+            cumulative = 0
+            for upper_bound, count in zip(child.upper_bounds, child.counts):
+                cumulative += count
+                labels = _format_labels(labelnames, key + (_format_value(upper_bound),))
+                yield "_bucket", labels, cumulative
+            labels = _format_labels(self.labelnames, key)
+            yield "_sum", labels, child.sum
+            yield "_count", labels, cumulative
+
+
+def render() -> str:
+    """Return all registered metrics in the Prometheus text format."""
+    return "\n".join(metric.render() for metric in _metrics.values()) + "\n"
+
+
+# Metrics shared across the bot
+# -----------------------------
+
+command_duration = Histogram(
+    "bot_command_duration_seconds",
+    "Time spent handling prefix and slash commands.",
+    ("type", "command", "status"),
+)
+db_query_duration = Histogram(
+    "bot_db_query_duration_seconds",
+    "Time spent in Store methods.",
+    ("method",),
+)
+db_query_rows = Counter(
+    "bot_db_query_rows",
+    "Rows returned to Store methods.",
+    ("method",),
+)
+db_slow_queries = Counter(
+    "bot_db_slow_queries",
+    "Statements that took longer than the slow query threshold.",
+    ("method",),
+)
+db_pool_size = Gauge(
+    "bot_db_pool_size",
+    "Open database connections.",
+    ("database",),
+)
+db_pool_in_use = Gauge(
+    "bot_db_pool_in_use",
+    "Database connections that are checked out of the pool.",
+    ("database",),
+)
+db_pool_waiting = Gauge(
+    "bot_db_pool_waiting",
+    "Callers waiting for a database connection.",
+    ("database",),
+)
+db_pool_acquire_duration = Histogram(
+    "bot_db_pool_acquire_duration_seconds",
+    "Time spent waiting for a database connection.",
+    ("database",),
+)
+db_pool_acquire_timeouts = Counter(
+    "bot_db_pool_acquire_timeouts",
+    "Attempts to get a database connection that timed out.",
+    ("database",),
+)
+outbound_request_duration = Histogram(
+    "bot_outbound_request_duration_seconds",
+    "Latency of requests to external services.",
+    ("service", "operation"),
+)
+outbound_request_errors = Counter(
+    "bot_outbound_request_errors",
+    "Failed requests to external services.",
+    ("service", "operation"),
+)
+webhook_queue_depth = Gauge(
+    "bot_webhook_queue_depth",
+    "Webhook events accepted but not yet handled.",
+    ("source",),
+)
+event_loop_lag = Histogram(
+    "bot_event_loop_lag_seconds",
+    "How late the event loop woke up a periodic sleep.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+background_tasks = Gauge(
+    "bot_background_tasks",
+    "Background tasks that are running or waiting to run.",
+    ("category",),
+)
+background_task_errors = Counter(
+    "bot_background_task_errors",
+    "Background tasks that raised an exception.",
+    ("category",),
+)
+slow_callbacks = Counter(
+    "bot_slow_callbacks",
+    "Event loop stalls longer than the slow callback threshold.",
+)
+
+
+@contextlib.contextmanager
+def track_outbound(service: str, operation: str):
+    """Time a request to an external service, counting it as an error if it raises.
+
+    Works around both blocking calls and awaits.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        outbound_request_errors.labels(service, operation).inc()
+        raise
+    finally:
+        outbound_request_duration.labels(service, operation).observe(
+            time.perf_counter() - start
+        )
@@ -0,0 +1,54 @@
+"""Per-method statistics for Store queries (see ?dbstats)."""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+
+# Number of recent calls per method used to compute latency percentiles
+RECENT_CALLS = 1024
+
+
+class MethodStats:
+    __slots__ = ("name", "count", "errors", "rows", "total_time", "_durations")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.errors = 0
+        self.rows = 0
+        self.total_time = 0.0
+        self._durations: deque[float] = deque(maxlen=RECENT_CALLS)
+
+    def record(self, duration: float, *, error: bool = False):
+        self.count += 1
+        self.errors += error
+        self.total_time += duration
+        self._durations.append(duration)
+
+    def percentile(self, q: float) -> float:
+        """Return the `q`th percentile (0-100) of recent call durations."""
+        if not self._durations:
+            return 0.0
+        durations = sorted(self._durations)
+        # Nearest-rank method
+        rank = max(math.ceil(q / 100 * len(durations)), 1)
+        return durations[rank - 1]
+
+
+_stats: dict[str, MethodStats] = {}
+
+
+def get_method_stats(name: str) -> MethodStats:
+    if name not in _stats:
+        _stats[name] = MethodStats(name)
+    return _stats[name]
+
+
+def get_all_method_stats() -> list[MethodStats]:
+    """Return stats for methods that have been called, most total time first."""
+    return sorted(
+        (stats for stats in _stats.values() if stats.count),
+        key=lambda stats: stats.total_time,
+        reverse=True,
+    )
@@ -1,17 +1,37 @@
 import logging
 import re
 from contextlib import suppress
-from typing import Awaitable, Callable, Iterable, Mapping, Optional, Union, cast
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Union,
+    cast,
+)
 
 import disnake
 from disnake.ext.commands import Bot
 
+from .message_cache import message_cache
+
 logger = logging.getLogger(__name__)
 
 STOP_SIGN = "🛑"
 
 
-async def maybe_clear_reaction(message: disnake.Message, emoji: str, *, log: bool = True):
+async def maybe_clear_reaction(
+    message: Union[disnake.Message, disnake.PartialMessage],
+    emoji: str,
+    *,
+    log: bool = True,
+):
     try:
         await message.clear_reaction(emoji)
     except Exception:
@@ -19,7 +39,12 @@ async def maybe_clear_reaction(message: disnake.Message, emoji: str, *, log: boo
             logger.exception("could not remove reaction")
 
 
-async def maybe_add_reaction(message: disnake.Message, emoji: str, *, log: bool = False):
+async def maybe_add_reaction(
+    message: Union[disnake.Message, disnake.PartialMessage],
+    emoji: str,
+    *,
+    log: bool = False,
+):
     try:
         await message.add_reaction(emoji)
     except Exception:
@@ -34,13 +59,17 @@ async def add_stop_sign(message: disnake.Message):
 async def get_reaction_message(
     bot: Bot,
     payload: disnake.RawReactionActionEvent,
+    *,
+    refresh: bool = False,
 ) -> Optional[disnake.Message]:
     message = None
     with suppress(disnake.NotFound):
         channel = cast(disnake.TextChannel, bot.get_channel(payload.channel_id))
         if not channel:
             return None
-        message = await channel.fetch_message(payload.message_id)
+        message = await message_cache.fetch(
+            bot, channel, payload.message_id, refresh=refresh
+        )
     return message
 
 
@@ -51,56 +80,169 @@ def reactor_is_human(bot: Bot, payload: disnake.RawReactionActionEvent) -> bool:
     return not bool(getattr(member, "bot", None))
 
 
-def should_handle_reaction(
-    bot: Bot, payload: disnake.RawReactionActionEvent, emojis: Iterable[str]
-) -> bool:
-    # Is this a control emoji?
-    if str(payload.emoji) not in emojis:
-        return False
-    # Was the message sent in a channel (not a DM)?
-    if not payload.channel_id:
-        return False
-    if not reactor_is_human(bot, payload):
-        return False
-    return True
+ReactionHandler = Callable[
+    [disnake.RawReactionActionEvent, disnake.Message], Awaitable[None]
+]
+ReactionPredicate = Callable[[disnake.RawReactionActionEvent], bool]
+
+REACTION_ADD = "REACTION_ADD"
+REACTION_REMOVE = "REACTION_REMOVE"
+
+
+class _Registration(NamedTuple):
+    handler: ReactionHandler
+    events: FrozenSet[str]
+    predicate: Optional[ReactionPredicate]
+    own_messages_only: bool
+    current_reactions: bool
+    owner: object
+
+
+class ReactionDispatcher:
+    """Routes raw reaction events to handlers registered by emoji.
+
+    Handlers are called with the event and the reacted-to message. Events
+    from bots, in DMs, and for emojis that no handler is registered for are
+    dropped before the message is fetched, and the message is fetched once
+    no matter how many handlers are interested in it.
+    """
+
+    def __init__(self):
+        self._registrations: Dict[str, List[_Registration]] = {}
+
+    def register(
+        self,
+        emojis: Iterable[str],
+        handler: ReactionHandler,
+        *,
+        events: Iterable[str] = (REACTION_ADD,),
+        predicate: Optional[ReactionPredicate] = None,
+        own_messages_only: bool = False,
+        current_reactions: bool = False,
+        owner: object = None,
+    ):
+        """Call `handler` for `events` on any of `emojis`.
+
+        `predicate` is checked before the message is fetched. If `own_messages_only`
+        is set, the handler is only called for messages sent by the bot. Set
+        `current_reactions` if the handler reads the message's reactions, which
+        aren't kept up to date on cached messages. Pass a cog as `owner` so that
+        its handlers can be unregistered when it's unloaded.
+        """
+        registration = _Registration(
+            handler=handler,
+            events=frozenset(events),
+            predicate=predicate,
+            own_messages_only=own_messages_only,
+            current_reactions=current_reactions,
+            owner=owner,
+        )
+        for emoji in emojis:
+            self._registrations.setdefault(emoji, []).append(registration)
+
+    def unregister(self, owner: object):
+        for emoji, registrations in list(self._registrations.items()):
+            registrations = [each for each in registrations if each.owner is not owner]
+            if registrations:
+                self._registrations[emoji] = registrations
+            else:
+                del self._registrations[emoji]
+
+    def _get_registrations(
+        self, payload: disnake.RawReactionActionEvent
+    ) -> List[_Registration]:
+        return [
+            registration
+            for registration in self._registrations.get(str(payload.emoji), ())
+            if payload.event_type in registration.events
+            and (registration.predicate is None or registration.predicate(payload))
+        ]
+
+    async def dispatch(self, bot: Bot, payload: disnake.RawReactionActionEvent):
+        registrations = self._get_registrations(payload)
+        if not registrations:
+            return
+        # Was the message sent in a channel (not a DM)?
+        if not payload.channel_id:
+            return
+        if not reactor_is_human(bot, payload):
+            return
+        message = await get_reaction_message(
+            bot,
+            payload,
+            refresh=any(registration.current_reactions for registration in registrations),
+        )
+        if not message:
+            return
+        is_own_message = message.author.id == bot.user.id
+        for registration in registrations:
+            if registration.own_messages_only and not is_own_message:
+                continue
+            try:
+                await registration.handler(payload, message)
+            except Exception:
+                logger.exception(
+                    f"error in reaction handler {registration.handler.__qualname__}"
+                )
+
+
+reaction_dispatcher = ReactionDispatcher()
+
+
+CloseMessage = Union[str, Callable[[disnake.Message], Awaitable[str]]]
+
+
+class CloseMessages:
+    """Messages to replace a room's message with when it's closed, keyed by
+    a regex that identifies the room's message. Earlier entries take precedence.
+
+    The patterns are compiled into a single alternation, so each piece of
+    text in a message is scanned once no matter how many entries there are.
+    """
+
+    def __init__(self, close_messages: Mapping[str, CloseMessage]):
+        self._close_messages = list(close_messages.values())
+        # Each entry is wrapped in a lookahead so that matches don't consume any text,
+        #   which would hide matches for other entries that overlap them
+        self._pattern = re.compile(
+            "|".join(
+                f"(?=(?P<close{i}>{pattern}))" for i, pattern in enumerate(close_messages)
+            )
+        )
+
+    def _get_texts(self, message: disnake.Message) -> Iterator[str]:
+        for embed in message.embeds:
+            if embed.title:
+                yield embed.title
+            for field in embed.fields:
+                if field.name:
+                    yield field.name
+        yield message.content
+
+    def match(self, message: disnake.Message) -> Optional[CloseMessage]:
+        """Return the close message for the first entry whose pattern is found in
+        the message's embed titles, embed field names, or content.
+        """
+        best = None
+        for text in self._get_texts(message):
+            # Every position is checked since a later entry can match earlier in the text
+            for match in self._pattern.finditer(text):
+                # The entry's group closes after any groups within its pattern
+                index = int(cast(str, match.lastgroup)[len("close") :])
+                if index == 0:
+                    return self._close_messages[0]
+                if best is None or index < best:
+                    best = index
+        return None if best is None else self._close_messages[best]
 
 
 async def handle_close_reaction(
-    bot: Bot,
-    payload: disnake.RawReactionActionEvent,
-    *,
-    close_messages: Mapping[str, Union[str, Callable[[disnake.Message], Awaitable]]],
-    emoji: str = STOP_SIGN,
+    message: disnake.Message, *, close_messages: CloseMessages
 ) -> None:
-    if not should_handle_reaction(bot, payload, {emoji}):
-        return
-    message = await get_reaction_message(bot, payload)
-    if not message:
+    close_message = close_messages.match(message)
+    if close_message is None:
         return
-    # Was the message sent by the bot?
-    if message.author.id != bot.user.id:
-        return
-
-    for pattern, close_message in close_messages.items():
-        # Scan the message for the pattern and replace it with close_message if found
-        if message.embeds:
-            for embed in message.embeds:
-                if embed.title and re.search(pattern, embed.title):
-                    if callable(close_message):
-                        close_message = await close_message(message)
-                    logger.info(f"cleaning up room with message: {close_message}")
-                    await message.edit(content=close_message, embed=None, view=None)
-                    return
-                for field in embed.fields:
-                    if field.name and re.search(pattern, field.name):  # type: ignore
-                        if callable(close_message):
-                            close_message = await close_message(message)
-                        logger.info(f"cleaning up room with message: {close_message}")
-                        await message.edit(content=close_message, embed=None, view=None)
-                        return
-        if re.search(pattern, message.content):
-            if callable(close_message):
-                close_message = await close_message(message)
-            logger.info(f"cleaning up room with message: {close_message}")
-            await message.edit(content=close_message, embed=None, view=None)
-            return
+    if callable(close_message):
+        close_message = await close_message(message)
+    logger.info(f"cleaning up room with message: {close_message}")
+    await message.edit(content=close_message, embed=None, view=None)
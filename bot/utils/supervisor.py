@@ -0,0 +1,120 @@
+"""Tracked background tasks.
+
+Tasks spawned through the supervisor are named and grouped into categories,
+which may have a concurrency limit. Exceptions are logged and counted in
+/metrics rather than lost, and in-flight tasks are drained on shutdown.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Coroutine
+
+from .metrics import background_task_errors, background_tasks
+
+logger = logging.getLogger(__name__)
+
+DRAIN_TIMEOUT = 10  # seconds
+
+
+class TaskSupervisor:
+    def __init__(self):
+        self._tasks: set[asyncio.Task] = set()
+        # Long-running tasks that should only have a single instance, keyed by name
+        self._singletons: dict[str, asyncio.Task] = {}
+        self._limits: dict[str, int] = {}
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def set_limit(self, category: str, limit: int):
+        """Allow at most `limit` tasks in `category` to run at once.
+
+        Additional tasks wait for a slot.
+        """
+        self._limits[category] = limit
+        self._semaphores.pop(category, None)
+
+    def _get_semaphore(self, category: str) -> asyncio.Semaphore | None:
+        if category not in self._limits:
+            return None
+        if category not in self._semaphores:
+            self._semaphores[category] = asyncio.Semaphore(self._limits[category])
+        return self._semaphores[category]
+
+    async def _run(self, coro: Coroutine, category: str):
+        semaphore = self._get_semaphore(category)
+        if semaphore is None:
+            return await coro
+        async with semaphore:
+            return await coro
+
+    def spawn(
+        self, coro: Coroutine, *, name: str, category: str = "default"
+    ) -> asyncio.Task:
+        """Run `coro` in the background."""
+        task = asyncio.create_task(self._run(coro, category), name=name)
+        self._tasks.add(task)
+        gauge = background_tasks.labels(category)
+        gauge.inc()
+
+        def on_done(task: asyncio.Task):
+            self._tasks.discard(task)
+            gauge.dec()
+            # Tasks cancelled before they start never await `coro`
+            coro.close()
+            if task.cancelled():
+                return
+            error = task.exception()
+            if error is not None:
+                background_task_errors.labels(category).inc()
+                logger.error(f"background task {name!r} failed", exc_info=error)
+
+        task.add_done_callback(on_done)
+        return task
+
+    def spawn_once(
+        self, coro: Coroutine, *, name: str, category: str = "scheduler"
+    ) -> asyncio.Task:
+        """Run `coro` in the background unless a task named `name` is already running.
+
+        Use for loops started from listeners that can fire more than once,
+        like on_ready, which fires again after reconnecting.
+        """
+        existing = self._singletons.get(name)
+        if existing is not None and not existing.done():
+            logger.debug(f"task {name!r} is already running")
+            coro.close()
+            return existing
+        task = self.spawn(coro, name=name, category=category)
+        self._singletons[name] = task
+        task.add_done_callback(self._forget_singleton)
+        return task
+
+    def _forget_singleton(self, task: asyncio.Task):
+        name = task.get_name()
+        if self._singletons.get(name) is task:
+            del self._singletons[name]
+
+    async def drain(self, timeout: float = DRAIN_TIMEOUT):
+        """Cancel long-running tasks and wait for in-flight tasks to finish.
+
+        Tasks that are still running after `timeout` seconds are cancelled.
+        """
+        for task in self._singletons.values():
+            task.cancel()
+        pending = set(self._tasks)
+        if not pending:
+            return
+        logger.info(f"waiting for {len(pending)} background task(s) to finish")
+        _, pending = await asyncio.wait(pending, timeout=timeout)
+        for task in pending:
+            logger.warning(f"cancelling background task {task.get_name()!r}")
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+
+
+supervisor = TaskSupervisor()
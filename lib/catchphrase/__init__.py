@@ -1,32 +1,64 @@
-import itertools
+import functools
 import json
 import random
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 import yaml
+from wordtable import WordTable, load_snapshot
 
 HERE = Path(__file__).parent
+SNAPSHOT_PATH = HERE / "words.snapshot"
+SOURCES = (HERE / "game_words.yaml", HERE / "sentences.json", HERE / "phrases.json")
+# Bump when the structure returned by build_snapshot changes
+SNAPSHOT_VERSION = 1
 
-with (HERE / "game_words.yaml").open("r") as fp:
-    CATCHPHRASE = yaml.load(fp, Loader=yaml.SafeLoader)["catchphrase"]
-with (HERE / "sentences.json").open("r") as fp:
-    SENTENCES = json.load(fp)["data"]
-with (HERE / "phrases.json").open("r") as fp:
-    IDIOMS = json.load(fp)["data"]
 
-CATEGORIES = list(CATCHPHRASE.keys())
-ALL_WORDS = list(itertools.chain(*CATCHPHRASE.values()))
+def build_snapshot() -> dict:
+    with (HERE / "game_words.yaml").open("r") as fp:
+        catchphrase_words = yaml.load(fp, Loader=yaml.SafeLoader)["catchphrase"]
+    with (HERE / "sentences.json").open("r") as fp:
+        sentences = json.load(fp)["data"]
+    with (HERE / "phrases.json").open("r") as fp:
+        idioms = json.load(fp)["data"]
+
+    # All words are stored in one table; each category is a range within it
+    all_words: List[str] = []
+    category_ranges: Dict[str, Tuple[int, int]] = {}
+    for category, words in catchphrase_words.items():
+        category_ranges[category] = (len(all_words), len(all_words) + len(words))
+        all_words.extend(words)
+    return {
+        "words": WordTable.from_words(all_words),
+        "category_ranges": category_ranges,
+        "sentences": WordTable.from_words(each["sentence"] for each in sentences),
+        "idioms": idioms,
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _get_snapshot() -> dict:
+    return load_snapshot(
+        SNAPSHOT_PATH, sources=SOURCES, build=build_snapshot, version=SNAPSHOT_VERSION
+    )
+
+
+def get_categories() -> List[str]:
+    return list(_get_snapshot()["category_ranges"].keys())
 
 
 def catchphrase(category: Optional[str] = None):
-    word_list = CATCHPHRASE[category] if category else ALL_WORDS
-    return random.choice(word_list)
+    snapshot = _get_snapshot()
+    words = snapshot["words"]
+    if category:
+        start, stop = snapshot["category_ranges"][category]
+        return words[random.randrange(start, stop)]
+    return random.choice(words)
 
 
 def sentence():
-    return random.choice(SENTENCES)["sentence"]
+    return random.choice(_get_snapshot()["sentences"])
 
 
 def idiom():
-    return random.choice(IDIOMS)
+    return random.choice(_get_snapshot()["idioms"])
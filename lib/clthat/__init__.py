@@ -1,29 +1,40 @@
+import functools
 import itertools
 import json
 import random as _random
 from pathlib import Path
+from typing import List
 
 HERE = Path(__file__).parent
 
-with (HERE / "text.json").open("r") as fp:
-    TEXT = json.load(fp)
-with (HERE / "gifs.json").open("r") as fp:
-    GIFS = json.load(fp)
 
-GIF_URLS = [each["url"] for each in GIFS]
-ALL = list(itertools.chain(TEXT, GIF_URLS))
+@functools.lru_cache(maxsize=None)
+def _get_text() -> List[str]:
+    with (HERE / "text.json").open("r") as fp:
+        return json.load(fp)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_gif_urls() -> List[str]:
+    with (HERE / "gifs.json").open("r") as fp:
+        return [each["url"] for each in json.load(fp)]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_all() -> List[str]:
+    return list(itertools.chain(_get_text(), _get_gif_urls()))
 
 
 def random(rand=None):
     rand = rand or _random
-    return rand.choice(ALL)
+    return rand.choice(_get_all())
 
 
 def text(rand=None):
     rand = rand or _random
-    return rand.choice(TEXT)
+    return rand.choice(_get_text())
 
 
 def gif_url(rand=None):
     rand = rand or _random
-    return rand.choice(GIF_URLS)
+    return rand.choice(_get_gif_urls())
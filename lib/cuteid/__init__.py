@@ -1,22 +1,52 @@
+import functools
 import json
 from pathlib import Path
 from secrets import choice
+from typing import Tuple
 
-import emoji
+from wordtable import WordTable, load_snapshot
 
 HERE = Path(__file__).parent
+SNAPSHOT_PATH = HERE / "words.snapshot"
+SOURCES = (HERE / "adjectives.json", HERE / "animals.json")
+# Bump when the structure returned by build_snapshot changes
+SNAPSHOT_VERSION = 1
 
-with (HERE / "adjectives.json").open("r") as fp:
-    _adjectives = json.load(fp)
-with (HERE / "animals.json").open("r") as fp:
-    _animals = json.load(fp)
 
-_emoji = tuple(emoji.unicode_codes.get_emoji_unicode_dict("en").values())  # type: ignore[attr-defined]
+def build_snapshot() -> dict:
+    with (HERE / "adjectives.json").open("r") as fp:
+        adjectives = json.load(fp)
+    with (HERE / "animals.json").open("r") as fp:
+        animals = json.load(fp)
+    return {
+        "adjectives": WordTable.from_words(adjectives),
+        "animals": WordTable.from_words(animals),
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _get_snapshot() -> dict:
+    return load_snapshot(
+        SNAPSHOT_PATH, sources=SOURCES, build=build_snapshot, version=SNAPSHOT_VERSION
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_emoji() -> Tuple[str, ...]:
+    # emoji builds its full unicode dict on import, so defer it until needed
+    import emoji
+
+    return tuple(emoji.unicode_codes.get_emoji_unicode_dict("en").values())  # type: ignore[attr-defined]
 
 
 def cuteid():
-    return f"{choice(_adjectives)}-{choice(_adjectives)}-{choice(_animals)}".lower()
+    snapshot = _get_snapshot()
+    adjectives = snapshot["adjectives"]
+    return (
+        f"{choice(adjectives)}-{choice(adjectives)}-{choice(snapshot['animals'])}".lower()
+    )
 
 
 def emojid(length=4):
-    return "".join(choice(_emoji) for _ in range(length))
+    emoji = _get_emoji()
+    return "".join(choice(emoji) for _ in range(length))
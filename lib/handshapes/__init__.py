@@ -1,10 +1,16 @@
+import functools
 import random
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Literal
 
 from .case_insensitive_dict import CaseInsensitiveDict
 
 ASSETS_PATH = Path(__file__).parent / "assets"
+# The source images in ASSETS_PATH are served as the full size; smaller sizes
+#   are generated from them by script/build_handshape_assets.py
+Size = Literal["full", "thumbnail"]
+SIZES = ("full", "thumbnail")
 HANDSHAPE_NAMES = (
     "1",
     "3",
@@ -52,12 +58,28 @@ HANDSHAPE_NAMES = (
     "ILY",
     "Corna",
 )
-HANDSHAPE_PATHS = CaseInsensitiveDict(
-    {
-        handshape_name: ASSETS_PATH / f"{handshape_name}.png"
-        for handshape_name in HANDSHAPE_NAMES
-    }
-)
+
+
+def get_source_path(name: str) -> Path:
+    return ASSETS_PATH / f"{name}.png"
+
+
+def get_variant_path(name: str, size: Size) -> Path:
+    if size == "full":
+        return get_source_path(name)
+    return ASSETS_PATH / size / f"{name}.png"
+
+
+@functools.lru_cache(maxsize=None)
+def _get_handshape_paths(size: Size) -> CaseInsensitiveDict:
+    if size not in SIZES:
+        raise ValueError(f"Invalid handshape image size: '{size}'")
+    return CaseInsensitiveDict(
+        {
+            handshape_name: get_variant_path(handshape_name, size)
+            for handshape_name in HANDSHAPE_NAMES
+        }
+    )
 
 
 @dataclass
@@ -70,10 +92,11 @@ class HandshapeNotFoundError(KeyError):
     pass
 
 
-def get_handshape(name):
+def get_handshape(name, size: Size = "full"):
+    handshape_paths = _get_handshape_paths(size)
     try:
-        cased_name = HANDSHAPE_PATHS._store[name.lower()][0]
-        path = HANDSHAPE_PATHS[name]
+        cased_name = handshape_paths._store[name.lower()][0]
+        path = handshape_paths[name]
     except KeyError as error:
         raise HandshapeNotFoundError(
             f"Could not find handshape with name '{name}'"
@@ -81,7 +104,7 @@ def get_handshape(name):
     return Handshape(name=cased_name, path=path)
 
 
-def get_random_handshape(rand=None):
+def get_random_handshape(rand=None, size: Size = "full"):
     rand = rand or random
     name = rand.choice(HANDSHAPE_NAMES)
-    return get_handshape(name)
+    return get_handshape(name, size=size)
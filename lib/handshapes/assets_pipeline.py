@@ -0,0 +1,36 @@
+"""Losslessly recompress the handshape source images and generate the smaller
+size-specific variants from them.
+
+Requires Pillow (a development dependency). Output is deterministic for a given
+Pillow version so that regenerated assets can be checked against the committed ones,
+and rendering an already optimized source image at full size returns it unchanged.
+"""
+
+import io
+from pathlib import Path
+
+from PIL import Image
+
+# Width and height in pixels for each variant size; None keeps the source size
+VARIANT_DIMENSIONS = {
+    "full": None,
+    # Discord displays embed thumbnails at 80x80
+    "thumbnail": 80,
+}
+
+
+def render_variant(source_path: Path, size: str) -> bytes:
+    dimension = VARIANT_DIMENSIONS[size]
+    with Image.open(source_path) as source:
+        image = source.convert("RGBA")
+        if dimension is not None:
+            image = image.resize((dimension, dimension), Image.LANCZOS)
+        # Color values of fully transparent pixels are invisible; clearing them
+        # compresses better without changing how the image looks
+        transparent = image.getchannel("A").point(lambda alpha: 255 if alpha == 0 else 0)
+        image.paste((0, 0, 0, 0), mask=transparent)
+        icc_profile = source.info.get("icc_profile")
+    output = io.BytesIO()
+    # Drop ancillary metadata (text chunks, etc.) but keep the color profile
+    image.save(output, format="PNG", optimize=True, icc_profile=icc_profile)
+    return output.getvalue()
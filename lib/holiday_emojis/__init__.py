@@ -1,5 +1,6 @@
 import datetime as dt
-from typing import NamedTuple, Optional
+import functools
+from typing import Dict, NamedTuple, Optional
 
 import holidays
 from dateutil.easter import easter
@@ -179,16 +180,59 @@ _HOLIDAY_EMOJI_MAP = {
 
 HOLIDAYS = make_holidays()
 
+# year => {date => holiday name}, for last year through next year (see refresh)
+_calendar: Dict[int, Dict[dt.date, str]] = {}
+# Number of other years to keep in the lookup table
+_OTHER_YEARS = 3
+
+
+def _build_year(year: int) -> Dict[dt.date, str]:
+    # USPlus also adds holidays on fixed dates in other years
+    year_holidays = make_holidays(years=year)
+    # Multiple holidays on the same date are joined with ", "; the first one wins
+    return {
+        date: names.split(", ")[0]
+        for date, names in year_holidays.items()
+        if date.year == year
+    }
+
+
+def refresh(today: Optional[dt.date] = None):
+    """Build the lookup tables for the years around `today`, so that lookups for
+    recent and upcoming dates never build them inline.
+
+    Runs on import; long-running processes should call it daily so that the window
+    moves along with the year.
+    """
+    year = (today or dt.date.today()).year
+    global _calendar
+    _calendar = {
+        each: _calendar[each] if each in _calendar else _build_year(each)
+        for each in range(year - 1, year + 2)
+    }
+
+
+@functools.lru_cache(maxsize=_OTHER_YEARS)
+def _get_other_year(year: int) -> Dict[dt.date, str]:
+    return _build_year(year)
+
+
+def _get_year(year: int) -> Dict[dt.date, str]:
+    table = _calendar.get(year)
+    if table is None:
+        table = _get_other_year(year)
+    return table
+
+
+refresh()
+
 
 def get(date: dt.date) -> Optional[Holiday]:
-    holiday_names = HOLIDAYS.get_list(date)
-    if holiday_names:
-        return _HOLIDAY_EMOJI_MAP.get(holiday_names[0], None)
+    holiday_name = _get_year(date.year).get(date)
+    if holiday_name:
+        return _HOLIDAY_EMOJI_MAP.get(holiday_name, None)
     return None
 
 
-def get_holiday_name(date: dt.date) -> Optional[Holiday]:
-    holiday_names = HOLIDAYS.get_list(date)
-    if holiday_names:
-        return holiday_names[0]
-    return None
+def get_holiday_name(date: dt.date) -> Optional[str]:
+    return _get_year(date.year).get(date) or None
@@ -0,0 +1,115 @@
+"""Compact, picklable string tables and on-disk snapshots of word lists."""
+
+import logging
+import os
+import pickle
+import tempfile
+from array import array
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, Callable, Iterable, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class WordTable(Sequence[str]):
+    """An immutable sequence of strings stored as a single string and an offset array.
+
+    Supports len() and indexing, so random.choice and secrets.choice work on it directly.
+    """
+
+    __slots__ = ("_data", "_offsets")
+
+    def __init__(self, data: str, offsets: array):
+        self._data = data
+        self._offsets = offsets
+
+    @classmethod
+    def from_words(cls, words: Iterable[str]) -> "WordTable":
+        offsets = array("I", [0])
+        parts = []
+        position = 0
+        for word in words:
+            parts.append(word)
+            position += len(word)
+            offsets.append(position)
+        return cls("".join(parts), offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:  # type: ignore[override]
+        if index < 0:
+            index += len(self)
+            if index < 0:
+                raise IndexError("WordTable index out of range")
+        offsets = self._offsets
+        # offsets[index + 1] raises IndexError for indices past the end
+        return self._data[offsets[index] : offsets[index + 1]]
+
+    def __reduce__(self):
+        return (self.__class__, (self._data, self._offsets))
+
+    def __repr__(self) -> str:
+        return f"<WordTable len={len(self)}>"
+
+
+def get_fingerprint(sources: Iterable[Path], *, version: int) -> tuple:
+    """Identify the state of `sources` by their size and modification time, which
+    only costs a stat() per file.
+    """
+    stats = []
+    for source in sources:
+        stat = source.stat()
+        stats.append((source.name, stat.st_size, stat.st_mtime_ns))
+    return (version, tuple(stats))
+
+
+def is_source_checkout(path: Path) -> bool:
+    """Whether `path` is in a source checkout rather than an installed package."""
+    return not any(part in ("site-packages", "dist-packages") for part in path.parts)
+
+
+def load_snapshot(
+    path: Path, *, sources: Sequence[Path], build: Callable[[], Any], version: int = 1
+) -> Any:
+    """Load the snapshot stored at `path`, falling back to building the data with
+    `build` if it is missing or out of date.
+
+    Installed packages ship snapshots built from the sources next to them (see
+    script/build_word_snapshots.py), so those are loaded as is. In a source checkout,
+    the snapshot is out of date when `sources` have changed since it was written,
+    and is rewritten after being rebuilt.
+    """
+    source_checkout = is_source_checkout(path)
+    fingerprint = get_fingerprint(sources, version=version) if source_checkout else None
+    try:
+        with path.open("rb") as fp:
+            stored_fingerprint, data = pickle.load(fp)
+        if not source_checkout or stored_fingerprint == fingerprint:
+            return data
+        logger.info(f"snapshot out of date, rebuilding: {path}")
+    except FileNotFoundError:
+        logger.info(f"no snapshot found, building: {path}")
+    except Exception:
+        logger.exception(f"could not read snapshot, building: {path}")
+    data = build()
+    if source_checkout:
+        try:
+            write_snapshot(path, data, fingerprint=fingerprint)
+        except OSError:
+            logger.warning(f"could not write snapshot: {path}", exc_info=True)
+    return data
+
+
+def write_snapshot(path: Path, data: Any, *, fingerprint: tuple):
+    # Write to a temporary file first so that readers never see a partial snapshot
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            pickle.dump((fingerprint, data), fp, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp_path)
+        raise
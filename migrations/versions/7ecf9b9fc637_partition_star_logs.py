@@ -0,0 +1,129 @@
+"""partition star_logs by month
+
+Revision ID: 7ecf9b9fc637
+Revises: 9a8843509e29
+Create Date: 2026-10-19 10:12:41.203515
+
+"""
+import datetime as dt
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "7ecf9b9fc637"
+down_revision = "9a8843509e29"
+branch_labels = None
+depends_on = None
+
+COLUMNS = "id, from_user_id, to_user_id, message_id, jump_url, action, created_at"
+# Future months to create partitions for, matching the maintenance job at the time
+#   of this migration
+PARTITIONS_AHEAD = 3
+
+
+def month_start(when, months=0):
+    when = when.astimezone(dt.timezone.utc)
+    year, month = divmod(when.month - 1 + months, 12)
+    return dt.datetime(when.year + year, month + 1, 1, tzinfo=dt.timezone.utc)
+
+
+def create_partition(month):
+    """Add the partition for `month`, moving its rows out of the default partition."""
+    end = month_start(month, 1)
+    name = op.get_bind().dialect.identifier_preparer.quote(
+        f"star_logs_y{month.year:04}m{month.month:02}"
+    )
+    op.execute(
+        f"CREATE TABLE {name} (LIKE star_logs INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    )
+    op.execute(
+        sa.text(
+            f"""WITH moved AS (
+                DELETE FROM star_logs_default
+                WHERE created_at >= :start AND created_at < :end
+                RETURNING *
+            )
+            INSERT INTO {name} SELECT * FROM moved"""
+        ).bindparams(start=month, end=end)
+    )
+    # Bound values are rendered client side, so they can be used in DDL here
+    op.execute(
+        sa.text(
+            f"ALTER TABLE star_logs ATTACH PARTITION {name} "
+            "FOR VALUES FROM (CAST(:start AS timestamptz)) TO (CAST(:end AS timestamptz))"
+        ).bindparams(start=month, end=end)
+    )
+
+
+def upgrade():
+    op.rename_table("star_logs", "star_logs_unpartitioned")
+    op.execute(
+        "ALTER TABLE star_logs_unpartitioned RENAME CONSTRAINT star_logs_pkey TO star_logs_unpartitioned_pkey"
+    )
+    op.create_table(
+        "star_logs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("from_user_id", sa.BIGINT(), nullable=True),
+        sa.Column("to_user_id", sa.BIGINT(), nullable=True),
+        sa.Column("message_id", sa.BIGINT(), nullable=True),
+        sa.Column("jump_url", sa.Text(), nullable=True),
+        sa.Column("action", sa.Text(), nullable=False),
+        sa.Column("created_at", postgresql.TIMESTAMP(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id", "created_at"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    op.create_index(
+        "ix_star_logs_to_user_id_created_at",
+        "star_logs",
+        ["to_user_id", "created_at"],
+        unique=False,
+    )
+    op.execute("CREATE TABLE star_logs_default PARTITION OF star_logs DEFAULT")
+
+    # Monthly partitions from the oldest log through the partitions the
+    #   maintenance job would create
+    oldest = (
+        op.get_bind()
+        .execute("SELECT min(created_at) FROM star_logs_unpartitioned")
+        .scalar()
+    )
+    now = dt.datetime.now(dt.timezone.utc)
+    month = month_start(oldest or now)
+    last = month_start(now, PARTITIONS_AHEAD)
+    while month <= last:
+        create_partition(month)
+        month = month_start(month, 1)
+
+    op.execute(
+        f"INSERT INTO star_logs ({COLUMNS}) SELECT {COLUMNS} FROM star_logs_unpartitioned"
+    )
+    op.drop_table("star_logs_unpartitioned")
+
+
+def downgrade():
+    op.rename_table("star_logs", "star_logs_partitioned")
+    op.execute(
+        "ALTER INDEX ix_star_logs_to_user_id_created_at RENAME TO ix_star_logs_partitioned_to_user_id_created_at"
+    )
+    op.execute(
+        "ALTER TABLE star_logs_partitioned RENAME CONSTRAINT star_logs_pkey TO star_logs_partitioned_pkey"
+    )
+    op.create_table(
+        "star_logs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("from_user_id", sa.BIGINT(), nullable=True),
+        sa.Column("to_user_id", sa.BIGINT(), nullable=True),
+        sa.Column("message_id", sa.BIGINT(), nullable=True),
+        sa.Column("jump_url", sa.Text(), nullable=True),
+        sa.Column("action", sa.Text(), nullable=False),
+        sa.Column("created_at", postgresql.TIMESTAMP(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    # Logs in detached partitions are not restored
+    op.execute(
+        f"INSERT INTO star_logs ({COLUMNS}) SELECT {COLUMNS} FROM star_logs_partitioned"
+    )
+    # Drops the attached partitions too
+    op.drop_table("star_logs_partitioned")
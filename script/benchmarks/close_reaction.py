@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Benchmark finding the close message for a stop sign reaction, comparing
+re.search with each pattern string against the combined CloseMessages regex.
+
+Messages have an embed with many fields, which is the worst case for
+scanning: every field name is checked before falling back to the content.
+
+Usage:
+
+    PYTHONPATH=. python script/benchmarks/close_reaction.py
+"""
+import re
+import timeit
+from types import SimpleNamespace
+
+import disnake
+
+from bot.utils.reactions import CloseMessages
+
+N_RUNS = 20000
+
+# Same patterns as the meetings extension
+PATTERNS = {
+    r"zoom\.us|Stand By|Could not create Zoom|localhost": "zoom",
+    r"meet\.jit\.si": "meet",
+    r"Speakeasy": "speakeasy",
+    r"w2g\.tv|Could not create watch2gether": "w2g",
+}
+
+
+def match_per_pattern(message, close_messages):
+    """The previous implementation: one re.search per pattern per piece of text."""
+    for pattern, close_message in close_messages.items():
+        for embed in message.embeds:
+            if embed.title and re.search(pattern, embed.title):
+                return close_message
+            for field in embed.fields:
+                if field.name and re.search(pattern, field.name):
+                    return close_message
+        if re.search(pattern, message.content):
+            return close_message
+    return None
+
+
+def make_message(*, n_fields: int, last_field: str):
+    embed = disnake.Embed(title="Practice session")
+    for i in range(n_fields - 1):
+        embed.add_field(name=f"Participant {i}", value="Signing in")
+    embed.add_field(name=last_field, value="...")
+    return SimpleNamespace(content="Come on in!", embeds=[embed])
+
+
+def benchmark(label: str, message, compiled: CloseMessages):
+    for name, match in (
+        ("re.search per pattern", lambda: match_per_pattern(message, PATTERNS)),
+        ("CloseMessages", lambda: compiled.match(message)),
+    ):
+        seconds = timeit.timeit(match, number=N_RUNS)
+        print(f"{label:<36} {name:<22} {seconds / N_RUNS * 1e6:6.2f} µs/call")
+
+
+def main():
+    compiled = CloseMessages(PATTERNS)
+    cases = (
+        ("no match", "Nothing here"),
+        ("last entry in last field", "https://w2g.tv/rooms/abc"),
+    )
+    print(f"Matching close messages ({N_RUNS} runs)\n")
+    for n_fields in (5, 25):
+        for label, last_field in cases:
+            message = make_message(n_fields=n_fields, last_field=last_field)
+            assert match_per_pattern(message, PATTERNS) == compiled.match(message)
+            benchmark(f"{n_fields:>2} fields, {label}", message, compiled)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Benchmark FuzzyIndex lookups against scanning with difflib.
+
+Usage:
+
+    PYTHONPATH=. python script/benchmarks/fuzzy_index.py
+"""
+import difflib
+import timeit
+
+import catchphrase
+import handshapes
+
+from bot.utils.fuzzy import FuzzyIndex
+
+N_RUNS = 2000
+QUERIES = ("opn8", "claw", "bnt", "flat c", "ily", "corn", "xyzzy", "animls", "hous")
+
+
+def report(label: str, seconds: float):
+    print(f"{label:<45} {seconds / N_RUNS / len(QUERIES) * 1e6:10.2f} µs/query")
+
+
+def benchmark(words):
+    index = FuzzyIndex(words)
+
+    def with_difflib():
+        for query in QUERIES:
+            difflib.get_close_matches(query, words, n=1, cutoff=0.5)
+
+    def with_index():
+        for query in QUERIES:
+            index.did_you_mean(query)
+
+    def autocomplete():
+        for query in QUERIES:
+            index.autocomplete(query)
+
+    report("  difflib.get_close_matches", timeit.timeit(with_difflib, number=N_RUNS))
+    report("  FuzzyIndex.did_you_mean", timeit.timeit(with_index, number=N_RUNS))
+    report("  FuzzyIndex.autocomplete", timeit.timeit(autocomplete, number=N_RUNS))
+
+
+def main():
+    datasets = {
+        "handshapes": handshapes.HANDSHAPE_NAMES,
+        "catchphrase categories": catchphrase.get_categories(),
+        # Roughly the size of a large tag list
+        "catchphrase words": list(catchphrase._get_snapshot()["words"])[:500],
+    }
+    for name, words in datasets.items():
+        words = list(words)
+        print(f"{name} ({len(words)} words)")
+        benchmark(words)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Load test the /graphql handler against a local aiohttp server, comparing
+ariadne.graphql with full queries to execute_graphql with persisted query hashes.
+
+Uses the introspection query by default so that no database is needed.
+
+Usage:
+
+    PYTHONPATH=. python script/benchmarks/graphql_load.py [--duration SECONDS] [--concurrency N]
+"""
+import argparse
+import asyncio
+import time
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from ariadne import graphql
+from graphql import get_introspection_query
+
+from bot.graphql.persisted import execute_graphql, get_query_hash
+from bot.graphql.schema import schema
+
+QUERY = get_introspection_query()
+
+
+async def ariadne_handler(request):
+    success, result = await graphql(schema, await request.json(), context_value=request)
+    return web.json_response(result, status=200 if success else 400)
+
+
+async def persisted_handler(request):
+    success, result = await execute_graphql(
+        schema, await request.json(), context_value=request
+    )
+    return web.json_response(result, status=200 if success else 400)
+
+
+async def run_load(session, url, payload, *, duration, concurrency) -> float:
+    n_requests = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        nonlocal n_requests
+        while time.perf_counter() < deadline:
+            async with session.post(url, json=payload) as response:
+                assert response.status == 200, await response.text()
+                await response.read()
+            n_requests += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return n_requests / (time.perf_counter() - start)
+
+
+async def main(duration: float, concurrency: int):
+    app = web.Application()
+    app.router.add_post("/ariadne", ariadne_handler)
+    app.router.add_post("/graphql", persisted_handler)
+    persisted_query = {
+        "persistedQuery": {"version": 1, "sha256Hash": get_query_hash(QUERY)}
+    }
+    scenarios = (
+        ("ariadne.graphql", "/ariadne", {"query": QUERY}),
+        ("execute_graphql (full query)", "/graphql", {"query": QUERY}),
+        ("execute_graphql (hash only)", "/graphql", {"extensions": persisted_query}),
+    )
+    async with TestServer(app) as server, aiohttp.ClientSession() as session:
+        # Register the persisted query
+        await session.post(
+            server.make_url("/graphql"),
+            json={"query": QUERY, "extensions": persisted_query},
+        )
+        for label, path, payload in scenarios:
+            rate = await run_load(
+                session,
+                server.make_url(path),
+                payload,
+                duration=duration,
+                concurrency=concurrency,
+            )
+            print(f"{label:<35} {rate:10.1f} requests/sec")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.duration, args.concurrency))
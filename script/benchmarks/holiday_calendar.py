@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Benchmark holiday_emojis lookups against looking dates up in the holidays library.
+
+Usage:
+
+    python script/benchmarks/holiday_calendar.py
+"""
+import datetime as dt
+import timeit
+
+import holiday_emojis
+
+N_RUNS = 100_000
+DATE = dt.date(2021, 10, 31)
+
+
+def get_from_holidays(holidays, date):
+    holiday_names = holidays.get_list(date)
+    if holiday_names:
+        return holiday_emojis._HOLIDAY_EMOJI_MAP.get(holiday_names[0], None)
+    return None
+
+
+def report(label: str, seconds: float, number: int):
+    print(f"{label:<45} {seconds / number * 1e6:10.3f} µs/lookup")
+
+
+def main():
+    # First lookup in a year that hasn't been populated yet
+    number = 20
+    report(
+        "holidays.get_list (cold year)",
+        timeit.timeit(
+            lambda: get_from_holidays(holiday_emojis.make_holidays(), DATE), number=number
+        ),
+        number,
+    )
+
+    def refresh_cold():
+        holiday_emojis._calendar.clear()
+        holiday_emojis.refresh(DATE)
+
+    # Builds last year through next year, outside of lookups
+    report(
+        "holiday_emojis.refresh (cold)",
+        timeit.timeit(refresh_cold, number=number),
+        number,
+    )
+
+    # Steady state
+    holidays = holiday_emojis.make_holidays()
+    get_from_holidays(holidays, DATE)
+    holiday_emojis.get(DATE)
+    report(
+        "holidays.get_list (warm)",
+        timeit.timeit(lambda: get_from_holidays(holidays, DATE), number=N_RUNS),
+        N_RUNS,
+    )
+    report(
+        "holiday_emojis.get (warm)",
+        timeit.timeit(lambda: holiday_emojis.get(DATE), number=N_RUNS),
+        N_RUNS,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Report per-module import cost of booting the bot.
+
+Imports bot.app and every extension (as on_startup does) under
+`python -X importtime` and summarizes the results.
+
+Usage:
+
+    python script/benchmarks/import_time.py [--top N] [--module NAME ...]
+"""
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, NamedTuple
+
+ROOT = Path(__file__).parent.parent.parent
+
+BOOT_CODE = """
+import importlib
+
+import bot.app
+from bot.utils.extensions import walk_extensions
+
+for ext in walk_extensions():
+    importlib.import_module(ext)
+"""
+
+# Modules that are always reported, if they were imported
+WATCHED_MODULES = (
+    "catchphrase",
+    "clthat",
+    "cuteid",
+    "handshapes",
+    "holiday_emojis",
+    "meetings",
+    "pytz_informal",
+    "emoji",
+    "bot.app",
+)
+
+
+class ImportTime(NamedTuple):
+    self_us: int
+    cumulative_us: int
+
+
+def measure() -> Dict[str, ImportTime]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", BOOT_CODE],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        sys.exit(result.stderr)
+    times: Dict[str, ImportTime] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        times[name.strip()] = ImportTime(int(self_us), int(cumulative_us))
+    return times
+
+
+def print_row(name: str, time: ImportTime):
+    print(f"{name:<50} {time.self_us / 1000:10.1f} {time.cumulative_us / 1000:10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top", type=int, default=20, help="number of modules to list")
+    parser.add_argument(
+        "--module", action="append", default=[], help="additional module to report"
+    )
+    args = parser.parse_args()
+
+    times = measure()
+    print("Slowest modules (self time):")
+    print(f"{'module':<50} {'self ms':>10} {'cumul. ms':>10}")
+    for name, time in sorted(times.items(), key=lambda item: -item[1].self_us)[
+        : args.top
+    ]:
+        print_row(name, time)
+    print("\nWatched modules:")
+    for name in (*WATCHED_MODULES, *args.module):
+        if name in times:
+            print_row(name, times[name])
+        else:
+            print(f"{name:<50} {'not imported':>21}")
+    total_us = sum(time.self_us for time in times.values())
+    print(f"\nTotal: {total_us / 1000:.1f} ms across {len(times)} modules")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Saturate the database connection pool against a local Postgres and report
+how long queries take once callers have to wait for connections.
+
+Runs `--concurrency` workers that each execute `SELECT pg_sleep(...)` in a loop
+against a pool with `--max-size` connections.
+
+Usage:
+
+    PYTHONPATH=. python script/benchmarks/pool_stress.py [--max-size N] [--concurrency N]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from bot import settings
+from bot.database import InstrumentedDatabase, get_pool_options
+
+NAME = "stress"
+
+
+async def worker(db: InstrumentedDatabase, *, query_time: float, until: float, latencies):
+    while time.perf_counter() < until:
+        start = time.perf_counter()
+        await db.fetch_val("SELECT pg_sleep(:t)", {"t": query_time})
+        latencies.append(time.perf_counter() - start)
+
+
+async def sample_pool(db: InstrumentedDatabase, samples):
+    while True:
+        samples.append(db.get_pool_stats())
+        await asyncio.sleep(0.01)
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--max-size", type=int, default=settings.DATABASE_POOL_MAX_SIZE)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--query-time", type=float, default=0.02)
+    parser.add_argument("--duration", type=float, default=5)
+    args = parser.parse_args()
+
+    options = get_pool_options()
+    options.update(
+        min_size=min(options["min_size"], args.max_size), max_size=args.max_size
+    )
+    db = InstrumentedDatabase(
+        settings.DATABASE_URL,
+        name=NAME,
+        acquire_timeout=settings.DATABASE_POOL_ACQUIRE_TIMEOUT,
+        **options,
+    )
+    await db.connect()
+    latencies: list[float] = []
+    samples: list = []
+    sampler = asyncio.create_task(sample_pool(db, samples))
+    print(
+        f"{args.concurrency} workers, {args.max_size} connections, "
+        f"{args.query_time * 1000:.0f}ms queries, {args.duration}s\n"
+    )
+    until = time.perf_counter() + args.duration
+    await asyncio.gather(
+        *(
+            worker(db, query_time=args.query_time, until=until, latencies=latencies)
+            for _ in range(args.concurrency)
+        )
+    )
+    sampler.cancel()
+    await db.disconnect()
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"queries:           {len(latencies)} ({len(latencies) / args.duration:.0f}/s)")
+    print(
+        f"latency (ms):      p50 {quantiles[49] * 1000:.1f}  p95 {quantiles[94] * 1000:.1f}"
+        f"  max {max(latencies) * 1000:.1f}"
+    )
+    # Anything beyond the query time is spent waiting for a connection
+    mean_wait = statistics.mean(latencies) - args.query_time
+    print(f"mean wait (ms):    {mean_wait * 1000:.1f}")
+    print(f"max connections:   {max(stats.size for stats in samples)}")
+    print(f"max in use:        {max(stats.in_use for stats in samples)}")
+    print(f"max waiting:       {max(stats.waiting for stats in samples)}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Compare star highlight queries against an unpartitioned star_logs table and
+the monthly-partitioned one on a synthetic multi-year log.
+
+Creates (and afterwards drops) a scratch database next to DATABASE_URL.
+
+Usage:
+
+    PYTHONPATH=. python script/benchmarks/star_log_partitions.py [--rows N] [--years N]
+"""
+import argparse
+import asyncio
+import datetime as dt
+import statistics
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy_utils import create_database, drop_database
+
+from bot import settings
+from bot.database import Store, get_month_start, now
+
+N_USERS = 2000
+N_RUNS = 200
+
+HIGHLIGHT_QUERY = """SELECT * FROM {table}
+WHERE to_user_id = :user_id AND jump_url IS NOT NULL AND action = 'ADD'
+AND created_at > :after
+ORDER BY created_at DESC LIMIT 5"""
+
+
+async def time_query(store: Store, table: str, *, after: dt.datetime) -> list[float]:
+    query = HIGHLIGHT_QUERY.format(table=table)
+    durations = []
+    for i in range(N_RUNS):
+        start = time.perf_counter()
+        await store.db.fetch_all(query, {"user_id": i % N_USERS, "after": after})
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+async def count_scanned_partitions(store: Store, *, after: dt.datetime) -> int:
+    rows = await store.db.fetch_all(
+        "EXPLAIN " + HIGHLIGHT_QUERY.format(table="star_logs"),
+        {"user_id": 1, "after": after},
+    )
+    return sum(" on star_logs_" in row[0] for row in rows)
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--years", type=int, default=4)
+    args = parser.parse_args()
+
+    url = str(settings.DATABASE_URL.replace(database="benchmark_star_logs"))
+    create_database(url)
+    try:
+        Store.metadata.create_all(create_engine(url))
+        store = Store(url)
+        await store.connect()
+        try:
+            await run(store, rows=args.rows, years=args.years)
+        finally:
+            await store.disconnect()
+    finally:
+        drop_database(url)
+
+
+async def run(store: Store, *, rows: int, years: int):
+    months = years * 12
+    oldest = get_month_start(now(), -months)
+    for offset in range(-months, 1):
+        await store.create_star_log_partition(get_month_start(now(), offset))
+    await store.ensure_star_log_partitions()
+
+    print(f"Generating {rows} star logs over {years} years for {N_USERS} users")
+    await store.db.execute(
+        f"""INSERT INTO star_logs (id, from_user_id, to_user_id, jump_url, action, created_at)
+        SELECT gen_random_uuid(), 0, i % {N_USERS}, 'https://discord.com/channels/1/2/3',
+            'ADD', start + (now() - start) * (i::float / {rows})
+        FROM generate_series(1, {rows}) i, CAST(:oldest AS timestamptz) start""",
+        {"oldest": oldest},
+    )
+    await store.db.execute("CREATE TABLE star_logs_plain AS SELECT * FROM star_logs")
+    await store.db.execute(
+        "CREATE INDEX ON star_logs_plain (to_user_id, created_at)",
+    )
+    await store.db.execute("ANALYZE star_logs")
+    await store.db.execute("ANALYZE star_logs_plain")
+    n_partitions = len(await store.get_star_log_partitions())
+    print(f"{n_partitions} partitions ({N_RUNS} queries per case)\n")
+
+    for label, after in (
+        ("since 30 days ago", now() - dt.timedelta(days=30)),
+        ("since 1 year ago", now() - dt.timedelta(days=365)),
+        ("all history", oldest - dt.timedelta(days=1)),
+    ):
+        scanned = await count_scanned_partitions(store, after=after)
+        for table in ("star_logs_plain", "star_logs"):
+            durations = await time_query(store, table, after=after)
+            print(
+                f"{label:<18} {table:<16} p50 {statistics.median(durations) * 1000:6.2f}ms"
+                f"  max {max(durations) * 1000:6.2f}ms"
+                + (f"  ({scanned} partitions scanned)" if table == "star_logs" else "")
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Benchmark the per-call CPU overhead of building and compiling Store statements,
+comparing SQLAlchemy Core expressions built on every call to SQL compiled once
+with bind parameters.
+
+Compiled SQL is still passed through text() on each call, the same way databases
+handles SQL strings, so both numbers include the work done before asyncpg sees
+the query.
+
+No database connection is needed.
+
+Usage:
+
+    PYTHONPATH=. python script/benchmarks/store_statements.py
+"""
+import datetime as dt
+import timeit
+import uuid
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from bot.database import (
+    INSERT_STAR_LOG,
+    UPSERT_ZOOM_PARTICIPANT,
+    insert,
+    star_logs,
+    zoom_participants,
+)
+
+N_RUNS = 5000
+
+JOINED_AT = dt.datetime(2021, 1, 1, tzinfo=dt.timezone.utc)
+
+dialect = postgresql.dialect()
+
+
+def build_zoom_participant_upsert():
+    stmt = insert(zoom_participants).values(
+        meeting_id=123,
+        name="Dana Smith",
+        zoom_id="abc",
+        email=None,
+        joined_at=JOINED_AT,
+        created_at=JOINED_AT,
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=(zoom_participants.c.meeting_id, zoom_participants.c.name),
+        set_=dict(
+            zoom_id=stmt.excluded.zoom_id,
+            email=stmt.excluded.email,
+            joined_at=stmt.excluded.joined_at,
+        ),
+    )
+
+
+def zoom_participant_values():
+    return dict(
+        meeting_id=123,
+        name="Dana Smith",
+        zoom_id="abc",
+        email=None,
+        joined_at=JOINED_AT,
+        created_at=JOINED_AT,
+    )
+
+
+def build_star_log():
+    return insert(star_logs).values(
+        id=uuid.uuid4(),
+        from_user_id=1,
+        to_user_id=2,
+        message_id=None,
+        jump_url=None,
+        created_at=JOINED_AT,
+        action="ADD",
+    )
+
+
+def star_log_values():
+    return dict(
+        id=uuid.uuid4(),
+        from_user_id=1,
+        to_user_id=2,
+        message_id=None,
+        jump_url=None,
+        created_at=JOINED_AT,
+        action="ADD",
+    )
+
+
+def report(label: str, seconds: float):
+    print(f"{label:<45} {seconds / N_RUNS * 1e6:8.1f} µs/call")
+
+
+def benchmark(name: str, build, sql: str, get_values):
+    report(
+        f"{name}: compile every call",
+        timeit.timeit(lambda: build().compile(dialect=dialect), number=N_RUNS),
+    )
+    report(
+        f"{name}: compiled once",
+        timeit.timeit(
+            lambda: sa.text(sql).bindparams(**get_values()).compile(dialect=dialect),
+            number=N_RUNS,
+        ),
+    )
+
+
+def main():
+    print(f"Building and compiling statements ({N_RUNS} runs)\n")
+    benchmark(
+        "add_zoom_participant",
+        build_zoom_participant_upsert,
+        UPSERT_ZOOM_PARTICIPANT,
+        zoom_participant_values,
+    )
+    benchmark("give_stars (star log)", build_star_log, INSERT_STAR_LOG, star_log_values)
+
+
+if __name__ == "__main__":
+    main()
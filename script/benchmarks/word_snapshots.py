@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Benchmark loading the catchphrase and cuteid word list snapshots against parsing
+their source files.
+
+Usage:
+
+    python script/benchmarks/word_snapshots.py
+"""
+import functools
+import random
+import tempfile
+import timeit
+from pathlib import Path
+
+import catchphrase
+import cuteid
+from wordtable import get_fingerprint, load_snapshot, write_snapshot
+
+N_RUNS = 20
+N_CHOICES = 100_000
+
+
+def report(label: str, seconds: float, number: int, unit: str):
+    print(f"{label:<45} {seconds / number * 1e6:12.3f} µs/{unit}")
+
+
+def benchmark_load(module, snapshot_path: Path):
+    name = module.__name__
+    report(
+        f"{name}: parse sources",
+        timeit.timeit(module.build_snapshot, number=N_RUNS),
+        N_RUNS,
+        "load",
+    )
+    fingerprint = get_fingerprint(module.SOURCES, version=module.SNAPSHOT_VERSION)
+    write_snapshot(snapshot_path, module.build_snapshot(), fingerprint=fingerprint)
+    load = functools.partial(
+        load_snapshot,
+        snapshot_path,
+        sources=module.SOURCES,
+        build=module.build_snapshot,
+        version=module.SNAPSHOT_VERSION,
+    )
+    report(f"{name}: load snapshot", timeit.timeit(load, number=N_RUNS), N_RUNS, "load")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for module in (catchphrase, cuteid):
+            benchmark_load(module, Path(tmp_dir) / f"{module.__name__}.snapshot")
+
+    table = catchphrase._get_snapshot()["words"]
+    words = list(table)
+    report(
+        "random.choice(list)",
+        timeit.timeit(lambda: random.choice(words), number=N_CHOICES),
+        N_CHOICES,
+        "choice",
+    )
+    report(
+        "random.choice(WordTable)",
+        timeit.timeit(lambda: random.choice(table), number=N_CHOICES),
+        N_CHOICES,
+        "choice",
+    )
+
+
+if __name__ == "__main__":
+    main()
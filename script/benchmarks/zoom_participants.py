@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Benchmark rendering the Zoom meeting embed for a 300-participant meeting.
+
+Usage:
+
+    python script/benchmarks/zoom_participants.py
+"""
+import datetime as dt
+import random
+import timeit
+
+from bot.exts.meetings import _zoom
+
+N_PARTICIPANTS = 300
+N_RUNS = 200
+
+FIRST_NAMES = ("Ana", "Bo", "Chris", "Dana", "Eli", "Fran", "Gus", "Hana", "Ira", "Jo")
+LAST_NAMES = ("Smith", "Nguyen", "Garcia", "Kim", "O'Brien", "Van der Berg", "Lee")
+
+
+def make_snapshot(n_participants: int) -> _zoom.ZoomMeetingSnapshot:
+    rand = random.Random(42)
+    joined_at = dt.datetime(2021, 1, 1, tzinfo=dt.timezone.utc)
+    participants = tuple(
+        {
+            "meeting_id": 123,
+            "name": f"Dr. {rand.choice(FIRST_NAMES)} {rand.choice(LAST_NAMES)} ({i})",
+            "zoom_id": "host" if i == n_participants // 2 else f"user-{i}",
+            "email": None,
+            "joined_at": joined_at,
+            "created_at": joined_at,
+        }
+        for i in range(n_participants)
+    )
+    meeting = {
+        "meeting_id": 123,
+        "zoom_user": "host@example.com",
+        "join_url": "https://zoom.us/j/123",
+        "passcode": "abc",
+        "topic": "Practice",
+        "host_id": "host",
+        "setup_at": joined_at,
+        "created_at": joined_at,
+    }
+    return _zoom.ZoomMeetingSnapshot(
+        meeting=meeting, zzzzoom_id=None, participants=participants
+    )
+
+
+def report(label: str, seconds: float):
+    print(f"{label:<40} {seconds / N_RUNS * 1e6:10.1f} µs/render")
+
+
+def main():
+    snapshot = make_snapshot(N_PARTICIPANTS)
+    print(f"Rendering a {N_PARTICIPANTS}-participant meeting ({N_RUNS} runs)\n")
+
+    def render_cold():
+        _zoom.get_participant_first_name.cache_clear()
+        _zoom._get_participant_emojis_for_date.cache_clear()
+        _zoom.make_zoom_embed(snapshot)
+
+    def render_warm():
+        _zoom.make_zoom_embed(snapshot)
+
+    report("make_zoom_embed (cold caches)", timeit.timeit(render_cold, number=N_RUNS))
+    render_warm()
+    report("make_zoom_embed (warm caches)", timeit.timeit(render_warm, number=N_RUNS))
+    print(f"\n{_zoom.get_participant_first_name.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""Optimize lib/handshapes/assets/*.png in place and generate the smaller image
+variants from them.
+
+Requires Pillow (see requirements-dev.txt). Run after adding or changing a source
+image and commit the updated files; tests/lib/test_handshapes.py checks that
+they are up to date.
+"""
+
+import handshapes
+from handshapes.assets_pipeline import render_variant
+
+
+def main():
+    # "full" comes first, so the sources are optimized before the other sizes
+    #   are generated from them
+    for size in handshapes.SIZES:
+        total_before = total_after = 0
+        for name in handshapes.HANDSHAPE_NAMES:
+            source_path = handshapes.get_source_path(name)
+            total_before += source_path.stat().st_size
+            output_path = handshapes.get_variant_path(name, size)
+            output_path.parent.mkdir(exist_ok=True)
+            output_path.write_bytes(render_variant(source_path, size))
+            total_after += output_path.stat().st_size
+        print(
+            f"{size}: {total_before // 1024}KB -> {total_after // 1024}KB "
+            f"({len(handshapes.HANDSHAPE_NAMES)} images)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""Compile the catchphrase and cuteid word lists into their snapshot files.
+
+Runs as part of building the lib package (see setup.py), which ships the snapshots
+as package data. The build passes its output directory; without one, the snapshots
+are written next to the sources. Loading the word lists from a source checkout also
+rewrites them whenever the sources change, so this is only needed to write them
+ahead of time:
+
+    PYTHONPATH=lib python script/build_word_snapshots.py
+"""
+import sys
+from pathlib import Path
+from typing import Optional
+
+import catchphrase
+import cuteid
+from wordtable import get_fingerprint, write_snapshot
+
+
+def main(output_dir: Optional[Path] = None):
+    for module in (catchphrase, cuteid):
+        path = module.SNAPSHOT_PATH
+        if output_dir is not None:
+            path = output_dir / module.__name__ / path.name
+        fingerprint = get_fingerprint(module.SOURCES, version=module.SNAPSHOT_VERSION)
+        write_snapshot(path, module.build_snapshot(), fingerprint=fingerprint)
+        print(f"Wrote to: {path}")
+
+
+if __name__ == "__main__":
+    main(Path(sys.argv[1]) if len(sys.argv) > 1 else None)
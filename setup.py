@@ -1,4 +1,23 @@
+import os
+import subprocess
+import sys
+
 from setuptools import find_packages, setup
+from setuptools.command.build_py import build_py
+
+
+class BuildPyWithWordSnapshots(build_py):
+    """Compile word list snapshots into the built catchphrase and cuteid packages."""
+
+    def run(self):
+        super().run()
+        if self.dry_run:
+            return
+        subprocess.check_call(
+            [sys.executable, "script/build_word_snapshots.py", self.build_lib],
+            env={**os.environ, "PYTHONPATH": "lib"},
+        )
+
 
 setup(
     name="howsignbot-lib",
@@ -10,7 +29,8 @@ setup(
         "catchphrase": ["*.yaml", "*.json"],
         "clthat": ["*.json"],
         "cuteid": ["*.json"],
-        "handshapes": ["assets/*.png"],
+        "handshapes": ["assets/*.png", "assets/*/*.png"],
     },
     include_package_data=True,
+    cmdclass={"build_py": BuildPyWithWordSnapshots},
 )
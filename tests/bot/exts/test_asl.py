@@ -30,6 +30,24 @@ def test_sign_long_input():
         asl.sign_impl("a" * 101)
 
 
+def test_sign_links_are_cached():
+    asl._render_word_display.cache_clear()
+    first = asl.sign_impl("hello, thank you")
+    second = asl.sign_impl("hello, thank you")
+    assert first["embed"].to_dict() == second["embed"].to_dict()
+    info = asl._render_word_display.cache_info()
+    assert info.misses == 2
+    assert info.hits == 2
+
+
+def test_sign_links_cache_ignores_case_and_whitespace():
+    asl._render_word_display.cache_clear()
+    assert asl.word_display("Tiger") == asl.word_display(" tiger ")
+    info = asl._render_word_display.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
 @pytest.mark.parametrize("name", ("random", "open8", "open9"))
 def test_handshape(snapshot, name):
     result = asl.handshape_impl(name)
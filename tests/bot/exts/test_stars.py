@@ -0,0 +1,39 @@
+import os
+
+import pytest
+
+# Must be before bot import
+os.environ["TESTING"] = "true"
+
+from bot.exts import stars  # noqa:E402
+
+
+async def give_stars(store, to_user_id: int, n_stars: int):
+    await store.give_stars(
+        from_user_id=1,
+        to_user_id=to_user_id,
+        n_stars=n_stars,
+        message_id=None,
+        jump_url=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_leaderboard_applies_refreshes_made_while_loading(store, monkeypatch):
+    await give_stars(store, 2, 1)
+    await give_stars(store, 3, 1)
+    leaderboard = stars.StarLeaderboard()
+    list_user_stars = store.list_user_stars
+
+    async def list_user_stars_then_give(*args, **kwargs):
+        records = await list_user_stars(*args, **kwargs)
+        # Stars given after the query ran
+        await give_stars(store, 3, 5)
+        await leaderboard.refresh(3)
+        return records
+
+    monkeypatch.setattr(store, "list_user_stars", list_user_stars_then_give)
+    assert await leaderboard.get_top(2) == [(3, 6), (2, 1)]
+    rank = await leaderboard.get_rank(2)
+    assert rank is not None
+    assert rank.rank == 2
@@ -0,0 +1,80 @@
+import os
+
+import pytest
+from aiohttp.test_utils import make_mocked_request
+from freezegun import freeze_time
+
+# Must be before bot import
+os.environ["TESTING"] = "true"
+
+from bot.exts import topics  # noqa:E402
+
+TOPICS = ["cats or dogs?", "favorite food?", "best vacation?", "dream job?"]
+
+
+@pytest.fixture(autouse=True)
+def topic_cache():
+    topics.topic_cache.set(TOPICS)
+
+
+@freeze_time("2021-06-01 12:30:15")
+@pytest.mark.asyncio
+async def test_totm():
+    response = await topics.totm(make_mocked_request("GET", "/totm"))
+    assert response.status == 200
+    topic = response.text
+    assert topic == topics.get_minute_random().choice(TOPICS)
+    assert response.headers["Cache-Control"] == "public, max-age=45"
+
+    response = await topics.totm(
+        make_mocked_request(
+            "GET", "/totm", headers={"If-None-Match": f'"{response.etag.value}"'}
+        )
+    )
+    assert response.status == 304
+
+
+@pytest.mark.asyncio
+async def test_get_minute_topic_with_seed():
+    with freeze_time("2021-06-01 12:30:15"):
+        topic = await topics.topic_cache.get_minute_topic("abc")
+        assert topic == topics.get_minute_random("abc").choice(TOPICS)
+        assert await topics.topic_cache.get_minute_topic("abc") == topic
+    with freeze_time("2021-06-01 12:31:15"):
+        assert await topics.topic_cache.get_minute_topic(
+            "abc"
+        ) == topics.get_minute_random("abc").choice(TOPICS)
+
+
+@pytest.mark.asyncio
+async def test_save_topics(store):
+    async with store.transaction():
+        changes = await store.save_topics(["cats?", "dogs?", "cats?"])
+    assert changes.added == ["cats?", "dogs?"]
+    assert changes.total == 2
+
+    async with store.transaction():
+        changes = await store.save_topics(["dogs?", "birds?"])
+    assert changes.added == ["birds?"]
+    assert changes.removed == ["cats?"]
+    assert await store.get_all_topics() == ["birds?", "dogs?"]
+
+    assert "+ birds?" in topics.format_topic_changes(changes)
+    async with store.transaction():
+        changes = await store.save_topics(["dogs?", "birds?"])
+    assert changes.added == changes.removed == []
+    assert topics.format_topic_changes(changes) == ""
+
+    async with store.transaction():
+        await store.save_topics(["d?", "b?", "c?", "a?"])
+    async with store.transaction():
+        changes = await store.save_topics([])
+    # Removed topics are listed in the same order as get_all_topics
+    assert changes.removed == ["a?", "b?", "c?", "d?"]
+
+
+@pytest.mark.asyncio
+async def test_sync_topics_loads_cache_in_database_order(store, monkeypatch):
+    monkeypatch.setattr(topics, "get_gsheet_topics", lambda: ["dogs?", "cats?"])
+    await topics.sync_topics()
+    assert await topics.topic_cache.get_all() == ["cats?", "dogs?"]
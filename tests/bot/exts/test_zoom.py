@@ -1,12 +1,23 @@
+import datetime as dt
 import os
+from unittest import mock
 
+import disnake
 import pytest
+from disnake.ext.commands import Bot
 
 # Must be before bot import
 os.environ["TESTING"] = "true"
 
 from bot.bot import bot  # noqa:E402
+from bot.exts.meetings._zoom import (  # noqa:E402
+    edit_zoom_messages,
+    get_zoom_meeting_snapshot,
+    make_zoom_send_kwargs,
+)
+from bot.exts.meetings.meetings import Meetings  # noqa:E402
 from bot.exts.meetings.zoom_webhooks import handle_zoom_event  # noqa:E402
+from bot.utils.reactions import reaction_dispatcher  # noqa:E402
 
 # Copied examples from https://marketplace.zoom.us/docs/api-reference/webhook-reference/meeting-events/
 PARTICIPANT_JOINED = {
@@ -91,3 +102,161 @@ MEETING_ENDED = {
 async def test_handle_zoom_event(data, db):
     # Just test that the handler doesn't raise any uncaught exceptions
     await handle_zoom_event(bot, data)
+
+
+@pytest.mark.asyncio
+async def test_get_zoom_meeting_snapshot(store):
+    await store.create_zoom_meeting(
+        zoom_user="bob@example.com",
+        meeting_id=222222222,
+        join_url="https://zoom.us/j/222222222",
+        passcode="abc",
+        topic="Practice",
+        set_up=True,
+    )
+    snapshot = await get_zoom_meeting_snapshot(222222222)
+    assert snapshot.meeting["join_url"] == "https://zoom.us/j/222222222"
+    assert snapshot.zzzzoom_id is None
+    assert snapshot.participants == ()
+
+    await store.create_zzzzoom_meeting(meeting_id=222222222)
+    for name in ("shree", "steve"):
+        await store.add_zoom_participant(
+            meeting_id=222222222,
+            name=name,
+            zoom_id=None,
+            email=None,
+            joined_at=dt.datetime(2019, 7, 16, tzinfo=dt.timezone.utc),
+        )
+    snapshot = await get_zoom_meeting_snapshot(222222222)
+    assert snapshot.zzzzoom_id is not None
+    assert snapshot.join_url.endswith(snapshot.zzzzoom_id)
+    assert [p["name"] for p in snapshot.participants] == ["shree", "steve"]
+
+    send_kwargs = await make_zoom_send_kwargs(222222222, guild_id=None, snapshot=snapshot)
+    assert send_kwargs["embed"].fields[-1].name == "👥 Participants"
+    assert "view" not in send_kwargs
+
+
+@pytest.mark.asyncio
+async def test_edit_zoom_messages_does_not_fetch():
+    channel = mock.Mock(spec=disnake.TextChannel)
+    channel.get_partial_message.side_effect = lambda message_id: message_id
+    mock_bot = mock.Mock(spec=Bot)
+    mock_bot.get_channel.return_value = channel
+    zoom_messages = [
+        {"channel_id": 1, "message_id": 10},
+        {"channel_id": 2, "message_id": 20},
+        {"channel_id": 1, "message_id": 11},
+    ]
+
+    async def edit(message_id):
+        return message_id * 2
+
+    result = await edit_zoom_messages(mock_bot, zoom_messages, edit)
+    assert result.edited == [20, 40, 22]
+    assert result.failed == []
+    channel.fetch_message.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_edit_zoom_messages_in_uncached_channel():
+    partial_messageable = mock.Mock(spec=disnake.PartialMessageable)
+    partial_messageable.get_partial_message.side_effect = lambda message_id: message_id
+    mock_bot = mock.Mock(spec=Bot)
+    mock_bot.get_channel.return_value = None
+    mock_bot.get_partial_messageable.return_value = partial_messageable
+
+    async def edit(message_id):
+        return message_id
+
+    result = await edit_zoom_messages(
+        mock_bot, [{"channel_id": 1, "message_id": 10}], edit
+    )
+    assert result.edited == [10]
+    mock_bot.get_partial_messageable.assert_called_once_with(1)
+    mock_bot.fetch_channel.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_edit_zoom_messages_reports_failures():
+    channel = mock.Mock(spec=disnake.TextChannel)
+    channel.get_partial_message.side_effect = lambda message_id: message_id
+    mock_bot = mock.Mock(spec=Bot)
+    mock_bot.get_channel.return_value = channel
+    zoom_messages = [
+        {"channel_id": 1, "message_id": 10},
+        {"channel_id": 1, "message_id": 11},
+    ]
+
+    async def edit(message_id):
+        if message_id == 11:
+            raise ValueError
+        return message_id
+
+    result = await edit_zoom_messages(mock_bot, zoom_messages, edit)
+    assert result.edited == [10]
+    assert result.failed == [zoom_messages[1]]
+
+
+def make_http_error(error_class, status):
+    return error_class(mock.Mock(status=status, reason="error"), "error")
+
+
+@pytest.mark.asyncio
+async def test_zoom_stop_keeps_messages_that_were_not_scrubbed(store):
+    meeting_id = 333333333
+    await store.create_zoom_meeting(
+        zoom_user="bob@example.com",
+        meeting_id=meeting_id,
+        join_url=f"https://zoom.us/j/{meeting_id}",
+        passcode="abc",
+        topic="Practice",
+        set_up=True,
+    )
+    for message_id in (30, 31, 32):
+        await store.create_zoom_message(
+            meeting_id=meeting_id, message_id=message_id, channel_id=1
+        )
+    edit_errors = {
+        31: make_http_error(disnake.HTTPException, 500),
+        # Deleted messages count as scrubbed
+        32: make_http_error(disnake.NotFound, 404),
+    }
+
+    def get_partial_message(message_id):
+        return mock.Mock(
+            id=message_id,
+            jump_url=f"https://discord.com/channels/1/1/{message_id}",
+            edit=mock.AsyncMock(side_effect=edit_errors.get(message_id)),
+            clear_reaction=mock.AsyncMock(),
+        )
+
+    channel = mock.Mock(spec=disnake.TextChannel)
+    channel.get_partial_message.side_effect = get_partial_message
+    mock_bot = mock.Mock(spec=Bot)
+    mock_bot.get_channel.return_value = channel
+    inter = mock.Mock(send=mock.AsyncMock())
+    cog = Meetings(mock_bot)
+    try:
+        await Meetings.zoom_stop.callback(cog, inter, meeting_id_str=str(meeting_id))
+    finally:
+        reaction_dispatcher.unregister(cog)
+
+    assert await store.zoom_meeting_exists(meeting_id=meeting_id)
+    remaining = await store.get_zoom_messages(meeting_id=meeting_id)
+    assert [message["message_id"] for message in remaining] == [31]
+    [reply], _ = inter.send.await_args
+    assert "Could not remove meeting details" in reply
+    assert reply.endswith("https://discord.com/channels/1/1/31")
+
+    # Retrying after the edit succeeds ends the meeting
+    del edit_errors[31]
+    inter.send.reset_mock()
+    cog = Meetings(mock_bot)
+    try:
+        await Meetings.zoom_stop.callback(cog, inter, meeting_id_str=str(meeting_id))
+    finally:
+        reaction_dispatcher.unregister(cog)
+    assert not await store.zoom_meeting_exists(meeting_id=meeting_id)
+    inter.send.assert_awaited_once_with("🛑 Meeting details removed.")
@@ -0,0 +1,95 @@
+import asyncio
+import os
+
+import pytest
+
+# Must be before bot import
+os.environ["TESTING"] = "true"
+
+from bot.graphql import loaders  # noqa:E402
+from bot.utils.supervisor import supervisor  # noqa:E402
+
+
+@pytest.mark.asyncio
+async def test_data_loader_batches_keys_in_a_supervised_task():
+    calls = []
+
+    async def batch_load(keys):
+        calls.append(keys)
+        await asyncio.sleep(0)
+        return {key: key.upper() for key in keys if key != "missing"}
+
+    loader = loaders.DataLoader(batch_load)
+    futures = [
+        loader.load("a"),
+        loader.load("b"),
+        loader.load("a"),
+        loader.load("missing"),
+    ]
+    n_tasks = len(supervisor)
+    await asyncio.sleep(0)
+    # The dispatch task is referenced by the supervisor until it finishes
+    assert len(supervisor) == n_tasks + 1
+    assert await asyncio.gather(*futures) == ["A", "B", "A", None]
+    assert calls == [["a", "b", "missing"]]
+
+
+def get_dispatch_task() -> asyncio.Task:
+    (task,) = (
+        task for task in asyncio.all_tasks() if task.get_name() == "dataloader dispatch"
+    )
+    return task
+
+
+@pytest.mark.asyncio
+async def test_data_loader_cancels_futures_when_dispatch_is_cancelled():
+    started = asyncio.Event()
+
+    async def batch_load(keys):
+        started.set()
+        await asyncio.sleep(10)
+
+    loader = loaders.DataLoader(batch_load)
+    future = loader.load("a")
+    await started.wait()
+    get_dispatch_task().cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await future
+    # Failed keys can be loaded again
+    assert loader.load("a") is not future
+
+
+@pytest.mark.asyncio
+async def test_data_loader_cancels_futures_when_dispatch_is_cancelled_before_starting():
+    async def batch_load(keys):
+        return {}
+
+    loader = loaders.DataLoader(batch_load)
+    future = loader.load("a")
+    # Let the dispatch be spawned, but not started
+    await asyncio.sleep(0)
+    get_dispatch_task().cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await future
+
+
+@pytest.mark.asyncio
+async def test_join_url_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(loaders, "JOIN_URL_CACHE_MAX_SIZE", 2)
+    monkeypatch.setattr(loaders, "_join_url_cache", loaders.OrderedDict())
+    fetched = []
+
+    async def get_zzzzoom_join_urls(ids):
+        fetched.extend(ids)
+        return {id: f"https://zoom.us/j/{id}" for id in ids}
+
+    monkeypatch.setattr(loaders.store, "get_zzzzoom_join_urls", get_zzzzoom_join_urls)
+    await loaders.load_join_urls(["a", "b"])
+    await loaders.load_join_urls(["a"])
+    await loaders.load_join_urls(["c"])
+    assert list(loaders._join_url_cache) == ["a", "c"]
+    assert await loaders.load_join_urls(["a", "c"]) == {
+        "a": "https://zoom.us/j/a",
+        "c": "https://zoom.us/j/c",
+    }
+    assert fetched == ["a", "b", "c"]
@@ -0,0 +1,123 @@
+import os
+from unittest import mock
+
+import graphql
+import pytest
+from graphql import GraphQLError
+from graphql.validation import ValidationRule
+
+# Must be before bot import
+os.environ["TESTING"] = "true"
+
+from bot.graphql import persisted  # noqa:E402
+from bot.graphql.schema import schema  # noqa:E402
+
+QUERY = "query Typename { __typename }"
+
+
+@pytest.fixture(autouse=True)
+def clear_queries():
+    persisted._queries.clear()
+
+
+def persisted_query(query_hash):
+    return {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}
+
+
+@pytest.mark.asyncio
+async def test_persisted_query():
+    query_hash = persisted.get_query_hash(QUERY)
+    success, result = await persisted.execute_graphql(
+        schema, {"extensions": persisted_query(query_hash)}
+    )
+    assert not success
+    assert result["errors"][0]["message"] == "PersistedQueryNotFound"
+    assert persisted.is_persisted_query_not_found(result)
+
+    success, result = await persisted.execute_graphql(
+        schema, {"query": QUERY, "extensions": persisted_query(query_hash)}
+    )
+    assert success
+    assert result == {"data": {"__typename": "Query"}}
+
+    success, result = await persisted.execute_graphql(
+        schema, {"extensions": persisted_query(query_hash)}
+    )
+    assert success
+    assert result == {"data": {"__typename": "Query"}}
+
+
+@pytest.mark.asyncio
+async def test_ariadne_options_are_passed_through():
+    query = "{ __schema { queryType { name } } }"
+    success, result = await persisted.execute_graphql(
+        schema,
+        {"query": query, "extensions": persisted_query(persisted.get_query_hash(query))},
+        introspection=False,
+    )
+    assert not success
+    assert "introspection is disabled" in result["errors"][0]["message"]
+    assert not persisted.is_persisted_query_not_found(result)
+
+
+@pytest.mark.asyncio
+async def test_documents_are_parsed_and_validated_once():
+    with mock.patch.object(
+        persisted, "parse", wraps=graphql.parse
+    ) as parse, mock.patch.object(
+        persisted, "validate", wraps=graphql.validate
+    ) as validate:
+        for _ in range(3):
+            success, result = await persisted.execute_graphql(schema, {"query": QUERY})
+            assert success
+            assert result == {"data": {"__typename": "Query"}}
+    assert parse.call_count == 1
+    assert validate.call_count == 1
+
+
+class NoTypenameRule(ValidationRule):
+    def enter_field(self, node, *_args):
+        if node.name.value == "__typename":
+            self.report_error(GraphQLError("__typename is not allowed", node))
+
+
+@pytest.mark.asyncio
+async def test_cached_documents_are_validated_against_new_rules():
+    success, _ = await persisted.execute_graphql(schema, {"query": QUERY})
+    assert success
+
+    success, result = await persisted.execute_graphql(
+        schema, {"query": QUERY}, validation_rules=[NoTypenameRule]
+    )
+    assert not success
+    assert result["errors"][0]["message"] == "__typename is not allowed"
+
+
+@pytest.mark.asyncio
+async def test_persisted_query_hash_mismatch():
+    success, result = await persisted.execute_graphql(
+        schema, {"query": QUERY, "extensions": persisted_query("nope")}
+    )
+    assert not success
+    assert "does not match" in result["errors"][0]["message"]
+
+
+@pytest.mark.asyncio
+async def test_invalid_query_is_not_stored():
+    query = "{ nope }"
+    success, result = await persisted.execute_graphql(
+        schema,
+        {"query": query, "extensions": persisted_query(persisted.get_query_hash(query))},
+    )
+    assert not success
+    assert persisted._queries == {}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("persisted_query", ("abc", ["abc"], 1))
+async def test_malformed_persisted_query(persisted_query):
+    success, result = await persisted.execute_graphql(
+        schema, {"query": QUERY, "extensions": {"persistedQuery": persisted_query}}
+    )
+    assert not success
+    assert "JSON object" in result["errors"][0]["message"]
@@ -0,0 +1,61 @@
+import os
+from unittest import mock
+
+import pytest
+from ariadne import graphql
+
+# Must be before bot import
+os.environ["TESTING"] = "true"
+
+from bot.graphql import loaders  # noqa:E402
+from bot.graphql.middleware import middleware, resolver_timings  # noqa:E402
+from bot.graphql.schema import schema  # noqa:E402
+
+QUERY = """
+query Meetings($a: String!, $b: String!) {
+  a: meeting(id: $a) { url }
+  b: meeting(id: $b) { url }
+  again: meeting(id: $a) { url }
+}
+"""
+
+
+@pytest.mark.asyncio
+async def test_meetings_are_loaded_in_one_query(store):
+    zzzzoom_ids = []
+    for meeting_id in (333333333, 444444444):
+        await store.create_zoom_meeting(
+            zoom_user="bob@example.com",
+            meeting_id=meeting_id,
+            join_url=f"https://zoom.us/j/{meeting_id}",
+            passcode="abc",
+            topic="Practice",
+            set_up=True,
+        )
+        await store.create_zzzzoom_meeting(meeting_id=meeting_id)
+        zzzzoom_meeting = await store.get_zzzzoom_meeting_for_zoom_meeting(meeting_id)
+        zzzzoom_ids.append(zzzzoom_meeting["id"])
+    loaders._join_url_cache.clear()
+
+    data = {"query": QUERY, "variables": {"a": zzzzoom_ids[0], "b": zzzzoom_ids[1]}}
+    with mock.patch.object(
+        store, "get_zzzzoom_join_urls", wraps=store.get_zzzzoom_join_urls
+    ) as get_join_urls:
+        success, result = await graphql(
+            schema, data, context_value={}, middleware=middleware
+        )
+        assert success
+        assert result["data"] == {
+            "a": {"url": "https://zoom.us/j/333333333"},
+            "b": {"url": "https://zoom.us/j/444444444"},
+            "again": {"url": "https://zoom.us/j/333333333"},
+        }
+        get_join_urls.assert_called_once()
+
+        # Join URLs are cached across requests
+        success, result = await graphql(
+            schema, data, context_value={}, middleware=middleware
+        )
+        assert success
+        get_join_urls.assert_called_once()
+    assert resolver_timings["Query.meeting"].count >= 6
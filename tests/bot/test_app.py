@@ -0,0 +1,34 @@
+import os
+
+import pytest
+from aiohttp.test_utils import make_mocked_request
+
+# Must be before bot import
+os.environ["TESTING"] = "true"
+
+from bot import app, settings  # noqa:E402
+
+
+def metrics_request(authorization=None):
+    headers = {"Authorization": authorization} if authorization else {}
+    return make_mocked_request("GET", "/metrics", headers=headers)
+
+
+@pytest.mark.asyncio
+async def test_metrics_requires_token(monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "s3cret")
+
+    response = await app.metrics_handler(metrics_request())
+    assert response.status == 401
+    response = await app.metrics_handler(metrics_request("Bearer nope"))
+    assert response.status == 401
+    response = await app.metrics_handler(metrics_request("Bearer s3cret"))
+    assert response.status == 200
+    assert b"# TYPE" in response.body
+
+
+@pytest.mark.asyncio
+async def test_metrics_disabled_without_token(monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", None)
+    response = await app.metrics_handler(metrics_request("Bearer "))
+    assert response.status == 404
@@ -0,0 +1,259 @@
+import asyncio
+import datetime as dt
+import logging
+import os
+import uuid
+from contextlib import suppress
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy import create_engine
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy_utils import create_database, drop_database
+
+# Must be before bot import
+os.environ["TESTING"] = "true"
+
+from bot import database, settings  # noqa:E402
+from bot.utils.leaderboard import Leaderboard  # noqa:E402
+from bot.utils.query_stats import get_method_stats  # noqa:E402
+
+
+@pytest.mark.asyncio
+async def test_store_methods_record_stats(store):
+    await store.save_topics(["cats or dogs?", "favorite food?"])
+    stats = get_method_stats("get_all_topics")
+    count, rows = stats.count, stats.rows
+    assert await store.get_all_topics() == ["cats or dogs?", "favorite food?"]
+
+    assert stats.count == count + 1
+    assert stats.rows == rows + 2
+    assert stats.percentile(50) > 0
+
+
+@pytest.mark.asyncio
+async def test_slow_queries_are_logged(store, monkeypatch, caplog):
+    monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD", 0)
+    with caplog.at_level(logging.WARNING, logger="bot.database"):
+        await store.get_user_stars(123)
+    assert "slow query in get_user_stars" in caplog.text
+    assert "FROM user_stars" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_cached_statements(store):
+    await store.give_stars(
+        from_user_id=1, to_user_id=2, n_stars=1, message_id=None, jump_url=None
+    )
+    await store.give_stars(
+        from_user_id=1, to_user_id=2, n_stars=2, message_id=None, jump_url=None
+    )
+    assert await store.get_user_stars(2) == 3
+    await store.remove_stars(
+        from_user_id=1, to_user_id=2, n_stars=1, message_id=None, jump_url=None
+    )
+    assert await store.get_user_stars(2) == 2
+    assert await store.get_user_stars(3) == 0
+
+
+def test_compile_statement():
+    sql = database.compile_statement(
+        database.user_stars.select().where(
+            database.user_stars.c.user_id == sa.bindparam("user_id")
+        )
+    )
+    assert sql.endswith("WHERE user_stars.user_id = :user_id")
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_when_saturated(create_test_database):
+    db = database.InstrumentedDatabase(
+        settings.TEST_DATABASE_URL, name="test", min_size=1, max_size=2
+    )
+    await db.connect()
+    try:
+        queries = [
+            asyncio.create_task(db.fetch_val("SELECT pg_sleep(0.1)")) for _ in range(4)
+        ]
+        await asyncio.sleep(0.05)
+        stats = db.get_pool_stats()
+        assert stats.size == 2
+        assert stats.max_size == 2
+        assert stats.in_use == 2
+        assert stats.waiting == 2
+        await asyncio.gather(*queries)
+        stats = db.get_pool_stats()
+        assert (stats.in_use, stats.waiting) == (0, 0)
+    finally:
+        await db.disconnect()
+    assert db.get_pool_stats().size == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_acquire_timeout(create_test_database):
+    db = database.InstrumentedDatabase(
+        settings.TEST_DATABASE_URL,
+        name="test",
+        acquire_timeout=0.05,
+        min_size=1,
+        max_size=1,
+    )
+    await db.connect()
+    try:
+        query = asyncio.create_task(db.fetch_val("SELECT pg_sleep(0.2)"))
+        await asyncio.sleep(0.01)
+        with pytest.raises(asyncio.TimeoutError):
+            await db.fetch_val("SELECT 1")
+        assert db.get_pool_stats().waiting == 0
+        await query
+        # The timed out caller didn't leak a connection
+        assert await db.fetch_val("SELECT 1") == 1
+        stats = db.get_pool_stats()
+        assert (stats.in_use, stats.waiting) == (0, 0)
+    finally:
+        await db.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_transaction_queries_share_a_checkout(create_test_database):
+    db = database.InstrumentedDatabase(
+        settings.TEST_DATABASE_URL,
+        name="test",
+        acquire_timeout=0.05,
+        min_size=1,
+        max_size=1,
+    )
+    await db.connect()
+    try:
+        async with db.checkout(), db.transaction():
+            assert await db.fetch_val("SELECT 1") == 1
+            assert db.get_pool_stats().in_use == 1
+    finally:
+        await db.disconnect()
+
+
+@pytest.fixture
+async def replicated_store(create_test_database):
+    """Store with a separate database standing in for the read replica."""
+    replica_url = str(settings.TEST_DATABASE_URL.replace(database="test_replica"))
+    with suppress(ProgrammingError):
+        drop_database(replica_url)
+    create_database(replica_url)
+    database.metadata.create_all(create_engine(replica_url))
+    store = database.Store(settings.TEST_DATABASE_URL, replica_url=replica_url)
+    await store.connect()
+    yield store
+    await store.db.execute(database.topics.delete())
+    await store.disconnect()
+    drop_database(replica_url)
+
+
+@pytest.mark.asyncio
+async def test_read_only_queries_use_replica(replicated_store):
+    store = replicated_store
+    await store.replica_db.execute(
+        database.topics.insert().values(content="from replica", last_synced_at=None)
+    )
+    assert await store.get_all_topics() == ["from replica"]
+
+
+@pytest.mark.asyncio
+async def test_primary_reads(replicated_store):
+    store = replicated_store
+    async with store.transaction():
+        await store.save_topics(["from primary"])
+        # Transactions read from the primary
+        assert await store.get_all_topics() == ["from primary"]
+    # Writes alone don't route later reads to the primary
+    assert await store.get_all_topics() == []
+    with store.primary_reads():
+        assert await store.get_all_topics() == ["from primary"]
+        # Tasks started within the block inherit it
+        assert await asyncio.create_task(store.get_all_topics()) == ["from primary"]
+    assert await store.get_all_topics() == []
+
+
+async def get_star_log_partition(store, log_id) -> str:
+    return await store.db.fetch_val(
+        "SELECT tableoid::regclass::text FROM star_logs WHERE id = :id", {"id": log_id}
+    )
+
+
+@pytest.mark.asyncio
+async def test_ensure_star_log_partitions(store):
+    month = database.get_month_start(database.now(), 2)
+    log_id = uuid.uuid4()
+    await store.db.execute(
+        database.star_logs.insert().values(
+            id=log_id, to_user_id=123, action="ADD", created_at=month
+        )
+    )
+
+    await store.ensure_star_log_partitions()
+    assert await store.ensure_star_log_partitions() == []
+
+    partitions = await store.get_star_log_partitions()
+    assert "star_logs_default" in partitions
+    for months in range(database.STAR_LOG_PARTITIONS_AHEAD + 1):
+        month = database.get_month_start(database.now(), months)
+        assert database.get_star_log_partition_name(month) in partitions
+    # Rows in the default partition are moved into the new partition
+    assert await get_star_log_partition(store, log_id) == "star_logs_y{:%Ym%m}".format(
+        database.get_month_start(database.now(), 2)
+    )
+
+
+@pytest.mark.asyncio
+async def test_detach_star_log_partitions(store):
+    month = dt.datetime(2001, 1, 1, tzinfo=dt.timezone.utc)
+    await store.create_star_log_partition(month)
+    await store.db.execute(
+        database.star_logs.insert().values(
+            id=uuid.uuid4(),
+            to_user_id=456,
+            jump_url="https://discord.com/channels/1/2/3",
+            action="ADD",
+            created_at=month + dt.timedelta(days=3),
+        )
+    )
+    assert await store.list_user_star_highlight_logs(456, limit=10, after=None)
+
+    assert await store.detach_star_log_partitions(before=month) == []
+    assert await store.detach_star_log_partitions(
+        before=database.get_month_start(month, 1)
+    ) == ["star_logs_y2001m01"]
+    assert "star_logs_y2001m01" not in await store.get_star_log_partitions()
+    assert await store.list_user_star_highlight_logs(456, limit=10, after=None) == []
+    await store.db.execute("DROP TABLE star_logs_y2001m01")
+
+
+@pytest.mark.asyncio
+async def test_get_user_star_rank(store):
+    for user_id, star_count in ((1001, 7), (1002, 9), (1003, 7), (1004, 1)):
+        await store.set_user_stars(
+            from_user_id=0, to_user_id=user_id, star_count=star_count
+        )
+    records = await store.list_user_stars()
+    leaderboard = Leaderboard(
+        {record["user_id"]: record["star_count"] for record in records}
+    )
+
+    assert await store.get_user_star_rank(1005) is None
+    for user_id in (1001, 1002, 1003, 1004):
+        rank = await store.get_user_star_rank(user_id, neighbors=2)
+        assert rank.rank == leaderboard.rank(user_id)
+        assert rank.star_count == leaderboard.get(user_id)
+        above, below = leaderboard.neighbors(user_id, 2)
+        assert rank.above == above
+        assert rank.below == below
+
+
+def test_create_star_log_partition_statements():
+    month = dt.datetime(2001, 12, 1, tzinfo=dt.timezone.utc)
+    create, move, attach = database.get_create_star_log_partition_statements(month)
+    assert create.startswith("CREATE TABLE star_logs_y2001m12 ")
+    assert move.compile().params == {"start": month, "end": month.replace(2002, 1)}
+    assert attach.endswith(
+        "FOR VALUES FROM ('2001-12-01T00:00:00+00:00'::timestamptz)"
+        " TO ('2002-01-01T00:00:00+00:00'::timestamptz)"
+    )
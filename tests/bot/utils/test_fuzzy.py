@@ -0,0 +1,42 @@
+import pytest
+
+from bot.utils.fuzzy import FuzzyIndex
+
+WORDS = ("1", "Bent3", "5", "Claw5", "Open8", "OpenA", "OpenB", "B", "BentB", "FlatB")
+
+
+@pytest.fixture
+def index():
+    return FuzzyIndex(WORDS)
+
+
+def test_contains_and_get(index):
+    assert "open8" in index
+    assert "nope" not in index
+    assert index.get("OPEN8") == "Open8"
+
+
+@pytest.mark.parametrize(
+    ("word", "expected"),
+    (
+        ("opn8", "Open8"),
+        ("claw 5", "Claw5"),
+        ("benb", "BentB"),
+        ("xyz", None),
+        ("", None),
+    ),
+)
+def test_did_you_mean(index, word, expected):
+    assert index.did_you_mean(word) == expected
+
+
+def test_prefix_matches(index):
+    assert index.prefix_matches("open") == ["Open8", "OpenA", "OpenB"]
+    assert index.prefix_matches("b") == ["B", "Bent3", "BentB"]
+
+
+def test_autocomplete(index):
+    assert index.autocomplete("") == list(WORDS)
+    assert index.autocomplete("", limit=2) == ["1", "Bent3"]
+    assert index.autocomplete("bent") == ["Bent3", "BentB"]
+    assert index.autocomplete("flt") == ["FlatB"]
@@ -0,0 +1,22 @@
+import os
+
+# Must be before bot import
+os.environ["TESTING"] = "true"
+
+from bot.utils.leaderboard import Entry, Leaderboard  # noqa:E402
+
+
+def test_leaderboard():
+    leaderboard = Leaderboard({1: 5, 2: 3, 3: 5, 4: 0})
+
+    assert len(leaderboard) == 3
+    assert 4 not in leaderboard
+    assert leaderboard.top(2) == [Entry(1, 5), Entry(3, 5)]
+    assert [leaderboard.rank(key) for key in (1, 2, 3, 4)] == [1, 3, 1, None]
+    assert leaderboard.neighbors(3, 1) == ([Entry(1, 5)], [Entry(2, 3)])
+
+    leaderboard.set(2, 6)
+    leaderboard.set(1, 0)
+    assert leaderboard.top(10) == [Entry(2, 6), Entry(3, 5)]
+    assert leaderboard.rank(3) == 2
+    assert leaderboard.neighbors(2, 5) == ([], [Entry(3, 5)])
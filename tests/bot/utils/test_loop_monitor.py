@@ -0,0 +1,35 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+# Must be before bot import
+os.environ["TESTING"] = "true"
+
+from bot.utils.loop_monitor import LoopMonitor  # noqa:E402
+
+
+def block_event_loop():
+    time.sleep(0.2)
+
+
+@pytest.mark.asyncio
+async def test_loop_monitor_records_blocking_code():
+    monitor = LoopMonitor(interval=0.01, threshold=0.1)
+    monitor.start()
+    try:
+        await asyncio.sleep(0.05)
+        block_event_loop()
+        await asyncio.sleep(0.05)
+    finally:
+        monitor.stop()
+
+    offenders = monitor.get_worst_offenders()
+    assert len(offenders) == 1
+    offender = offenders[0]
+    assert offender.count == 1
+    assert offender.max >= 0.1
+    assert offender.location.startswith("tests/bot/utils/test_loop_monitor.py:")
+    assert offender.location.endswith("in block_event_loop")
+    assert "time.sleep(0.2)" in offender.stack
@@ -0,0 +1,126 @@
+import asyncio
+import os
+from types import SimpleNamespace
+from unittest import mock
+
+import disnake
+import pytest
+
+# Must be before bot import
+os.environ["TESTING"] = "true"
+
+from bot.utils.message_cache import MessageCache  # noqa:E402
+
+
+def make_channel(*, error=None, delay=0):
+    async def fetch_message(message_id):
+        await asyncio.sleep(delay)
+        if error:
+            raise error
+        return SimpleNamespace(id=message_id, reactions=[])
+
+    return mock.Mock(fetch_message=mock.AsyncMock(side_effect=fetch_message))
+
+
+bot = mock.Mock(get_message=mock.Mock(return_value=None))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_fetches_are_coalesced():
+    cache = MessageCache()
+    channel = make_channel()
+
+    messages = await asyncio.gather(*(cache.fetch(bot, channel, 1) for _ in range(3)))
+
+    assert channel.fetch_message.await_count == 1
+    assert messages[0] is messages[1] is messages[2]
+    assert await cache.fetch(bot, channel, 1) is messages[0]
+    assert channel.fetch_message.await_count == 1
+
+    cache.invalidate(1)
+    await cache.fetch(bot, channel, 1)
+    assert channel.fetch_message.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_errors_are_shared():
+    cache = MessageCache()
+    channel = make_channel(error=disnake.NotFound(mock.Mock(status=404), "gone"))
+
+    results = await asyncio.gather(
+        *(cache.fetch(bot, channel, 1) for _ in range(2)), return_exceptions=True
+    )
+
+    assert all(isinstance(result, disnake.NotFound) for result in results)
+    assert channel.fetch_message.await_count == 1
+    assert cache.get(1) is None
+
+
+def test_least_recently_used_messages_are_evicted():
+    cache = MessageCache(maxsize=2)
+    for message_id in (1, 2):
+        cache.put(SimpleNamespace(id=message_id))
+    cache.get(1)
+    cache.put(SimpleNamespace(id=3))
+
+    assert cache.get(2) is None
+    assert cache.get(1) is not None
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_fetch():
+    cache = MessageCache()
+    channel = make_channel(delay=0.01)
+
+    first = asyncio.create_task(cache.fetch(bot, channel, 1))
+    second = asyncio.create_task(cache.fetch(bot, channel, 1))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert (await second).id == 1
+    assert first.cancelled()
+    assert channel.fetch_message.await_count == 1
+    assert cache.get(1) is not None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_during_fetch_discards_result():
+    cache = MessageCache()
+    channel = make_channel(delay=0.01)
+
+    fetch = asyncio.create_task(cache.fetch(bot, channel, 1))
+    await asyncio.sleep(0)
+    cache.invalidate(1)
+    await fetch
+
+    assert cache.get(1) is None
+    await cache.fetch(bot, channel, 1)
+    assert channel.fetch_message.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_messages_in_disnake_cache_are_not_fetched():
+    cache = MessageCache()
+    channel = make_channel()
+    message = SimpleNamespace(id=1, reactions=[])
+    disnake_bot = mock.Mock(get_message=mock.Mock(return_value=message))
+
+    assert await cache.fetch(disnake_bot, channel, 1) is message
+    assert channel.fetch_message.await_count == 0
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_refresh_skips_cached_copy_but_shares_in_flight_fetch():
+    cache = MessageCache()
+    channel = make_channel(delay=0.01)
+    cached = await cache.fetch(bot, channel, 1)
+
+    refreshed = await asyncio.gather(
+        *(cache.fetch(bot, channel, 1, refresh=True) for _ in range(2))
+    )
+
+    assert refreshed[0] is refreshed[1] is not cached
+    assert channel.fetch_message.await_count == 2
+    assert cache.get(1) is refreshed[0]
@@ -0,0 +1,64 @@
+import os
+
+import pytest
+
+# Must be before bot import
+os.environ["TESTING"] = "true"
+
+from bot.utils import metrics  # noqa:E402
+
+requests_total = metrics.Counter("test_requests", "Requests handled.", ("method", "path"))
+in_progress = metrics.Gauge("test_in_progress", "Requests in progress.")
+latency = metrics.Histogram(
+    "test_latency_seconds", "Request latency.", buckets=(0.1, 1.0)
+)
+
+
+def test_render():
+    requests_total.labels("GET", '/say "hi"').inc()
+    requests_total.labels("GET", '/say "hi"').inc(2)
+    in_progress.set(3)
+    latency.observe(0.05)
+    latency.observe(0.1)
+    latency.observe(5)
+
+    rendered = metrics.render()
+
+    assert "# TYPE test_requests counter" in rendered
+    assert 'test_requests_total{method="GET",path="/say \\"hi\\""} 3' in rendered
+    assert "test_in_progress 3" in rendered
+    assert "# TYPE test_latency_seconds histogram" in rendered
+    assert 'test_latency_seconds_bucket{le="0.1"} 2' in rendered
+    assert 'test_latency_seconds_bucket{le="1"} 2' in rendered
+    assert 'test_latency_seconds_bucket{le="+Inf"} 3' in rendered
+    assert "test_latency_seconds_sum 5.15" in rendered
+    assert "test_latency_seconds_count 3" in rendered
+
+
+def test_track_outbound_counts_errors():
+    with pytest.raises(ValueError):
+        with metrics.track_outbound("test", "fail"):
+            raise ValueError
+
+    assert metrics.outbound_request_errors.labels("test", "fail").value == 1
+    assert metrics.outbound_request_duration.labels("test", "fail").counts[-1] == 0
+    assert sum(metrics.outbound_request_duration.labels("test", "fail").counts) == 1
+
+
+@pytest.mark.asyncio
+async def test_store_methods_are_timed(store):
+    histogram = metrics.db_query_duration.labels("get_all_topics")
+    count = sum(histogram.counts)
+    await store.get_all_topics()
+    assert sum(histogram.counts) == count + 1
+
+
+def test_metric_types_must_implement_samples():
+    class Untyped(metrics.Metric):
+        type = "untyped"
+
+        def _new_child(self):
+            return object()
+
+    with pytest.raises(TypeError):
+        Untyped("test_untyped", "Not renderable.")
@@ -0,0 +1,186 @@
+import asyncio
+import os
+from types import SimpleNamespace
+from unittest import mock
+
+import disnake
+import pytest
+
+# Must be before bot import
+os.environ["TESTING"] = "true"
+
+from bot.utils.reactions import (  # noqa:E402
+    REACTION_ADD,
+    REACTION_REMOVE,
+    CloseMessages,
+    ReactionDispatcher,
+)
+
+BOT_USER_ID = 1
+
+
+def make_bot(*, author_id: int):
+    channel = mock.Mock(
+        fetch_message=mock.AsyncMock(
+            side_effect=lambda message_id: SimpleNamespace(
+                id=message_id, author=SimpleNamespace(id=author_id)
+            )
+        )
+    )
+    return mock.Mock(
+        user=SimpleNamespace(id=BOT_USER_ID),
+        get_user=mock.Mock(return_value=SimpleNamespace(bot=False)),
+        get_channel=mock.Mock(return_value=channel),
+        get_message=mock.Mock(return_value=None),
+    )
+
+
+def make_payload(emoji: str, *, message_id: int, event_type: str = REACTION_ADD):
+    return disnake.RawReactionActionEvent(
+        {"message_id": message_id, "channel_id": 10, "user_id": 20, "guild_id": 30},
+        disnake.PartialEmoji(name=emoji),
+        event_type,
+    )
+
+
+@pytest.mark.asyncio
+async def test_dispatch_routes_by_emoji_and_event():
+    dispatcher = ReactionDispatcher()
+    calls = []
+
+    async def handler(payload, message):
+        calls.append((str(payload.emoji), payload.event_type, message.id))
+
+    owner = object()
+    dispatcher.register(("⭐",), handler, owner=owner)
+    dispatcher.register(("🛑",), handler, events=(REACTION_REMOVE,), owner=owner)
+    dispatcher.register(("⭐",), handler, predicate=lambda payload: False, owner=owner)
+    bot = make_bot(author_id=2)
+
+    await dispatcher.dispatch(bot, make_payload("⭐", message_id=101))
+    await dispatcher.dispatch(bot, make_payload("🛑", message_id=102))
+    await dispatcher.dispatch(
+        bot, make_payload("🛑", message_id=103, event_type=REACTION_REMOVE)
+    )
+    await dispatcher.dispatch(bot, make_payload("👍", message_id=104))
+
+    assert calls == [("⭐", REACTION_ADD, 101), ("🛑", REACTION_REMOVE, 103)]
+    # Messages are only fetched for events that have a handler
+    assert bot.get_channel.return_value.fetch_message.await_count == 2
+
+    dispatcher.unregister(owner)
+    await dispatcher.dispatch(bot, make_payload("⭐", message_id=105))
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_dispatch_fetches_message_once_and_isolates_errors():
+    dispatcher = ReactionDispatcher()
+    calls = []
+
+    async def failing_handler(payload, message):
+        raise ValueError
+
+    async def handler(payload, message):
+        calls.append(message.id)
+
+    dispatcher.register(("⭐",), failing_handler)
+    dispatcher.register(("⭐",), handler)
+    dispatcher.register(("⭐",), handler, own_messages_only=True)
+    bot = make_bot(author_id=2)
+
+    await dispatcher.dispatch(bot, make_payload("⭐", message_id=201))
+
+    assert calls == [201]
+    assert bot.get_channel.return_value.fetch_message.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_reactions_on_one_message_fetch_it_once():
+    dispatcher = ReactionDispatcher()
+    calls = []
+
+    async def handler(payload, message):
+        calls.append(message.id)
+
+    dispatcher.register(("⭐",), handler, events=(REACTION_ADD, REACTION_REMOVE))
+    bot = make_bot(author_id=2)
+
+    await asyncio.gather(
+        *(dispatcher.dispatch(bot, make_payload("⭐", message_id=301)) for _ in range(2))
+    )
+    await dispatcher.dispatch(
+        bot, make_payload("⭐", message_id=301, event_type=REACTION_REMOVE)
+    )
+
+    assert calls == [301, 301, 301]
+    assert bot.get_channel.return_value.fetch_message.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_current_reactions_refetches_cached_message():
+    dispatcher = ReactionDispatcher()
+    calls = []
+
+    async def handler(payload, message):
+        calls.append(message.id)
+
+    dispatcher.register(("⭐",), handler)
+    dispatcher.register(("🔀",), handler, current_reactions=True)
+    bot = make_bot(author_id=2)
+    fetch_message = bot.get_channel.return_value.fetch_message
+
+    await dispatcher.dispatch(bot, make_payload("⭐", message_id=401))
+    assert fetch_message.await_count == 1
+    # Concurrent events still share a single fetch
+    await asyncio.gather(
+        *(dispatcher.dispatch(bot, make_payload("🔀", message_id=401)) for _ in range(2))
+    )
+    assert fetch_message.await_count == 2
+    assert calls == [401, 401, 401]
+
+
+room_close_messages = CloseMessages(
+    {
+        r"zoom\.us|(?P<standby>Stand By)": "zoom closed",
+        r"meet\.jit\.si": "meet closed",
+        r"w2g\.tv": "w2g closed",
+    }
+)
+
+
+def make_message(content="", *, title=None, fields=()):
+    embed = disnake.Embed(title=title)
+    for name in fields:
+        embed.add_field(name=name, value="value")
+    return SimpleNamespace(content=content, embeds=[embed])
+
+
+@pytest.mark.parametrize(
+    ("close_messages", "message", "expected"),
+    (
+        (room_close_messages, make_message("https://meet.jit.si/abc"), "meet closed"),
+        (room_close_messages, make_message(title="Stand By"), "zoom closed"),
+        (
+            room_close_messages,
+            make_message(fields=("Host", "https://w2g.tv/rooms/abc")),
+            "w2g closed",
+        ),
+        # Earlier entries take precedence regardless of where they're found
+        (
+            room_close_messages,
+            make_message("https://zoom.us/j/1", title="https://w2g.tv"),
+            "zoom closed",
+        ),
+        (
+            room_close_messages,
+            make_message("https://meet.jit.si/zoom.us"),
+            "zoom closed",
+        ),
+        # ...including within a match for a later entry
+        (CloseMessages({"bc": "first", "abc": "second"}), make_message("abc"), "first"),
+        (room_close_messages, make_message("nothing to see here", title="Hello"), None),
+    ),
+)
+def test_close_messages_match(close_messages, message, expected):
+    assert close_messages.match(message) == expected
@@ -0,0 +1,77 @@
+import asyncio
+import os
+
+import pytest
+
+# Must be before bot import
+os.environ["TESTING"] = "true"
+
+from bot.utils import metrics  # noqa:E402
+from bot.utils.supervisor import TaskSupervisor  # noqa:E402
+
+
+@pytest.mark.asyncio
+async def test_spawn_limits_concurrency_per_category():
+    supervisor = TaskSupervisor()
+    supervisor.set_limit("limited", 2)
+    running = 0
+    max_running = 0
+
+    async def work():
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    tasks = [
+        supervisor.spawn(work(), name=f"work {i}", category="limited") for i in range(5)
+    ]
+    await asyncio.gather(*tasks)
+    assert max_running == 2
+    assert len(supervisor) == 0
+
+
+@pytest.mark.asyncio
+async def test_spawn_records_errors():
+    supervisor = TaskSupervisor()
+    errors = metrics.background_task_errors.labels("failing")
+
+    async def fail():
+        raise ValueError
+
+    task = supervisor.spawn(fail(), name="fail", category="failing")
+    await asyncio.wait([task])
+    await asyncio.sleep(0)  # let done callbacks run
+    assert errors.value == 1
+
+
+@pytest.mark.asyncio
+async def test_spawn_once_skips_running_task():
+    supervisor = TaskSupervisor()
+
+    async def loop_forever():
+        await asyncio.Event().wait()
+
+    task = supervisor.spawn_once(loop_forever(), name="scheduler")
+    assert supervisor.spawn_once(loop_forever(), name="scheduler") is task
+    assert len(supervisor) == 1
+
+    await supervisor.drain(timeout=0.1)
+    assert task.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_drain_waits_for_in_flight_tasks():
+    supervisor = TaskSupervisor()
+    finished = []
+
+    async def work(seconds):
+        await asyncio.sleep(seconds)
+        finished.append(seconds)
+
+    supervisor.spawn(work(0.01), name="fast")
+    slow = supervisor.spawn(work(10), name="slow")
+    await supervisor.drain(timeout=0.1)
+    assert finished == [0.01]
+    assert slow.cancelled()
@@ -0,0 +1,45 @@
+import struct
+
+import handshapes
+import pytest
+
+
+def read_png_dimensions(path):
+    with path.open("rb") as fp:
+        header = fp.read(24)
+    assert header[:8] == b"\x89PNG\r\n\x1a\n"
+    return struct.unpack(">II", header[16:24])
+
+
+@pytest.mark.parametrize("size", handshapes.SIZES)
+def test_get_handshape_size(size):
+    handshape = handshapes.get_handshape("open8", size=size)
+    assert handshape.name == "Open8"
+    assert handshape.path == handshapes.get_variant_path("Open8", size)
+
+
+def test_get_handshape_invalid_size():
+    with pytest.raises(ValueError):
+        handshapes.get_handshape("open8", size="huge")
+
+
+@pytest.mark.parametrize("name", handshapes.HANDSHAPE_NAMES)
+def test_variants(name):
+    full_path = handshapes.get_variant_path(name, "full")
+    thumbnail_path = handshapes.get_variant_path(name, "thumbnail")
+    # Full size images are served from the sources
+    assert full_path == handshapes.get_source_path(name)
+    assert read_png_dimensions(thumbnail_path) == (80, 80)
+    assert thumbnail_path.stat().st_size < full_path.stat().st_size
+
+
+@pytest.mark.parametrize("size", handshapes.SIZES)
+def test_variants_are_up_to_date(size):
+    pytest.importorskip("PIL")
+    from handshapes.assets_pipeline import render_variant
+
+    for name in handshapes.HANDSHAPE_NAMES:
+        expected = render_variant(handshapes.get_source_path(name), size)
+        assert (
+            handshapes.get_variant_path(name, size).read_bytes() == expected
+        ), f"{name} ({size}) is out of date; run script/build_handshape_assets.py"
@@ -0,0 +1,58 @@
+import datetime as dt
+
+import holiday_emojis
+import pytest
+
+
+@pytest.mark.parametrize(
+    ("date", "expected"),
+    (
+        (dt.date(2021, 7, 1), "Canada Day"),
+        (dt.date(2021, 10, 31), "Halloween"),
+        (dt.date(2020, 12, 21), "Winter Solstice"),
+        (dt.date(2021, 7, 2), None),
+    ),
+)
+def test_get_holiday_name(date, expected):
+    assert holiday_emojis.get_holiday_name(date) == expected
+
+
+def test_get_matches_holidays():
+    date = dt.date(2020, 1, 1)
+    while date < dt.date(2026, 1, 1):
+        # Names on shared dates are ordered by the years an instance has populated,
+        #   so compare against an instance that only has this date's year
+        if date.month == 1 and date.day == 1:
+            fresh = holiday_emojis.make_holidays(years=date.year)
+        names = fresh.get_list(date)
+        expected_name = names[0] if names else None
+        assert holiday_emojis.get_holiday_name(date) == expected_name, date
+        assert holiday_emojis.get(date) == (
+            holiday_emojis._HOLIDAY_EMOJI_MAP.get(expected_name) if names else None
+        ), date
+        date += dt.timedelta(days=1)
+
+
+def test_refresh_builds_years_around_today(monkeypatch):
+    monkeypatch.setattr(holiday_emojis, "_calendar", {})
+    built = []
+    build_year = holiday_emojis._build_year
+
+    def spy_build_year(year):
+        built.append(year)
+        return build_year(year)
+
+    monkeypatch.setattr(holiday_emojis, "_build_year", spy_build_year)
+
+    holiday_emojis.refresh(dt.date(2021, 6, 1))
+    assert built == [2020, 2021, 2022]
+    # Lookups in the window don't build tables inline
+    built.clear()
+    assert holiday_emojis.get_holiday_name(dt.date(2020, 12, 21)) == "Winter Solstice"
+    assert holiday_emojis.get_holiday_name(dt.date(2021, 10, 31)) == "Halloween"
+    assert holiday_emojis.get_holiday_name(dt.date(2022, 1, 2)) is None
+    assert built == []
+    # Moving into a new year only builds the year after it
+    holiday_emojis.refresh(dt.date(2022, 1, 1))
+    assert built == [2023]
+    assert sorted(holiday_emojis._calendar) == [2021, 2022, 2023]
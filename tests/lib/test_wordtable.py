@@ -0,0 +1,75 @@
+import pickle
+import random
+
+import pytest
+from wordtable import WordTable, get_fingerprint, load_snapshot, write_snapshot
+
+
+def test_word_table():
+    words = ["apple", "", "bänana", "cherry pie"]
+    table = WordTable.from_words(words)
+    assert len(table) == 4
+    assert list(table) == words
+    assert table[-1] == "cherry pie"
+    assert random.choice(table) in words
+    assert list(pickle.loads(pickle.dumps(table))) == words
+    with pytest.raises(IndexError):
+        table[4]
+    with pytest.raises(IndexError):
+        table[-5]
+
+
+def test_load_snapshot_rebuilds_when_sources_change(tmp_path):
+    source = tmp_path / "words.txt"
+    snapshot_path = tmp_path / "words.snapshot"
+    builds = []
+
+    def build():
+        builds.append(1)
+        return WordTable.from_words(source.read_text().split())
+
+    def load():
+        return list(load_snapshot(snapshot_path, sources=[source], build=build))
+
+    source.write_text("one two")
+    assert load() == ["one", "two"]
+    assert len(builds) == 1
+    assert snapshot_path.exists()
+
+    assert load() == ["one", "two"]
+    assert len(builds) == 1
+
+    source.write_text("three")
+    assert load() == ["three"]
+    assert len(builds) == 2
+    assert load() == ["three"]
+    assert len(builds) == 2
+    assert set(tmp_path.iterdir()) == {source, snapshot_path}
+
+
+def test_load_snapshot_trusts_installed_snapshots(tmp_path):
+    package_dir = tmp_path / "site-packages" / "words"
+    package_dir.mkdir(parents=True)
+    source = package_dir / "words.txt"
+    snapshot_path = package_dir / "words.snapshot"
+
+    def build():
+        return WordTable.from_words(source.read_text().split())
+
+    source.write_text("one two")
+    # Missing snapshots are built in memory, without writing into the package
+    assert list(load_snapshot(snapshot_path, sources=[source], build=build)) == [
+        "one",
+        "two",
+    ]
+    assert not snapshot_path.exists()
+
+    write_snapshot(
+        snapshot_path, build(), fingerprint=get_fingerprint([source], version=1)
+    )
+    source.write_text("three")
+    # Sources aren't checked for installed snapshots
+    assert list(load_snapshot(snapshot_path, sources=[source], build=pytest.fail)) == [
+        "one",
+        "two",
+    ]